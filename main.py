@@ -6,23 +6,61 @@ import json
 import logging
 import shlex
 import sys
-from datetime import datetime
-from dataclasses import asdict
+import time
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, Set
+from typing import Any, Callable, Dict, Iterable, Set
 SESSION_LOGGER_NAME = "webot.session"
 
 
 from weBot.bot import BotController
 from weBot.brains.engage import process_feed
-from weBot.core.state import PageState
-from weBot.data.storage import save_json
+from weBot.brains.scoring import get_scorer
+from weBot.core.state import PageState, TransitionReason
+from weBot.data.cache import ProfileCache
+from weBot.data.seen import DEFAULT_SEEN_PATH, SeenPostIndex
+from weBot.data.log_index import LogIndex
+from weBot.data.session_log import DEFAULT_LOG_DIR, SessionLog
+from weBot.data.snapshots import DEFAULT_SNAPSHOT_ROOT, SnapshotRecorder, SnapshotStore, set_snapshot_recorder
+from weBot.data.store import DEFAULT_STORE_PATH, QUERIES, LocalStore, format_table
+from weBot.data.storage import is_record_path, iter_records, open_record_writer, save_json
+from weBot.workflows.latency import DEFAULT_RTTS_MS, default_workflows, run_latency_benchmark, sensitivity
+from weBot.workflows.offline import analyze_corpus, iter_snapshot_items, summary_fields
 from weBot.workflows.profile import fetch_profile
-from weBot.config.behaviour import load_behaviour_settings, set_behaviour_settings
+from weBot.workflows.score import score_corpus
+from weBot.config.behaviour import (
+    BehaviourWatcher,
+    get_behaviour_settings,
+    load_behaviour_settings,
+    resolve_behaviour_path,
+    set_behaviour_settings,
+)
+from weBot.core.cdp import describe_evaluations
 from weBot.core.driver import DriverConfig, validate_profile_name
-
-
-COMMAND_CHOICES = ("login", "engage", "profile", "session")
+from weBot.core.offline import offline_backend_available
+from weBot.core.pool import SessionPool
+from weBot.core.selectors import get_selector_stats, selector_report
+
+
+COMMAND_CHOICES = ("login", "engage", "profile", "session", "store", "offline", "score", "logs", "selectors", "latency")
+# Commands that only touch local files and never launch Chrome.
+LOCAL_COMMANDS = {"store", "offline", "score", "logs", "selectors"}
+# Session commands that drive the browser; they run under the driver lock and
+# wait for an active loop script to be stopped.
+BROWSER_SESSION_COMMANDS = {
+    "login",
+    "engage",
+    "navigate",
+    "home",
+    "go-home",
+    "like",
+    "repost",
+    "quote",
+    "comment",
+    "makepost",
+}
 
 
 def _load_config_file(path: Path) -> Dict[str, Any]:
@@ -75,6 +113,12 @@ PATH_KEYS = {
     "profiles_root",
     "output",
     "behavior_config",
+    "store_db",
+    "seen_index",
+    "snapshot_dir",
+    "input",
+    "log_dir",
+    "script",
 }
 
 
@@ -118,12 +162,43 @@ def _apply_config(
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Automation toolkit for Twitter/X interactions")
     parser.add_argument("command", nargs="?", choices=COMMAND_CHOICES, help="Task to run")
+    parser.add_argument("action", nargs="?", choices=("stats",), help="Sub-command for logs (default: stats)")
     parser.add_argument("--config", dest="config_file", help="Path to YAML or JSON config with CLI options")
     parser.add_argument("--headless", action="store_true", help="Run the browser in headless mode")
     parser.add_argument("--posts", type=int, default=10, help="Number of timeline posts to process (for engage)")
     parser.add_argument("--handle", help="Target handle for profile commands")
-    parser.add_argument("--output", help="Optional file output (JSON or CSV depending on command)")
+    parser.add_argument(
+        "--read-only",
+        dest="read_only",
+        action="store_true",
+        help="Harvest, score and persist timeline posts without interacting (for engage)",
+    )
+    parser.add_argument(
+        "--output",
+        help=(
+            "Optional file output. .json writes a single document (profile only); .jsonl or .csv "
+            "(optionally .gz/.zst) streams records, e.g. harvested posts for engage"
+        ),
+    )
     parser.add_argument("--descriptive", action="store_true", help="Include follower/following lists when fetching profile data")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached profile data and scrape the profile again (the cache is still updated)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        dest="cache_ttl",
+        type=float,
+        default=3600.0,
+        help="Seconds cached profile header fields stay fresh (0 disables the profile cache)",
+    )
+    parser.add_argument(
+        "--lists-cache-ttl",
+        dest="lists_cache_ttl",
+        type=float,
+        help="Seconds cached follower/following lists stay fresh (defaults to --cache-ttl)",
+    )
     parser.add_argument(
         "--chrome-profile",
         dest="chrome_profile",
@@ -145,6 +220,12 @@ def _build_parser() -> argparse.ArgumentParser:
         dest="user_agent",
         help="Override the browser user agent string to evade bot detection",
     )
+    parser.add_argument(
+        "--no-cdp-channel",
+        dest="no_cdp_channel",
+        action="store_true",
+        help="Send page evaluations through WebDriver instead of a direct DevTools connection",
+    )
     parser.add_argument(
         "--manual-timeout",
         dest="manual_timeout",
@@ -157,6 +238,101 @@ def _build_parser() -> argparse.ArgumentParser:
         dest="profile_name",
         help="Friendly name to assign when persisting a Chrome profile (login only)",
     )
+    parser.add_argument(
+        "--store-db",
+        dest="store_db",
+        help=f"SQLite file recording harvested posts, profile snapshots, state transitions and actions (default: {DEFAULT_STORE_PATH})",
+    )
+    parser.add_argument(
+        "--no-store",
+        dest="no_store",
+        action="store_true",
+        help="Do not record observations in the local SQLite store",
+    )
+    parser.add_argument(
+        "--seen-index",
+        dest="seen_index",
+        help=f"Index of already processed post ids shared across runs (default: {DEFAULT_SEEN_PATH})",
+    )
+    parser.add_argument(
+        "--reprocess-seen",
+        dest="reprocess_seen",
+        action="store_true",
+        help="Ignore the seen-post index for this run (posts are neither skipped nor recorded)",
+    )
+    parser.add_argument(
+        "--record-snapshots",
+        dest="record_snapshots",
+        action="store_true",
+        help="Capture the page HTML and recognised state each time the state is detected",
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        dest="snapshot_dir",
+        help=f"Directory of the snapshot store (default: {DEFAULT_SNAPSHOT_ROOT})",
+    )
+    parser.add_argument(
+        "--snapshot-cap-mb",
+        dest="snapshot_cap_mb",
+        type=float,
+        default=512.0,
+        help="Size cap of the snapshot store; least recently captured pages are evicted beyond it",
+    )
+    parser.add_argument(
+        "--query",
+        choices=sorted(QUERIES),
+        default="posts",
+        help="Canned query to run for the store command",
+    )
+    parser.add_argument("--limit", type=int, default=20, help="Maximum rows printed by the store and offline commands")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for the offline and score commands (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--rtt",
+        default=",".join(str(rtt) for rtt in DEFAULT_RTTS_MS),
+        help="Comma-separated round-trip times in ms simulated by the latency command",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Runs per workflow and RTT for the latency command (the median is reported)",
+    )
+    parser.add_argument(
+        "--throttle-network",
+        dest="throttle_network",
+        action="store_true",
+        help="Also throttle page traffic to the RTT in the latency command (the slope then includes network latency)",
+    )
+    parser.add_argument(
+        "--input",
+        help="JSONL/CSV post export to read for the score command (default: the local store)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        dest="chunk_size",
+        type=int,
+        default=2000,
+        help="Posts per work unit for the score command",
+    )
+    parser.add_argument(
+        "--script",
+        help="Run session commands from this file ('-' for stdin) instead of prompting; piped stdin is read automatically",
+    )
+    parser.add_argument(
+        "--continue-on-error",
+        dest="continue_on_error",
+        action="store_true",
+        help="Keep running a session script after a command fails (default: stop at the first failure)",
+    )
+    parser.add_argument(
+        "--log-dir",
+        dest="log_dir",
+        help="Directory of session logs for the logs command (default: logs)",
+    )
     parser.add_argument(
         "--behavior-config",
         dest="behavior_config",
@@ -178,19 +354,56 @@ def _ensure_authenticated(bot: BotController) -> None:
         )
 
 
-def _execute_workflow(bot: BotController, command: str, options: argparse.Namespace) -> None:
+def _prepare_browser(bot: BotController, start_browser: Callable[[], None] | None) -> None:
+    if bot.loop_manager.is_running():
+        raise RuntimeError("This lookup needs the browser, which the active loop script is using. Stop it first.")
+    if start_browser is not None:
+        start_browser()
     _ensure_authenticated(bot)
 
+
+def _execute_workflow(
+    bot: BotController,
+    command: str,
+    options: argparse.Namespace,
+    *,
+    profile_cache: ProfileCache | None = None,
+    start_browser: Callable[[], None] | None = None,
+) -> None:
     if command == "engage":
+        _ensure_authenticated(bot)
         posts = getattr(options, "posts", 10)
-        process_feed(bot, posts=posts)
-        print(f"Engaged with {posts} timeline posts.")
+        output = getattr(options, "output", None)
+        read_only = getattr(options, "read_only", False)
+        verb = "Captured" if read_only else "Engaged with"
+        if output:
+            with open_record_writer(Path(output)) as sink:
+                pipeline = process_feed(bot, posts=posts, sink=sink, read_only=read_only)
+            print(f"{verb} {posts} timeline posts; {sink.records_written} harvested post(s) saved to {output}")
+        else:
+            pipeline = process_feed(bot, posts=posts, read_only=read_only)
+            print(f"{verb} {posts} timeline posts.")
+        print(pipeline.describe_stats())
+        print(get_scorer().describe_stats())
         return
 
     if command == "profile":
-        profile = fetch_profile(bot, options.handle, descriptive=options.descriptive)
+        profile = fetch_profile(
+            bot,
+            options.handle,
+            descriptive=options.descriptive,
+            cache=profile_cache,
+            refresh=getattr(options, "refresh", False),
+            before_browser=lambda: _prepare_browser(bot, start_browser),
+        )
+        if profile_cache is not None:
+            print(profile_cache.describe_stats())
         profile_data = asdict(profile)
-        if options.output:
+        if options.output and is_record_path(Path(options.output)):
+            with open_record_writer(Path(options.output)) as writer:
+                writer.write(profile_data)
+            print(f"Profile written to {writer.completed[-1]}")
+        elif options.output:
             output_path = Path(options.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             output_path.write_text(json.dumps(profile_data, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -203,6 +416,272 @@ def _execute_workflow(bot: BotController, command: str, options: argparse.Namesp
     raise ValueError(f"Unsupported workflow command: {command}")
 
 
+def _run_store_query(options: argparse.Namespace) -> None:
+    path = Path(options.store_db).expanduser() if options.store_db else DEFAULT_STORE_PATH
+    if not path.is_file():
+        raise FileNotFoundError(f"Local store not found: {path}")
+    with LocalStore(path) as store:
+        columns, rows = store.query(options.query, limit=options.limit, handle=options.handle)
+    if not rows:
+        print(f"No rows for query '{options.query}'.")
+        return
+    print(format_table(columns, rows))
+
+
+def _run_offline_analysis(options: argparse.Namespace) -> None:
+    if not offline_backend_available():
+        raise RuntimeError("The offline command requires the lxml and cssselect packages")
+    root = Path(options.snapshot_dir).expanduser() if options.snapshot_dir else DEFAULT_SNAPSHOT_ROOT
+    if not root.is_dir():
+        raise FileNotFoundError(f"Snapshot directory not found: {root}")
+    items = list(iter_snapshot_items(root))
+    if not items:
+        print(f"No snapshots found under {root}.")
+        return
+
+    writer = open_record_writer(Path(options.output)) if options.output else None
+    table_rows = []
+    states: Dict[str, int] = {}
+    mismatches = 0
+    started = time.perf_counter()
+    try:
+        for row in analyze_corpus(items, workers=options.workers):
+            state = str(row["state"])
+            states[state] = states.get(state, 0) + 1
+            recorded = row.get("recorded_state")
+            if recorded and recorded != state:
+                mismatches += 1
+            if writer is not None:
+                writer.write(row)
+            if len(table_rows) < options.limit:
+                table_rows.append((Path(str(row["file"])).name[:24], recorded or "", state, row.get("posts", 0), summary_fields(row)))
+    finally:
+        if writer is not None:
+            writer.close()
+    elapsed = time.perf_counter() - started
+
+    print(format_table(("file", "recorded", "state", "posts", "fields"), table_rows))
+    print()
+    print(", ".join(f"{name}={count}" for name, count in sorted(states.items())))
+    if mismatches:
+        print(f"{mismatches} page(s) recognised differently than when they were recorded")
+    rate = len(items) / elapsed if elapsed > 0 else float("inf")
+    print(f"Analysed {len(items)} page(s) in {elapsed:.2f}s ({rate:.1f} pages/s)")
+    if writer is not None and writer.completed:
+        print(f"Rows written to {writer.completed[-1]}")
+
+
+def _run_score(options: argparse.Namespace) -> None:
+    if options.input:
+        input_path = Path(options.input).expanduser()
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input not found: {input_path}")
+        records = iter_records(input_path)
+        source = str(input_path)
+        store = None
+    else:
+        store_path = Path(options.store_db).expanduser() if options.store_db else DEFAULT_STORE_PATH
+        if not store_path.is_file():
+            raise FileNotFoundError(f"Local store not found: {store_path}")
+        store = LocalStore(store_path)
+        records = store.iter_posts(batch_size=options.chunk_size)
+        source = str(store_path)
+
+    writer = open_record_writer(Path(options.output)) if options.output else None
+    total = 0
+    score_sum = 0.0
+    started = time.perf_counter()
+    try:
+        for rows in score_corpus(records, workers=options.workers, chunk_size=options.chunk_size):
+            total += len(rows)
+            score_sum += sum(row["score"] for row in rows)
+            if writer is not None:
+                writer.write_many(rows)
+    finally:
+        if writer is not None:
+            writer.close()
+        if store is not None:
+            store.close()
+    elapsed = time.perf_counter() - started
+
+    if not total:
+        print(f"No posts found in {source}.")
+        return
+    rate = total / elapsed if elapsed > 0 else float("inf")
+    print(f"Scored {total} post(s) from {source} in {elapsed:.2f}s ({rate:.0f} rows/s); mean score {score_sum / total:.2f}")
+    if writer is not None and writer.completed:
+        print(f"Scores written to {writer.completed[-1]}")
+
+
+def _print_log_stats(log_dir: Path | None) -> None:
+    started = time.perf_counter()
+    stats = LogIndex(log_dir).update()
+    elapsed = time.perf_counter() - started
+    if not stats.files:
+        print(f"No session logs found under {log_dir or DEFAULT_LOG_DIR}.")
+        return
+    rows = list(stats.rows())
+    if rows:
+        print(format_table(("day", "action", "total", "ok", "success_pct"), rows))
+        print()
+    print(
+        f"Cycles: {stats.cycles}; scroll failures: {stats.scroll_failures} "
+        f"({stats.scroll_failures_per_cycle:.2f} per cycle)"
+    )
+    if stats.commands:
+        top = sorted(stats.commands.items(), key=lambda item: (-item[1], item[0]))
+        print("Session commands: " + ", ".join(f"{name}={count}" for name, count in top))
+    print(f"Indexed {stats.files} log file(s); parsed {stats.bytes_parsed} new byte(s) in {elapsed:.2f}s")
+
+
+def _print_selector_report() -> None:
+    rows = selector_report()
+    if not rows:
+        print("No selector statistics recorded yet.")
+        return
+    print(format_table(("group", "selector", "hits", "lookups", "note"), rows))
+    dead = sum(1 for row in rows if row[4] == "never hit")
+    if dead:
+        print(f"{dead} selector(s) never matched; the site may have changed them.")
+
+
+def _run_log_stats(options: argparse.Namespace) -> None:
+    log_dir = Path(options.log_dir).expanduser() if options.log_dir else DEFAULT_LOG_DIR
+    if not log_dir.is_dir():
+        raise FileNotFoundError(f"Log directory not found: {log_dir}")
+    _print_log_stats(log_dir)
+
+
+def _parse_rtts(value: str) -> list[float]:
+    try:
+        rtts = [float(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise ValueError(f"--rtt expects comma-separated milliseconds, got {value!r}") from None
+    if not rtts or any(rtt < 0 for rtt in rtts):
+        raise ValueError("--rtt needs at least one non-negative value")
+    return sorted(set(rtts))
+
+
+def _run_latency_benchmark(options: argparse.Namespace, driver_config: DriverConfig) -> int:
+    rtts = _parse_rtts(options.rtt)
+    if options.repeats < 1:
+        raise ValueError("--repeats must be at least 1")
+    if driver_config.user_data_dir is None:
+        raise ValueError("The latency command needs a logged-in --chrome-profile")
+    workflows = default_workflows(options.handle)
+    if not options.handle:
+        print("No --handle given; skipping read_profile_header and collect_handles_from_modal.")
+
+    samples = []
+    writer = open_record_writer(Path(options.output)) if options.output else None
+    try:
+        with SessionPool(driver_config) as pool:
+            benchmark = run_latency_benchmark(
+                pool, workflows, rtts, repeats=options.repeats, throttle_network=options.throttle_network
+            )
+            for sample in benchmark:
+                samples.append(sample)
+                outcome = f"failed: {sample.error}" if sample.error else (
+                    f"{1000 * sample.seconds:.0f} ms, {sample.round_trips} round trip(s)"
+                )
+                print(f"{sample.workflow} @ {sample.rtt_ms:g} ms RTT: {outcome}")
+                if writer is not None:
+                    writer.write(asdict(sample))
+    except RuntimeError as exc:
+        print(f"[error] {exc}")
+        return 1
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if not any(sample.repeats for sample in samples):
+        print("Every latency sample failed; no timings to report.")
+        return 1
+    rows = [
+        (
+            name,
+            *(f"{1000 * times[rtt]:.0f}" if rtt in times else "" for rtt in rtts),
+            f"{slope:.1f}",
+            round_trips,
+        )
+        for name, times, slope, round_trips in sensitivity(samples)
+    ]
+    print()
+    print(format_table(("workflow", *(f"{rtt:g}ms" for rtt in rtts), "ms/ms RTT", "round trips"), rows))
+    if options.throttle_network:
+        print("Page traffic was throttled too, so the slope includes network latency, not only round trips.")
+    if writer is not None and writer.completed:
+        print(f"Samples written to {writer.completed[-1]}")
+    return 0
+
+
+@lru_cache(maxsize=8)
+def _session_parsers(default_manual_timeout: float | None) -> Dict[str, argparse.ArgumentParser]:
+    """Build the per-command session parsers once; they are reused for every line."""
+
+    parsers: Dict[str, argparse.ArgumentParser] = {}
+
+    def build_parser(prog: str) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser(prog=prog)
+        parsers[prog] = parser
+        return parser
+
+    parser = build_parser("login")
+    parser.add_argument("--manual-timeout", type=float, default=default_manual_timeout)
+    parser.add_argument("--no-persist-profile", action="store_true")
+    parser.add_argument("--profile-name")
+
+    parser = build_parser("engage")
+    parser.add_argument("--posts", type=int, default=10)
+    parser.add_argument("--output")
+    parser.add_argument("--read-only", dest="read_only", action="store_true")
+
+    parser = build_parser("profile")
+    parser.add_argument("--handle", required=True)
+    parser.add_argument("--output")
+    parser.add_argument("--descriptive", action="store_true")
+    parser.add_argument("--refresh", action="store_true")
+
+    parser = build_parser("navigate")
+    parser.add_argument("url")
+
+    build_parser("home")
+    build_parser("like")
+
+    parser = build_parser("repost")
+    parser.add_argument("--quote")
+
+    for prog in ("quote", "comment", "makepost"):
+        parser = build_parser(prog)
+        parser.add_argument("--text", required=True)
+
+    build_parser("stop")
+
+    parser = build_parser("store")
+    parser.add_argument("query", nargs="?", choices=sorted(QUERIES), default="posts")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--handle")
+
+    parser = build_parser("logs")
+    parser.add_argument("action", nargs="?", choices=["stats"], default="stats")
+
+    parser = build_parser("journal")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--output")
+
+    parser = build_parser("behaviour")
+    parser.add_argument("action", nargs="?", choices=["show", "reload"], default="show")
+
+    parser = build_parser("loop")
+    parser.add_argument("action", choices=["start", "stop", "status", "list"])
+    parser.add_argument("script", nargs="?", help="Script name (required for start)")
+    parser.add_argument("--posts-per-cycle", dest="posts_per_cycle", type=int, default=10)
+    parser.add_argument("--iterations", dest="iterations", type=int)
+    parser.add_argument("--min-delay", dest="min_delay", type=float)
+    parser.add_argument("--max-delay", dest="max_delay", type=float)
+    return parsers
+
+
 def _parse_session_command(
     line: str,
     *,
@@ -214,88 +693,26 @@ def _parse_session_command(
 
     command = tokens[0].lower()
     args = tokens[1:]
+    if command == "behavior":
+        command = "behaviour"
 
-    def build_parser(prog: str) -> argparse.ArgumentParser:
-        return argparse.ArgumentParser(prog=prog)
-
-    try:
-        if command == "login":
-            parser = build_parser("login")
-            parser.add_argument("--manual-timeout", type=float, default=default_manual_timeout)
-            parser.add_argument("--no-persist-profile", action="store_true")
-            parser.add_argument("--profile-name")
-            return command, parser.parse_args(args)
-
-        if command == "engage":
-            parser = build_parser("engage")
-            parser.add_argument("--posts", type=int, default=10)
-            return command, parser.parse_args(args)
-
-        if command == "profile":
-            parser = build_parser("profile")
-            parser.add_argument("--handle", required=True)
-            parser.add_argument("--output")
-            parser.add_argument("--descriptive", action="store_true")
-            return command, parser.parse_args(args)
-
-        if command == "navigate":
-            parser = build_parser("navigate")
-            parser.add_argument("url")
-            return command, parser.parse_args(args)
-
-        if command == "home":
-            parser = build_parser("home")
-            return command, parser.parse_args(args)
-
-        if command == "like":
-            parser = build_parser("like")
-            return command, parser.parse_args(args)
-
-        if command == "repost":
-            parser = build_parser("repost")
-            parser.add_argument("--quote")
-            return command, parser.parse_args(args)
-
-        if command == "quote":
-            parser = build_parser("quote")
-            parser.add_argument("--text", required=True)
-            return command, parser.parse_args(args)
-
-        if command == "comment":
-            parser = build_parser("comment")
-            parser.add_argument("--text", required=True)
-            return command, parser.parse_args(args)
-
-        if command == "makepost":
-            parser = build_parser("makepost")
-            parser.add_argument("--text", required=True)
-            return command, parser.parse_args(args)
-
-        if command == "stop":
-            parser = build_parser("stop")
-            return command, parser.parse_args(args)
-
-        if command == "loop":
-            normalized = list(args)
-            if not normalized:
-                normalized = ["status"]
-            elif normalized[0] not in {"start", "stop", "status", "list"}:
-                normalized.insert(0, "start")
-
-            parser = build_parser("loop")
-            parser.add_argument("action", choices=["start", "stop", "status", "list"])
-            parser.add_argument("script", nargs="?", help="Script name (required for start)")
-            parser.add_argument("--posts-per-cycle", dest="posts_per_cycle", type=int, default=10)
-            parser.add_argument("--iterations", dest="iterations", type=int)
-            parser.add_argument("--min-delay", dest="min_delay", type=float)
-            parser.add_argument("--max-delay", dest="max_delay", type=float)
-            return command, parser.parse_args(normalized)
-
-        if command in {"go-home", "status", "help", "exit", "quit"}:
-            return command, argparse.Namespace()
+    if command in {"go-home", "status", "help", "exit", "quit", "selectors"}:
+        return command, argparse.Namespace()
 
+    parser = _session_parsers(default_manual_timeout).get(command)
+    if parser is None:
         print("Unknown command. Type 'help' for available commands.")
         return None, None
+
+    if command == "loop":
+        args = list(args)
+        if not args:
+            args = ["status"]
+        elif args[0] not in {"start", "stop", "status", "list"}:
+            args.insert(0, "start")
+
+    try:
+        return command, parser.parse_args(args)
     except SystemExit:
         # argparse already printed the error/help message
         return None, None
@@ -305,8 +722,8 @@ def _print_session_help() -> None:
     print(
         "Available commands:\n"
         "  login [--manual-timeout SECONDS] [--no-persist-profile]\n"
-        "  engage [--posts N]\n"
-    "  profile --handle NAME [--output PATH] [--descriptive]\n"
+        "  engage [--posts N] [--output PATH.jsonl|.csv] [--read-only]\n"
+    "  profile --handle NAME [--output PATH] [--descriptive] [--refresh]\n"
         "  navigate URL\n"
         "  home\n"
         "  like\n"
@@ -316,6 +733,11 @@ def _print_session_help() -> None:
         "  makepost --text TEXT\n"
     "  loop [start] NAME [--posts-per-cycle N] [--iterations N] [--min-delay S] [--max-delay S]\n"
     "  loop stop | loop status | loop list\n"
+        "  store [posts|profiles|transitions|actions] [--limit N] [--handle NAME]\n"
+        "  logs [stats]\n"
+        "  behaviour [show|reload]\n"
+        "  selectors\n"
+        "  journal [--limit N] [--output PATH.jsonl|.csv]\n"
     "  stop\n"
         "  go-home\n"
         "  status\n"
@@ -324,18 +746,81 @@ def _print_session_help() -> None:
     )
 
 
-def _run_session(bot: BotController, *, default_manual_timeout: float | None) -> None:
-    log_path = _init_session_logger()
+@dataclass
+class SessionCommandResult:
+    """Outcome of one session command, used for script summaries."""
+
+    line_number: int
+    line: str
+    command: str | None
+    ok: bool
+    seconds: float
+    error: str | None = None
+
+
+def _run_session(
+    bot: BotController,
+    *,
+    default_manual_timeout: float | None,
+    profile_cache: ProfileCache | None = None,
+    script: str | None = None,
+    continue_on_error: bool = False,
+    behaviour_path: Path | None = None,
+) -> bool:
+    """Run the session REPL, or the commands of ``script`` (``-`` for stdin).
+
+    Returns ``False`` when a scripted command failed.
+    """
+
+    session_log = _init_session_logger()
     logger = logging.getLogger(SESSION_LOGGER_NAME)
-    print("Interactive session started. Type 'help' to list available commands.")
-    print(f"Session log: {log_path}")
+    watcher = _start_behaviour_watcher(resolve_behaviour_path(behaviour_path), logger)
     try:
-        _session_loop(bot, logger, default_manual_timeout)
+        if script is None:
+            print("Interactive session started. Type 'help' to list available commands.")
+            print(f"Session log: {session_log.text_path} (structured: {session_log.json_path})")
+            _session_loop(
+                bot, logger, default_manual_timeout, profile_cache=profile_cache, behaviour_watcher=watcher
+            )
+            return True
+        print(f"Session log: {session_log.text_path} (structured: {session_log.json_path})")
+        return _run_session_script(
+            bot,
+            logger,
+            default_manual_timeout,
+            script=script,
+            continue_on_error=continue_on_error,
+            profile_cache=profile_cache,
+            behaviour_watcher=watcher,
+        )
     finally:
-        _teardown_session_logger()
+        watcher.stop()
+        _teardown_session_logger(session_log)
 
 
-def _session_loop(bot: BotController, logger: logging.Logger, default_manual_timeout: float | None) -> None:
+def _start_behaviour_watcher(path: Path, logger: logging.Logger) -> BehaviourWatcher:
+    def reloaded(settings) -> None:
+        print(f"\n[behaviour] Reloaded settings from {path}")
+        logger.info("Behaviour settings reloaded; path=%s", path)
+
+    def failed(exc: Exception) -> None:
+        print(f"\n[behaviour] Ignoring invalid {path.name} (current settings kept): {exc}")
+        logger.warning("Behaviour settings reload failed; path=%s error=%s", path, exc)
+
+    watcher = BehaviourWatcher(path, on_reload=reloaded, on_error=failed)
+    watcher.start()
+    return watcher
+
+
+def _session_loop(
+    bot: BotController,
+    logger: logging.Logger,
+    default_manual_timeout: float | None,
+    *,
+    profile_cache: ProfileCache | None = None,
+    behaviour_watcher: BehaviourWatcher | None = None,
+) -> None:
+    line_number = 0
     while True:
         try:
             line = input("webot> ").strip()
@@ -349,227 +834,474 @@ def _session_loop(bot: BotController, logger: logging.Logger, default_manual_tim
         if not line:
             continue
 
-        command, options = _parse_session_command(line, default_manual_timeout=default_manual_timeout)
-        if command is None:
-            continue
-
-        logger.info("Command received: %s %s", command, vars(options) if options else {})
-
-        if bot.loop_manager.is_running() and command not in {"loop", "help", "status", "stop", "exit", "quit"}:
-            print("A loop script is running. Stop it with 'loop stop' before executing other commands.")
-            logger.warning("Command %s blocked because a loop script is active.", command)
-            continue
-
-        if command in {"exit", "quit"}:
-            if bot.loop_manager.is_running():
-                print("Stopping active loop before exiting...")
-                bot.loop_manager.stop(wait=5.0)
+        line_number += 1
+        result = _run_session_line(
+            bot,
+            line,
+            line_number,
+            logger,
+            default_manual_timeout,
+            profile_cache=profile_cache,
+            behaviour_watcher=behaviour_watcher,
+            background=True,
+        )
+        if result.command in {"exit", "quit"}:
             break
 
-        if command == "help":
-            _print_session_help()
-            continue
-
-        try:
-            if command == "login":
-                manual_timeout = options.manual_timeout
-                if manual_timeout is not None and manual_timeout < 0:
-                    manual_timeout = None
-                state = bot.manual_login(
-                    manual_timeout=manual_timeout,
-                    persist_profile=not getattr(options, "no_persist_profile", False),
-                    profile_name=getattr(options, "profile_name", None),
-                )
-                print(f"Manual login completed with state: {state.name}")
-                logger.info("Manual login completed: state=%s", state.name)
-                continue
-
-            if command == "engage":
-                _execute_workflow(bot, "engage", options)
-                logger.info("Engage workflow finished (posts=%s).", getattr(options, "posts", 10))
-                continue
-
-            if command == "loop":
-                action = options.action
-                if action == "list":
-                    scripts = bot.loop_manager.available_scripts()
-                    if not scripts:
-                        print("No loop scripts available.")
-                    else:
-                        print("Available loop scripts:")
-                        for name, definition in sorted(scripts.items()):
-                            print(f"  {name}: {definition.description}")
-                    logger.info("Loop list displayed (count=%s).", len(scripts))
-                    continue
-
-                if action == "status":
-                    status = bot.loop_manager.status()
-                    if status["running"]:
-                        print(f"Loop running: {status['script']}")
-                    else:
-                        print("No loop script is running.")
-                    logger.info("Loop status queried; running=%s script=%s", status["running"], status["script"])
-                    continue
-
-                if action == "stop":
-                    if bot.loop_manager.stop():
-                        print("Loop stop requested.")
-                        logger.info("Loop stop requested.")
-                    else:
-                        print("No active loop to stop.")
-                        logger.info("Loop stop requested but no active script.")
-                    continue
-
-                script_name = options.script
-                if not script_name:
-                    print("Specify a script name, e.g. 'loop random_engage'. Use 'loop list' to see options.")
-                    continue
-
-                script_key = script_name.lower().replace("-", "_")
-                _ensure_authenticated(bot)
-                try:
-                    bot.loop_manager.start(
-                        script_key,
-                        logger=logger,
-                        posts_per_cycle=options.posts_per_cycle,
-                        iteration_limit=options.iterations,
-                        min_delay=options.min_delay,
-                        max_delay=options.max_delay,
-                    )
-                except Exception as exc:  # pragma: no cover - interactive loop
-                    print(f"Failed to start loop: {exc}")
-                    logger.exception("Loop start failed for script=%s", script_key)
-                else:
-                    print(f"Loop script '{script_key}' started.")
-                    logger.info(
-                        "Loop script started; name=%s posts_per_cycle=%s iterations=%s min_delay=%s max_delay=%s",
-                        script_key,
-                        options.posts_per_cycle,
-                        options.iterations,
-                        options.min_delay,
-                        options.max_delay,
-                    )
-                continue
-
-            if command == "stop":
-                if bot.loop_manager.stop():
-                    print("Loop stop requested.")
-                    logger.info("Loop stop requested via 'stop' command.")
-                else:
-                    print("No active loop to stop.")
-                    logger.info("'stop' command issued with no active loop.")
-                continue
-
-            if command == "profile":
-                _execute_workflow(bot, "profile", options)
-                logger.info("Profile workflow finished for handle=%s.", options.handle)
-                continue
-
-            if command == "go-home":
-                state = bot.go_home()
-                print(f"Current state: {state.name}")
-                logger.info("Go home executed; state=%s", state.name)
-                continue
 
-            if command == "navigate":
-                result = bot.navigate(options.url)
-                state = result.next_state or bot.context.current_state
-                print(f"Navigated to {options.url} (state: {state.name})")
-                logger.info("Navigate executed; url=%s state=%s", options.url, state.name)
-                continue
-
-            if command == "home":
-                _ensure_authenticated(bot)
-                state = bot.go_home()
-                summary = bot.selected_post_summary()
-                if summary:
-                    print(f"At top of home timeline. Selected post: {summary}")
-                else:
-                    print("At top of home timeline.")
-                logger.info("Home command executed; state=%s", state.name)
-                continue
-
-            if command == "like":
-                _ensure_authenticated(bot)
-                summary = bot.selected_post_summary()
-                if summary:
-                    print(f"Selected post: {summary}")
-                success = bot.like_center_post()
-                print("Like successful" if success else "Like failed")
-                logger.info("Like command completed; success=%s", success)
-                continue
-
-            if command == "repost":
-                _ensure_authenticated(bot)
-                summary = bot.selected_post_summary()
-                if summary:
-                    print(f"Selected post: {summary}")
-                success = bot.repost_center_post(quote=getattr(options, "quote", None))
-                print("Repost successful" if success else "Repost failed")
-                logger.info("Repost command completed; success=%s quote=%s", success, getattr(options, "quote", None))
-                continue
+def _iter_script_lines(script: str) -> Iterable[tuple[int, str]]:
+    handle = sys.stdin if script == "-" else open(Path(script).expanduser(), encoding="utf-8")
+    try:
+        for line_number, raw in enumerate(handle, start=1):
+            line = raw.strip()
+            if line and not line.startswith("#"):
+                yield line_number, line
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
 
-            if command == "quote":
-                _ensure_authenticated(bot)
-                summary = bot.selected_post_summary()
-                if summary:
-                    print(f"Selected post: {summary}")
-                success = bot.quote_center_post(options.text)
-                print("Quote successful" if success else "Quote failed")
-                logger.info("Quote command completed; success=%s", success)
-                continue
 
-            if command == "comment":
-                _ensure_authenticated(bot)
-                summary = bot.selected_post_summary()
-                if summary:
-                    print(f"Selected post: {summary}")
-                success = bot.comment_on_center_post(options.text)
-                print("Comment successful" if success else "Comment failed")
-                logger.info("Comment command completed; success=%s", success)
-                continue
+def _run_session_script(
+    bot: BotController,
+    logger: logging.Logger,
+    default_manual_timeout: float | None,
+    *,
+    script: str,
+    continue_on_error: bool,
+    profile_cache: ProfileCache | None = None,
+    behaviour_watcher: BehaviourWatcher | None = None,
+) -> bool:
+    source = "stdin" if script == "-" else script
+    print(f"Running session script from {source} ({'continue on error' if continue_on_error else 'fail fast'}).")
+    started = time.perf_counter()
+    results: list[SessionCommandResult] = []
+    for line_number, line in _iter_script_lines(script):
+        print(f"webot[{line_number}]> {line}")
+        result = _run_session_line(
+            bot,
+            line,
+            line_number,
+            logger,
+            default_manual_timeout,
+            profile_cache=profile_cache,
+            behaviour_watcher=behaviour_watcher,
+        )
+        results.append(result)
+        if result.command in {"exit", "quit"}:
+            break
+        if not result.ok and not continue_on_error:
+            print(f"Stopping script after failure on line {line_number}.")
+            break
 
-            if command == "makepost":
-                _ensure_authenticated(bot)
-                success = bot.make_post(options.text)
-                print("Post published" if success else "Failed to publish post")
-                logger.info("MakePost command completed; success=%s", success)
-                continue
+    if bot.loop_manager.is_running():
+        print("Stopping active loop at the end of the script...")
+        bot.loop_manager.stop(wait=5.0)
+
+    failures = [result for result in results if not result.ok]
+    elapsed = time.perf_counter() - started
+    if results:
+        rows = [
+            (result.line_number, result.line[:48], "ok" if result.ok else "FAILED", f"{result.seconds:.2f}", result.error or "")
+            for result in results
+        ]
+        print()
+        print(format_table(("line", "command", "status", "seconds", "error"), rows))
+    print(f"Script finished: {len(results) - len(failures)} ok, {len(failures)} failed in {elapsed:.2f}s")
+    logger.info("Script finished; commands=%s failed=%s seconds=%.2f", len(results), len(failures), elapsed)
+    return not failures
+
+
+def _run_session_line(
+    bot: BotController,
+    line: str,
+    line_number: int,
+    logger: logging.Logger,
+    default_manual_timeout: float | None,
+    *,
+    profile_cache: ProfileCache | None = None,
+    behaviour_watcher: BehaviourWatcher | None = None,
+    background: bool = False,
+) -> SessionCommandResult:
+    """Parse and execute one session command, timing it."""
+
+    started = time.perf_counter()
+
+    def finish(command: str | None, ok: bool, error: str | None = None) -> SessionCommandResult:
+        seconds = time.perf_counter() - started
+        if command is not None:
+            logger.info(
+                "Command finished; command=%s ok=%s latency_ms=%.1f", command, ok, seconds * 1000
+            )
+        return SessionCommandResult(line_number, line, command, ok, seconds, error)
 
-            if command == "status":
-                state = bot.context.current_state
-                print(f"State: {state.name}")
-                print(f"Logged in: {bot.context.logged_in}")
-                print(f"Profile path: {bot.profile_path or 'None'} (persistent={bot.profile_is_persistent})")
-                logger.info("Status queried; state=%s logged_in=%s", state.name, bot.context.logged_in)
-                continue
+    try:
+        command, options = _parse_session_command(line, default_manual_timeout=default_manual_timeout)
+    except ValueError as exc:  # unbalanced quotes
+        print(f"[error] {exc}")
+        return finish(None, False, str(exc))
+    if command is None:
+        return finish(None, False, "invalid command")
+
+    logger.info("Command received: %s %s", command, vars(options) if options else {})
+
+    if bot.loop_manager.is_running() and command in BROWSER_SESSION_COMMANDS:
+        print("A loop script is driving the browser. Stop it with 'loop stop' before running browser commands.")
+        logger.warning("Command %s blocked because a loop script is active.", command)
+        return finish(command, False, "blocked by active loop")
+
+    if command in {"exit", "quit"}:
+        if bot.loop_manager.is_running():
+            print("Stopping active loop before exiting...")
+            bot.loop_manager.stop(wait=5.0)
+        return finish(command, True)
+
+    if command == "help":
+        _print_session_help()
+        return finish(command, True)
+
+    driver_lock = bot.loop_manager.driver_lock if command in BROWSER_SESSION_COMMANDS else nullcontext()
+    try:
+        with driver_lock:
+            ok = _dispatch_session_command(
+                bot,
+                command,
+                options,
+                logger,
+                profile_cache=profile_cache,
+                behaviour_watcher=behaviour_watcher,
+                background=background,
+            )
+    except Exception as exc:  # pragma: no cover - interactive loop
+        print(f"[error] {exc}")
+        logger.exception("Command '%s' failed", command)
+        return finish(command, False, str(exc))
+    return finish(command, ok, None if ok else "command reported failure")
+
+
+def _run_local_command(
+    bot: BotController,
+    name: str,
+    func: Callable[[], Any],
+    report: Callable[[Any], None],
+    logger: logging.Logger,
+    *,
+    background: bool,
+) -> bool:
+    future = bot.loop_manager.run_task(name, func)
+    if not background:
+        report(future.result())
+        return True
+
+    def done(future) -> None:
+        try:
+            result = future.result()
+        except Exception as exc:
+            print(f"\n[{name}] failed: {exc}")
+            logger.error("Background command failed; command=%s error=%s", name, exc)
+            return
+        print()
+        report(result)
+
+    print(f"[{name}] running in the background; output follows when ready.")
+    future.add_done_callback(done)
+    return True
+
+
+def _describe_loop_stop(bot: BotController) -> str:
+    latency = bot.loop_manager.last_stop_latency
+    if latency is None:
+        return "Loop stop requested; the script is still finishing its current step."
+    return f"Loop stopped in {latency * 1000:.0f} ms."
+
+
+def _dispatch_session_command(
+    bot: BotController,
+    command: str,
+    options: argparse.Namespace,
+    logger: logging.Logger,
+    *,
+    profile_cache: ProfileCache | None = None,
+    behaviour_watcher: BehaviourWatcher | None = None,
+    background: bool = False,
+) -> bool:
+    """Run one parsed session command; ``False`` when it reported a failure.
+
+    With ``background`` set, commands that only read local data (``store``,
+    ``logs``) return as soon as they are queued and print their output when
+    the task pool finishes them.
+    """
+
+    if command == "login":
+        manual_timeout = options.manual_timeout
+        if manual_timeout is not None and manual_timeout < 0:
+            manual_timeout = None
+        state = bot.manual_login(
+            manual_timeout=manual_timeout,
+            persist_profile=not getattr(options, "no_persist_profile", False),
+            profile_name=getattr(options, "profile_name", None),
+        )
+        print(f"Manual login completed with state: {state.name}")
+        logger.info("Manual login completed: state=%s", state.name)
+        return True
 
-            print("Unknown command. Type 'help' for available commands.")
+    if command == "engage":
+        _execute_workflow(bot, "engage", options)
+        logger.info("Engage workflow finished (posts=%s).", getattr(options, "posts", 10))
+        return True
+
+    if command == "loop":
+        action = options.action
+        if action == "list":
+            scripts = bot.loop_manager.available_scripts()
+            if not scripts:
+                print("No loop scripts available.")
+            else:
+                print("Available loop scripts:")
+                for name, definition in sorted(scripts.items()):
+                    print(f"  {name}: {definition.description}")
+            logger.info("Loop list displayed (count=%s).", len(scripts))
+            return True
+
+        if action == "status":
+            status = bot.loop_manager.status()
+            if status["running"]:
+                print(f"Loop running: {status['script']}")
+            else:
+                print("No loop script is running.")
+            print(bot.loop_manager.describe_scheduler())
+            logger.info("Loop status queried; running=%s script=%s", status["running"], status["script"])
+            return True
+
+        if action == "stop":
+            if bot.loop_manager.stop():
+                print(_describe_loop_stop(bot))
+                logger.info("Loop stop requested.")
+            else:
+                print("No active loop to stop.")
+                logger.info("Loop stop requested but no active script.")
+            return True
+
+        script_name = options.script
+        if not script_name:
+            print("Specify a script name, e.g. 'loop random_engage'. Use 'loop list' to see options.")
+            return False
+
+        script_key = script_name.lower().replace("-", "_")
+        _ensure_authenticated(bot)
+        try:
+            bot.loop_manager.start(
+                script_key,
+                logger=logger,
+                posts_per_cycle=options.posts_per_cycle,
+                iteration_limit=options.iterations,
+                min_delay=options.min_delay,
+                max_delay=options.max_delay,
+            )
         except Exception as exc:  # pragma: no cover - interactive loop
-            print(f"[error] {exc}")
-            logger.exception("Command '%s' failed", command)
+            print(f"Failed to start loop: {exc}")
+            logger.exception("Loop start failed for script=%s", script_key)
+            return False
+        else:
+            print(f"Loop script '{script_key}' started.")
+            logger.info(
+                "Loop script started; name=%s posts_per_cycle=%s iterations=%s min_delay=%s max_delay=%s",
+                script_key,
+                options.posts_per_cycle,
+                options.iterations,
+                options.min_delay,
+                options.max_delay,
+            )
+        return True
 
+    if command == "stop":
+        if bot.loop_manager.stop():
+            print(_describe_loop_stop(bot))
+            logger.info("Loop stop requested via 'stop' command.")
+        else:
+            print("No active loop to stop.")
+            logger.info("'stop' command issued with no active loop.")
+        return True
 
-def _init_session_logger() -> Path:
-    log_dir = Path("logs")
-    log_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-    log_path = log_dir / f"session-{timestamp}.log"
+    if command == "profile":
+        _execute_workflow(bot, "profile", options, profile_cache=profile_cache)
+        logger.info("Profile workflow finished for handle=%s.", options.handle)
+        return True
+
+    if command == "go-home":
+        state = bot.go_home()
+        print(f"Current state: {state.name}")
+        logger.info("Go home executed; state=%s", state.name)
+        return True
+
+    if command == "navigate":
+        result = bot.navigate(options.url)
+        state = result.next_state or bot.context.current_state
+        print(f"Navigated to {options.url} (state: {state.name})")
+        logger.info("Navigate executed; url=%s state=%s", options.url, state.name)
+        return result.success
+
+    if command == "home":
+        _ensure_authenticated(bot)
+        state = bot.go_home()
+        summary = bot.selected_post_summary()
+        if summary:
+            print(f"At top of home timeline. Selected post: {summary}")
+        else:
+            print("At top of home timeline.")
+        logger.info("Home command executed; state=%s", state.name)
+        return True
+
+    if command == "like":
+        _ensure_authenticated(bot)
+        summary = bot.selected_post_summary()
+        if summary:
+            print(f"Selected post: {summary}")
+        success = bot.like_center_post()
+        print("Like successful" if success else "Like failed")
+        logger.info("Like command completed; success=%s", success)
+        return success
+
+    if command == "repost":
+        _ensure_authenticated(bot)
+        summary = bot.selected_post_summary()
+        if summary:
+            print(f"Selected post: {summary}")
+        success = bot.repost_center_post(quote=getattr(options, "quote", None))
+        print("Repost successful" if success else "Repost failed")
+        logger.info("Repost command completed; success=%s quote=%s", success, getattr(options, "quote", None))
+        return success
+
+    if command == "quote":
+        _ensure_authenticated(bot)
+        summary = bot.selected_post_summary()
+        if summary:
+            print(f"Selected post: {summary}")
+        success = bot.quote_center_post(options.text)
+        print("Quote successful" if success else "Quote failed")
+        logger.info("Quote command completed; success=%s", success)
+        return success
+
+    if command == "comment":
+        _ensure_authenticated(bot)
+        summary = bot.selected_post_summary()
+        if summary:
+            print(f"Selected post: {summary}")
+        success = bot.comment_on_center_post(options.text)
+        print("Comment successful" if success else "Comment failed")
+        logger.info("Comment command completed; success=%s", success)
+        return success
+
+    if command == "makepost":
+        _ensure_authenticated(bot)
+        success = bot.make_post(options.text)
+        print("Post published" if success else "Failed to publish post")
+        logger.info("MakePost command completed; success=%s", success)
+        return success
+
+    if command == "status":
+        state = bot.context.current_state
+        print(f"State: {state.name}")
+        print(f"Logged in: {bot.context.logged_in}")
+        print(f"Profile path: {bot.profile_path or 'None'} (persistent={bot.profile_is_persistent})")
+        if profile_cache is not None:
+            print(profile_cache.describe_stats())
+        print(get_scorer().describe_stats())
+        print(bot.loop_manager.describe_scheduler())
+        print(bot.context.journal.describe())
+        print(describe_evaluations())
+        logger.info("Status queried; state=%s logged_in=%s", state.name, bot.context.logged_in)
+        return True
+
+    if command == "store":
+        if bot.store is None:
+            print("The local store is disabled for this session (--no-store).")
+            return False
+        store = bot.store
+
+        def query() -> tuple:
+            store.flush(timeout=2.0)
+            return store.query(options.query, limit=options.limit, handle=options.handle)
+
+        def report(result: tuple) -> None:
+            columns, rows = result
+            print(format_table(columns, rows) if rows else f"No rows for query '{options.query}'.")
+            logger.info("Store query executed; query=%s rows=%s", options.query, len(rows))
+
+        return _run_local_command(bot, "store", query, report, logger, background=background)
+
+    if command == "behaviour":
+        if options.action == "reload":
+            if behaviour_watcher is None:
+                print("Behaviour hot-reload is not active in this session.")
+                return False
+            if not behaviour_watcher.check(force=True):
+                if behaviour_watcher.last_error is None:
+                    print(f"Behaviour config not found: {behaviour_watcher.path}")
+                else:
+                    print(f"Behaviour reload failed (current settings kept): {behaviour_watcher.last_error}")
+                logger.warning(
+                    "Behaviour reload failed; path=%s error=%s",
+                    behaviour_watcher.path,
+                    behaviour_watcher.last_error or "missing",
+                )
+                return False
+            print("Behaviour settings reloaded.")
+        if behaviour_watcher is not None:
+            print(behaviour_watcher.describe())
+        print(get_behaviour_settings().describe())
+        logger.info("Behaviour settings displayed; action=%s", options.action)
+        return True
+
+    if command == "journal":
+        journal = bot.context.journal
+        entries = list(journal.entries(None if options.output else options.limit))
+        if not entries:
+            print("No state transitions recorded yet.")
+        elif options.output:
+            with open_record_writer(Path(options.output)) as writer:
+                writer.write_many(entry.as_record(journal.wall_offset) for entry in entries)
+            print(f"{len(entries)} transition(s) written to {writer.completed[-1]}")
+        else:
+            rows = [
+                (
+                    time.strftime("%H:%M:%S", time.localtime(entry.entered_at + journal.wall_offset)),
+                    entry.from_state.name,
+                    entry.state.name,
+                    "current" if entry.duration is None else f"{entry.duration:.2f}",
+                    entry.reason.name.lower(),
+                )
+                for entry in entries
+            ]
+            print(format_table(("at", "from", "to", "seconds", "reason"), rows))
+        logger.info("Journal displayed; entries=%s output=%s", len(entries), options.output)
+        return True
+
+    if command == "selectors":
+        _print_selector_report()
+        logger.info("Selector report displayed.")
+        return True
+
+    if command == "logs":
+        return _run_local_command(
+            bot,
+            "logs",
+            lambda: _print_log_stats(DEFAULT_LOG_DIR),
+            lambda _: logger.info("Log stats displayed."),
+            logger,
+            background=background,
+        )
 
-    logger = logging.getLogger(SESSION_LOGGER_NAME)
-    logger.setLevel(logging.INFO)
-    logger.propagate = False
+    print("Unknown command. Type 'help' for available commands.")
+    return False
 
-    handler = logging.FileHandler(log_path, encoding="utf-8")
-    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
 
-    return log_path
+def _init_session_logger() -> SessionLog:
+    return SessionLog(SESSION_LOGGER_NAME, log_dir=DEFAULT_LOG_DIR)
 
 
-def _teardown_session_logger() -> None:
+def _teardown_session_logger(session_log: SessionLog) -> None:
     logger = logging.getLogger(SESSION_LOGGER_NAME)
+    session_log.close()
     for handler in list(logger.handlers):
         handler.close()
         logger.removeHandler(handler)
@@ -595,6 +1327,31 @@ def main(argv: list[str] | None = None) -> int:
     if args.command == "profile" and not args.handle:
         parser.error("--handle is required for the profile command")
 
+    if args.script and args.command != "session":
+        parser.error("--script is only supported by the session command")
+
+    if args.script and args.script != "-" and not Path(args.script).expanduser().is_file():
+        parser.error(f"Session script not found: {args.script}")
+
+    if args.action and args.command != "logs":
+        parser.error(f"Unexpected argument '{args.action}' for the {args.command} command")
+
+    if args.command in LOCAL_COMMANDS:
+        try:
+            if args.command == "offline":
+                _run_offline_analysis(args)
+            elif args.command == "score":
+                _run_score(args)
+            elif args.command == "logs":
+                _run_log_stats(args)
+            elif args.command == "selectors":
+                _print_selector_report()
+            else:
+                _run_store_query(args)
+        except (FileNotFoundError, ValueError, RuntimeError) as exc:
+            parser.error(str(exc))
+        return 0
+
     profiles_root = _resolve_profiles_root(getattr(args, "profiles_root", None))
 
     behaviour_config_path: Path | None = None
@@ -666,14 +1423,45 @@ def main(argv: list[str] | None = None) -> int:
         bootstrap_profile=bootstrap_profile,
         profile_root=profiles_root,
         user_agent=args.user_agent,
+        cdp_channel=not args.no_cdp_channel,
     )
+    if args.command == "latency":
+        try:
+            return _run_latency_benchmark(args, driver_config)
+        except ValueError as exc:
+            parser.error(str(exc))
+        finally:
+            get_selector_stats().save()
+
     bot = BotController(driver_config=driver_config)
+    profile_cache = ProfileCache(ttl=args.cache_ttl, lists_ttl=args.lists_cache_ttl)
+    store: LocalStore | None = None
+    if not args.no_store:
+        store = LocalStore(Path(args.store_db).expanduser() if args.store_db else None)
+        bot.attach_store(store)
+    seen_index: SeenPostIndex | None = None
+    if not args.reprocess_seen:
+        seen_index = SeenPostIndex(Path(args.seen_index).expanduser() if args.seen_index else None)
+        bot.seen_posts = seen_index
+    snapshot_store: SnapshotStore | None = None
+    snapshot_recorder: SnapshotRecorder | None = None
+    if args.record_snapshots:
+        snapshot_store = SnapshotStore(
+            Path(args.snapshot_dir).expanduser() if args.snapshot_dir else None,
+            max_bytes=int(args.snapshot_cap_mb * 1024 * 1024),
+        )
+        snapshot_recorder = SnapshotRecorder(snapshot_store)
+        set_snapshot_recorder(snapshot_recorder)
 
-    bot.start()
+    def start_browser() -> None:
+        bot.start()
+        if bot.profile_path and (args.fresh_profile or args.chrome_profile):
+            label = "Fresh Chrome profile" if args.fresh_profile and not args.chrome_profile else "Chrome profile"
+            print(f"{label}: {bot.profile_path}")
 
-    if bot.profile_path and (args.fresh_profile or args.chrome_profile):
-        label = "Fresh Chrome profile" if args.fresh_profile and not args.chrome_profile else "Chrome profile"
-        print(f"{label}: {bot.profile_path}")
+    # One-shot profile lookups launch Chrome lazily so a cache hit never starts the browser.
+    if args.command != "profile":
+        start_browser()
 
     try:
         if args.command == "login":
@@ -683,21 +1471,47 @@ def main(argv: list[str] | None = None) -> int:
                 profile_name=profile_name,
             )
             if final_state != bot.context.current_state:
-                bot.context.update_state(final_state)
+                bot.context.update_state(final_state, reason=TransitionReason.MANUAL)
             print(f"Manual login completed with state: {final_state.name}")
             return 0
 
         if args.command == "session":
-            _run_session(bot, default_manual_timeout=manual_timeout)
-            return 0
+            script = args.script
+            if script is None and not sys.stdin.isatty():
+                script = "-"
+            succeeded = _run_session(
+                bot,
+                default_manual_timeout=manual_timeout,
+                profile_cache=profile_cache,
+                script=script,
+                continue_on_error=args.continue_on_error,
+                behaviour_path=behaviour_config_path,
+            )
+            return 0 if succeeded else 1
 
         try:
-            _execute_workflow(bot, args.command, args)
+            _execute_workflow(
+                bot,
+                args.command,
+                args,
+                profile_cache=profile_cache,
+                start_browser=start_browser,
+            )
             return 0
         except ValueError as exc:
             parser.error(str(exc))
     finally:
         bot.stop()
+        get_selector_stats().save()
+        if store is not None:
+            store.close()
+        if seen_index is not None:
+            seen_index.close()
+        if snapshot_store is not None:
+            set_snapshot_recorder(None)
+            if snapshot_recorder is not None:
+                snapshot_recorder.close()
+            snapshot_store.close()
 
     return 0
 
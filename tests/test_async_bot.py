@@ -0,0 +1,96 @@
+"""AsyncBotController: profile cache accounting and shutdown with a running loop."""
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from weBot.async_bot import AsyncBotController
+from weBot.brains.loops import LoopManager
+from weBot.data.cache import HEADER_SECTION, ProfileCache
+from weBot.workflows import profile as profile_module
+from weBot.workflows.profile import ProfileData
+
+
+class FakeBot:
+    def __init__(self) -> None:
+        self.loop_manager = LoopManager(self)
+        self.store = None
+        self.driver = None
+        self.stopped = False
+
+    def stop(self) -> None:
+        self.loop_manager.shutdown(wait=5.0)
+        self.stopped = True
+
+
+def _profile(handle: str) -> ProfileData:
+    return ProfileData(display_name="NASA", handle=handle, bio="", followers_count="1K", following_count="2")
+
+
+def test_fetch_profile_reads_the_cache_once_per_call(tmp_path, monkeypatch):
+    scraped = []
+    monkeypatch.setattr(profile_module, "_scrape_header", lambda bot, handle: scraped.append(handle) or _profile(handle))
+    cache = ProfileCache(tmp_path)
+    bot = FakeBot()
+
+    async def run():
+        controller = AsyncBotController(bot)
+        try:
+            first = await controller.fetch_profile("nasa", cache=cache)
+            second = await controller.fetch_profile("nasa", cache=cache)
+        finally:
+            controller.close()
+            bot.loop_manager.shutdown()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert scraped == ["nasa"]
+    assert first.followers == second.followers == 1000
+    assert cache.stats()[HEADER_SECTION] == {"hits": 1, "misses": 1}
+
+
+def test_refresh_skips_the_cache_but_still_stores_the_result(tmp_path, monkeypatch):
+    monkeypatch.setattr(profile_module, "_scrape_header", lambda bot, handle: _profile(handle))
+    cache = ProfileCache(tmp_path)
+    bot = FakeBot()
+
+    async def run():
+        controller = AsyncBotController(bot)
+        try:
+            await controller.fetch_profile("nasa", cache=cache, refresh=True)
+        finally:
+            controller.close()
+            bot.loop_manager.shutdown()
+
+    asyncio.run(run())
+
+    assert cache.stats()[HEADER_SECTION] == {"hits": 0, "misses": 0}
+    assert cache.get(HEADER_SECTION, "nasa")["handle"] == "nasa"
+
+
+def test_stop_does_not_wait_on_the_driver_lock(monkeypatch):
+    bot = FakeBot()
+    holding = threading.Event()
+    release = threading.Event()
+
+    def loop_step() -> None:
+        # A loop thread that owns the driver lock until its stop arrives.
+        with bot.loop_manager.driver_lock:
+            holding.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=loop_step, daemon=True)
+    thread.start()
+    assert holding.wait(5)
+    monkeypatch.setattr(bot, "stop", lambda: (release.set(), setattr(bot, "stopped", True)))
+
+    async def run():
+        controller = AsyncBotController(bot)
+        await asyncio.wait_for(controller.stop(), timeout=2)
+
+    asyncio.run(run())
+    thread.join(5)
+
+    assert bot.stopped
+    assert not thread.is_alive()
@@ -0,0 +1,94 @@
+"""BehaviourWatcher swaps valid settings in and keeps them through bad edits."""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+
+import pytest
+
+import main
+from weBot.config import behaviour
+from weBot.config.behaviour import DEFAULT_BEHAVIOUR, BehaviourWatcher, get_behaviour_settings
+
+
+@pytest.fixture(autouse=True)
+def default_settings(monkeypatch):
+    monkeypatch.setattr(behaviour, "_CURRENT_SETTINGS", DEFAULT_BEHAVIOUR)
+
+
+def _write(path, content: str) -> None:
+    path.write_text(content, encoding="utf-8")
+    # Coarse filesystem timestamps must not hide the change from the poll.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_valid_change_is_swapped_in(tmp_path):
+    path = tmp_path / "behaviour.json"
+    _write(path, json.dumps({"post_pause_seconds": 1.5}))
+    reloaded = []
+    watcher = BehaviourWatcher(path, on_reload=reloaded.append)
+
+    assert watcher.check() is False  # unchanged since the watcher started
+    _write(path, json.dumps({"post_pause_seconds": 2.5, "random_delay": {"min": 1, "max": 2}}))
+    assert watcher.check() is True
+
+    settings = get_behaviour_settings()
+    assert settings.post_pause_seconds == 2.5
+    assert settings.random_delay.as_tuple() == (1.0, 2.0)
+    assert reloaded == [settings]
+    assert (watcher.reloads, watcher.last_error) == (1, None)
+
+
+def test_invalid_file_keeps_settings_and_reports(tmp_path):
+    path = tmp_path / "behaviour.json"
+    _write(path, json.dumps({"post_pause_seconds": 2.5}))
+    errors = []
+    watcher = BehaviourWatcher(path, on_error=errors.append)
+    assert watcher.check(force=True) is True
+    active = get_behaviour_settings()
+
+    _write(path, '{"post_pause_seconds": ')
+    assert watcher.check() is False
+    assert get_behaviour_settings() is active
+    assert watcher.last_error.startswith("JSONDecodeError")
+    assert len(errors) == 1
+    assert watcher.check() is False  # reported once per change
+    assert len(errors) == 1
+
+    _write(path, json.dumps({"post_pause_seconds": 3}))
+    assert watcher.check() is True
+    assert watcher.last_error is None
+    assert get_behaviour_settings().post_pause_seconds == 3.0
+
+
+def test_deleted_file_keeps_settings(tmp_path):
+    path = tmp_path / "behaviour.json"
+    _write(path, json.dumps({"post_pause_seconds": 2.5}))
+    watcher = BehaviourWatcher(path)
+    watcher.check(force=True)
+    active = get_behaviour_settings()
+
+    path.unlink()
+    assert watcher.check() is False
+    assert watcher.check(force=True) is False
+    assert get_behaviour_settings() is active
+    assert watcher.last_error is None
+
+
+def test_reload_command_reports_failure(tmp_path, capsys):
+    path = tmp_path / "behaviour.json"
+    _write(path, "[1, 2]")
+    watcher = BehaviourWatcher(path)
+    options = argparse.Namespace(action="reload")
+
+    ok = main._dispatch_session_command(
+        None, "behaviour", options, logging.getLogger("test.behaviour"), behaviour_watcher=watcher
+    )
+
+    assert ok is False
+    out = capsys.readouterr().out
+    assert "Behaviour reload failed (current settings kept): ValueError" in out
+    assert get_behaviour_settings() is DEFAULT_BEHAVIOUR
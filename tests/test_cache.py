@@ -0,0 +1,75 @@
+"""ProfileCache freshness, overwrites and damaged entries."""
+from __future__ import annotations
+
+import pytest
+
+from weBot.data import cache as cache_module
+from weBot.data.cache import HEADER_SECTION, LISTS_SECTION, ProfileCache
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return clock
+
+
+def test_entries_expire_per_section(tmp_path, clock):
+    cache = ProfileCache(tmp_path, ttl=60, lists_ttl=600)
+    cache.put(HEADER_SECTION, "@Ada", {"followers": "12"})
+    cache.put(LISTS_SECTION, "ada", {"followers": ["bob"]})
+
+    clock.now += 60
+    assert cache.get(HEADER_SECTION, "ada") == {"followers": "12"}
+    clock.now += 1
+    assert cache.get(HEADER_SECTION, "ada") is None
+    assert cache.get(LISTS_SECTION, "ADA") == {"followers": ["bob"]}
+    clock.now += 600
+    assert cache.get(LISTS_SECTION, "ada") is None
+
+    assert cache.stats() == {
+        HEADER_SECTION: {"hits": 1, "misses": 1},
+        LISTS_SECTION: {"hits": 1, "misses": 1},
+    }
+
+
+def test_put_overwrites_and_refreshes_entry(tmp_path, clock):
+    cache = ProfileCache(tmp_path, ttl=60)
+    cache.put(HEADER_SECTION, "ada", {"followers": "12"})
+    clock.now += 50
+    cache.put(HEADER_SECTION, "ada", {"followers": "13"})
+    clock.now += 50
+
+    assert cache.get(HEADER_SECTION, "ada") == {"followers": "13"}
+    assert [path.name for path in (tmp_path / HEADER_SECTION).iterdir()] == ["ada.json"]
+
+
+@pytest.mark.parametrize("content", ['{"handle": "ada", "stored', "[1, 2]", '{"stored_at": "soon", "data": {}}'])
+def test_corrupted_entry_is_a_miss_and_can_be_replaced(tmp_path, clock, content):
+    cache = ProfileCache(tmp_path, ttl=60)
+    (tmp_path / HEADER_SECTION).mkdir()
+    (tmp_path / HEADER_SECTION / "ada.json").write_text(content, encoding="utf-8")
+
+    assert cache.get(HEADER_SECTION, "ada") is None
+    assert cache.stats()[HEADER_SECTION] == {"hits": 0, "misses": 1}
+
+    cache.put(HEADER_SECTION, "ada", {"followers": "12"})
+    assert cache.get(HEADER_SECTION, "ada") == {"followers": "12"}
+
+
+def test_uncacheable_handles_and_disabled_ttl(tmp_path):
+    cache = ProfileCache(tmp_path, ttl=0)
+    cache.put(HEADER_SECTION, "ada", {"followers": "12"})
+    cache.put(LISTS_SECTION, "not a handle!", {})
+
+    assert cache.get(HEADER_SECTION, "ada") is None
+    assert not (tmp_path / HEADER_SECTION).exists()
+    assert not (tmp_path / LISTS_SECTION).exists()
@@ -0,0 +1,67 @@
+"""wait_for keeps Selenium's poll cadence and still stops promptly when cancelled."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from weBot.core.actions.utils import CancellationToken, OperationCancelled, cancellation_scope, wait_for
+
+
+class CountingCondition:
+    def __init__(self, *, succeed_after: int | None = None, raises: bool = False) -> None:
+        self.calls = 0
+        self.succeed_after = succeed_after
+        self.raises = raises
+
+    def __call__(self, driver):
+        self.calls += 1
+        if self.raises:
+            raise NoSuchElementException("missing")
+        if self.succeed_after is not None and self.calls >= self.succeed_after:
+            return "found"
+        return False
+
+
+def test_polls_at_selenium_cadence_inside_a_scope():
+    condition = CountingCondition()
+    with cancellation_scope(CancellationToken()):
+        with pytest.raises(TimeoutException):
+            wait_for(object(), condition, timeout=1.2)
+
+    # Polls at 0, 0.5, 1.0 and the deadline; 50 ms polling would make ~25 calls.
+    assert 3 <= condition.calls <= 4
+
+
+def test_returns_the_condition_value_and_ignores_missing_elements():
+    with cancellation_scope(CancellationToken()):
+        assert wait_for(object(), CountingCondition(succeed_after=2), timeout=2) == "found"
+        with pytest.raises(TimeoutException):
+            wait_for(object(), CountingCondition(raises=True), timeout=0.2)
+
+
+def test_cancellation_interrupts_the_pause_between_polls():
+    token = CancellationToken()
+    condition = CountingCondition()
+    timer = threading.Timer(0.1, token.cancel)
+    timer.start()
+    started = time.perf_counter()
+    with cancellation_scope(token):
+        with pytest.raises(OperationCancelled):
+            wait_for(object(), condition, timeout=10)
+
+    assert time.perf_counter() - started < 0.3
+    assert condition.calls == 1
+
+
+def test_cancelled_token_raises_before_polling():
+    token = CancellationToken()
+    token.cancel()
+    condition = CountingCondition(succeed_after=1)
+    with cancellation_scope(token):
+        with pytest.raises(OperationCancelled):
+            wait_for(object(), condition)
+
+    assert condition.calls == 0
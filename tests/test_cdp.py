@@ -0,0 +1,151 @@
+"""Direct DevTools channel: dispatch, fallback, window tracking and timing."""
+from __future__ import annotations
+
+import pytest
+
+from weBot.core import cdp
+from weBot.core.cdp import CdpChannel, CdpError, attach_channel, channel_for, detach_channel, evaluate_value
+from weBot.core.latency import CommandDelay
+
+
+class FakeExecutor:
+    def __init__(self) -> None:
+        self.commands = []
+
+    def execute(self, command, params):
+        self.commands.append(command)
+        return {"value": f"webdriver:{params['script']}"}
+
+
+class FakeSwitchTo:
+    def __init__(self, driver: "FakeDriver") -> None:
+        self._driver = driver
+
+    def window(self, handle: str) -> None:
+        self._driver.handle = handle
+
+
+class FakeDriver:
+    def __init__(self, handle: str = "tab-1") -> None:
+        self.handle = handle
+        self.command_executor = FakeExecutor()
+        self.switch_to = FakeSwitchTo(self)
+        self.handle_reads = 0
+
+    @property
+    def current_window_handle(self) -> str:
+        self.handle_reads += 1
+        return self.handle
+
+    def execute_script(self, script, *args):
+        return self.command_executor.execute("executeScript", {"script": script, "args": list(args)})["value"]
+
+
+class FakeChannel(CdpChannel):
+    def __init__(self, target_id: str, *, fail: bool = False) -> None:
+        self.url = f"ws://fake/{target_id}"
+        self.target_id = target_id
+        self.window_changed = False
+        self.fail = fail
+        self.closed = False
+        self.sent = []
+
+    def send(self, method, params=None):
+        if self.fail:
+            raise CdpError("socket closed")
+        self.sent.append(method)
+        return {"result": {"value": f"{self.target_id}:{len(self.sent)}"}}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def timings(monkeypatch):
+    fresh = {cdp.TRANSPORT_CDP: [0, 0.0], cdp.TRANSPORT_WEBDRIVER: [0, 0.0]}
+    monkeypatch.setattr(cdp, "_TIMINGS", fresh)
+    return fresh
+
+
+def test_evaluations_use_the_channel_instead_of_webdriver(timings):
+    driver = FakeDriver()
+    channel = FakeChannel("tab-1")
+    attach_channel(driver, channel)
+
+    with CommandDelay(driver, 0) as profile:
+        values = [evaluate_value(driver, "return 1") for _ in range(5)]
+
+    assert values == [f"tab-1:{count}" for count in range(1, 6)]
+    assert profile.commands == 0
+    assert profile.cdp_messages == 5
+    assert driver.handle_reads == 0
+    assert timings[cdp.TRANSPORT_CDP][0] == 5
+    assert timings[cdp.TRANSPORT_WEBDRIVER][0] == 0
+    detach_channel(driver)
+
+
+def test_without_a_channel_every_evaluation_is_a_webdriver_command(timings):
+    driver = FakeDriver()
+
+    with CommandDelay(driver, 0) as profile:
+        assert evaluate_value(driver, "return 1") == "webdriver:return 1"
+
+    assert profile.commands == 1
+    assert timings[cdp.TRANSPORT_WEBDRIVER][0] == 1
+    assert "1 via webdriver" in cdp.describe_evaluations()
+
+
+def test_a_broken_channel_falls_back_and_is_dropped(timings):
+    driver = FakeDriver()
+    channel = FakeChannel("tab-1", fail=True)
+    attach_channel(driver, channel)
+
+    assert evaluate_value(driver, "return 2") == "webdriver:return 2"
+    assert channel.closed
+    assert channel_for(driver) is None
+    assert evaluate_value(driver, "return 3") == "webdriver:return 3"
+    assert timings[cdp.TRANSPORT_CDP][0] == 0
+    assert timings[cdp.TRANSPORT_WEBDRIVER][0] == 2
+
+
+def test_switching_back_to_the_channel_tab_keeps_the_channel(monkeypatch):
+    driver = FakeDriver()
+    channel = FakeChannel("tab-1")
+    attach_channel(driver, channel)
+    monkeypatch.setattr(CdpChannel, "connect", classmethod(lambda cls, driver: pytest.fail("reconnected")))
+
+    driver.switch_to.window("tab-1")
+
+    assert evaluate_value(driver, "return 1") == "tab-1:1"
+    assert driver.handle_reads == 1
+    evaluate_value(driver, "return 1")
+    assert driver.handle_reads == 1
+    detach_channel(driver)
+
+
+def test_switching_windows_reconnects_to_the_current_tab(monkeypatch):
+    driver = FakeDriver()
+    old = FakeChannel("tab-1")
+    attach_channel(driver, old)
+    monkeypatch.setattr(CdpChannel, "connect", classmethod(lambda cls, driver: FakeChannel(driver.handle)))
+
+    driver.switch_to.window("tab-2")
+
+    assert evaluate_value(driver, "return 1") == "tab-2:1"
+    assert old.closed
+    assert channel_for(driver).target_id == "tab-2"
+    detach_channel(driver)
+
+
+def test_failed_reconnect_falls_back_to_webdriver(monkeypatch):
+    driver = FakeDriver()
+    attach_channel(driver, FakeChannel("tab-1"))
+
+    def refuse(cls, driver):
+        raise CdpError("no target")
+
+    monkeypatch.setattr(CdpChannel, "connect", classmethod(refuse))
+    driver.switch_to.window("tab-2")
+
+    assert evaluate_value(driver, "return 1") == "webdriver:return 1"
+    assert channel_for(driver) is None
@@ -0,0 +1,65 @@
+"""Fixtures for display-count and engagement-label parsing."""
+from __future__ import annotations
+
+import pytest
+
+from weBot.data.counts import parse_count, parse_counts, parse_engagement_label
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("0", 0),
+        ("42", 42),
+        ("1.2K", 1_200),
+        ("1,2K", 1_200),
+        ("12.5k", 12_500),
+        ("3M", 3_000_000),
+        ("1.1B", 1_100_000_000),
+        ("3,456", 3_456),
+        ("3.456", 3_456),
+        ("1,234,567", 1_234_567),
+        ("1.234.567", 1_234_567),
+        ("3 456", 3_456),
+        ("3 456", 3_456),
+        ("3 456", 3_456),
+        ("1,234.5", 1_234),
+        ("1.234,5", 1_234),
+        ("1,234.6", 1_235),
+        ("1.234,6", 1_235),
+        ("1,234.4", 1_234),
+        ("1,5", 2),
+        ("1.4", 1),
+        ("12,", 12),
+        (" 7 ", 7),
+        (7, 7),
+        (2.6, 3),
+    ],
+)
+def test_parse_count(raw, expected):
+    assert parse_count(raw) == expected
+
+
+@pytest.mark.parametrize("raw", [None, True, "", "K", "abc", "1.2.3K", "-5", "1K2"])
+def test_parse_count_rejects_unparsable(raw):
+    assert parse_count(raw) is None
+
+
+def test_parse_counts_matches_parse_count():
+    values = ["1K", "1K", "3,456", None, 5, "x"]
+    assert parse_counts(values) == [parse_count(value) for value in values]
+
+
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("12 replies, 1.2K reposts, 3,456 likes", {"replies": 12, "reposts": 1_200, "likes": 3_456}),
+        ("1,2K Antworten, 3 456 Likes", {"Antworten": 1_200, "Likes": 3_456}),
+        ("5 replies, 10 views", {"replies": 5, "views": 10}),
+        ("Reply", {}),
+        ("", {}),
+        (None, {}),
+    ],
+)
+def test_parse_engagement_label(label, expected):
+    assert parse_engagement_label(label) == expected
@@ -0,0 +1,120 @@
+"""FeedPipeline backpressure, ordering and error propagation."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from weBot.brains import engage
+from weBot.brains.engage import FeedPipeline, process_feed
+from weBot.core.actions import timeline
+
+
+class FakeScorer:
+    def score(self, post, inverse=False):
+        return 0.5
+
+    def score_batch(self, posts, inverse=False):
+        return [0.5 for _ in posts]
+
+
+class FakeBot:
+    def __init__(self) -> None:
+        self.driver = object()
+        self.context = object()
+        self.store = None
+        self.seen_posts = None
+
+
+class RecordingSink:
+    def __init__(self, *, gate: threading.Event | None = None, fail: bool = False) -> None:
+        self.gate = gate
+        self.fail = fail
+        self.written = []
+
+    def write_many(self, posts) -> None:
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.fail:
+            raise OSError("disk full")
+        self.written.extend(post["status_id"] for post in posts)
+
+
+@pytest.fixture(autouse=True)
+def fake_scorer(monkeypatch):
+    monkeypatch.setattr(engage, "get_scorer", FakeScorer)
+
+
+def test_single_scorer_persists_in_submission_order():
+    sink = RecordingSink()
+    pipeline = FeedPipeline(FakeBot(), sink=sink, score_workers=1, queue_size=4, persist_batch=3)
+    posts = [{"status_id": str(index)} for index in range(25)]
+    for post in posts:
+        pipeline.submit(post)
+    pipeline.close()
+
+    assert sink.written == [str(index) for index in range(25)]
+    assert all(post["score"] == 0.5 for post in posts)
+    assert pipeline.counters["harvest"].items == 25
+    assert pipeline.counters["persist"].items == 25
+
+
+def test_slow_sink_blocks_submit():
+    gate = threading.Event()
+    sink = RecordingSink(gate=gate)
+    pipeline = FeedPipeline(FakeBot(), sink=sink, queue_size=1, persist_batch=1)
+    done = threading.Event()
+
+    def produce() -> None:
+        for index in range(10):
+            pipeline.submit({"status_id": str(index)})
+        done.set()
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    # With every queue full and the writer parked on the sink, submit cannot return.
+    assert not done.wait(0.2)
+    gate.set()
+    producer.join(5)
+    assert done.is_set()
+    pipeline.close()
+
+    harvest = pipeline.counters["harvest"]
+    assert harvest.blocked_seconds >= 0.1
+    assert harvest.max_backlog == 2  # a full queue plus the post waiting on it
+    assert sink.written == [str(index) for index in range(10)]
+
+
+def test_sink_error_surfaces_from_close_and_submit():
+    pipeline = FeedPipeline(FakeBot(), sink=RecordingSink(fail=True))
+    pipeline.submit({"status_id": "1"})
+    deadline = time.monotonic() + 5
+    while not pipeline._errors:
+        assert time.monotonic() < deadline, "writer never failed"
+        time.sleep(0.005)
+
+    with pytest.raises(RuntimeError, match="disk full"):
+        pipeline.submit({"status_id": "2"})
+    with pytest.raises(RuntimeError, match="disk full") as info:
+        pipeline.close()
+    assert isinstance(info.value.__cause__, OSError)
+
+
+def test_process_feed_keeps_original_error_when_close_fails(monkeypatch, caplog):
+    calls = []
+
+    def fetch_post(driver, seen=None):
+        calls.append(driver)
+        if len(calls) > 1:
+            raise KeyError("driver went away")
+        return {"status_id": "1"}
+
+    monkeypatch.setattr(timeline, "fetch_post", fetch_post)
+    monkeypatch.setattr(timeline, "scroll", lambda driver, context: engage.ActionResult(True))
+    monkeypatch.setattr(timeline, "refresh_feed", lambda driver, context: None)
+    monkeypatch.setattr(engage, "cancellable_sleep", lambda seconds: None)
+
+    with pytest.raises(KeyError, match="driver went away"):
+        process_feed(FakeBot(), posts=3, sink=RecordingSink(fail=True), read_only=True)
+    assert "closing after an earlier error" in caplog.text
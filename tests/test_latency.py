@@ -0,0 +1,144 @@
+"""Latency benchmark preconditions, failure status and the sensitivity fit."""
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+import main
+from weBot.core.driver import DriverConfig
+from weBot.core.state import PageState
+from weBot.workflows import latency as latency_module
+from weBot.workflows.latency import LatencySample, LatencyWorkflow, run_latency_benchmark, sensitivity
+
+
+class FakeBot:
+    def __init__(self, state: PageState) -> None:
+        self.state = state
+        self.driver = object()
+
+    def ensure_home(self) -> PageState:
+        return self.state
+
+
+class FakePool:
+    def __init__(self, config: DriverConfig, state: PageState = PageState.HOME_TIMELINE) -> None:
+        self.config = config
+        self.bot = FakeBot(state)
+
+    @contextmanager
+    def lease(self):
+        yield self.bot
+
+
+@contextmanager
+def _no_latency(driver, rtt_ms, *, throttle_network=True):
+    yield type("Delay", (), {"round_trips": 2})()
+
+
+def _persisted() -> DriverConfig:
+    return DriverConfig(user_data_dir=Path("profiles/nasa"))
+
+
+def test_ephemeral_profile_is_rejected_before_launch():
+    with pytest.raises(ValueError, match="logged-in"):
+        run_latency_benchmark(FakePool(DriverConfig()), [])
+
+
+def test_logged_out_profile_stops_the_run(monkeypatch):
+    monkeypatch.setattr(latency_module, "simulated_latency", _no_latency)
+    pool = FakePool(_persisted(), PageState.LOGIN_USERNAME)
+    workflow = LatencyWorkflow("noop", lambda bot: None)
+
+    with pytest.raises(RuntimeError, match="not logged in"):
+        list(run_latency_benchmark(pool, [workflow], [0]))
+
+
+def test_samples_for_a_logged_in_profile(monkeypatch):
+    monkeypatch.setattr(latency_module, "simulated_latency", _no_latency)
+    workflows = [LatencyWorkflow("noop", lambda bot: None), LatencyWorkflow("boom", lambda bot: 1 / 0)]
+
+    samples = list(run_latency_benchmark(FakePool(_persisted()), workflows, [0, 20], repeats=2))
+
+    assert [(sample.workflow, sample.rtt_ms, sample.repeats) for sample in samples] == [
+        ("noop", 0.0, 2),
+        ("boom", 0.0, 0),
+        ("noop", 20.0, 2),
+        ("boom", 20.0, 0),
+    ]
+    assert samples[1].error == "division by zero"
+    assert samples[0].round_trips == 2
+
+
+def test_sensitivity_slope_counts_round_trips():
+    samples = [
+        LatencySample("chatty", rtt, 0.1 + 10 * rtt / 1000, 10, 3) for rtt in (0.0, 20.0, 40.0, 80.0)
+    ] + [LatencySample("lean", rtt, 0.1 + 2 * rtt / 1000, 2, 3) for rtt in (0.0, 40.0)]
+    samples.append(LatencySample("broken", 0.0, 0.0, 0, 0, "boom"))
+
+    rows = sensitivity(samples)
+
+    assert [row[0] for row in rows] == ["chatty", "lean"]
+    assert rows[0][2] == pytest.approx(10.0)
+    assert rows[1][2] == pytest.approx(2.0)
+
+
+def _options(**overrides) -> argparse.Namespace:
+    values = {"rtt": "0,20", "repeats": 1, "handle": None, "output": None, "throttle_network": False}
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+class FakeSessionPool:
+    def __init__(self, config) -> None:
+        self.config = config
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+def test_cli_exits_non_zero_when_every_sample_failed(monkeypatch, capsys):
+    def all_failed(pool, workflows, rtts, **kwargs):
+        return iter([LatencySample(workflow.name, rtt, 0.0, 0, 0, "boom") for rtt in rtts for workflow in workflows])
+
+    monkeypatch.setattr(main, "SessionPool", FakeSessionPool)
+    monkeypatch.setattr(main, "run_latency_benchmark", all_failed)
+
+    assert main._run_latency_benchmark(_options(), _persisted()) == 1
+    assert "Every latency sample failed" in capsys.readouterr().out
+
+
+def test_cli_reports_a_logged_out_profile(monkeypatch, capsys):
+    def logged_out(pool, workflows, rtts, **kwargs):
+        raise RuntimeError("The benchmark profile is not logged in (landed on LOGIN_USERNAME).")
+
+    monkeypatch.setattr(main, "SessionPool", FakeSessionPool)
+    monkeypatch.setattr(main, "run_latency_benchmark", logged_out)
+
+    assert main._run_latency_benchmark(_options(), _persisted()) == 1
+    assert "[error] The benchmark profile is not logged in" in capsys.readouterr().out
+
+
+def test_cli_requires_a_persisted_profile():
+    with pytest.raises(ValueError, match="--chrome-profile"):
+        main._run_latency_benchmark(_options(), DriverConfig())
+
+
+def test_cli_passes_the_throttle_flag_and_notes_it(monkeypatch, capsys):
+    seen = {}
+
+    def ok(pool, workflows, rtts, **kwargs):
+        seen.update(kwargs)
+        return iter([LatencySample("navigate_home", rtt, 0.1, 3, 1) for rtt in rtts])
+
+    monkeypatch.setattr(main, "SessionPool", FakeSessionPool)
+    monkeypatch.setattr(main, "run_latency_benchmark", ok)
+
+    assert main._run_latency_benchmark(_options(throttle_network=True), _persisted()) == 0
+    assert seen["throttle_network"] is True
+    assert "includes network latency" in capsys.readouterr().out
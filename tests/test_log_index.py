@@ -0,0 +1,84 @@
+"""LogIndex resumes from its sidecar across appends, rotation and truncation."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from weBot.data.log_index import INDEX_NAME, LogIndex
+
+
+def _line(cycle: int, like: bool = True, day: str = "2026-10-19") -> str:
+    return f"{day} 12:00:00,000 [INFO] cycle={cycle} like={like} repost=False\n"
+
+
+def _append(path: Path, text: str) -> None:
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(text)
+
+
+def _update(log_dir: Path):
+    # A fresh instance each time, so every call resumes from the sidecar on disk.
+    return LogIndex(log_dir).update()
+
+
+def test_appends_are_parsed_once_and_partial_lines_wait(tmp_path):
+    log = tmp_path / "session-1.log"
+    _append(log, _line(1) + _line(2, like=False))
+    first = _update(tmp_path)
+    assert (first.cycles, first.bytes_parsed) == (2, log.stat().st_size)
+    assert (tmp_path / INDEX_NAME).exists()
+
+    size = log.stat().st_size
+    _append(log, _line(3) + _line(4)[:20])
+    second = _update(tmp_path)
+    assert second.bytes_parsed == len(_line(3))
+    assert second.cycles == 3
+    assert second.days["2026-10-19"]["like"] == [3, 2]
+
+    _append(log, _line(4)[20:])
+    third = _update(tmp_path)
+    assert third.bytes_parsed == log.stat().st_size - size - len(_line(3))
+    assert third.cycles == 4
+
+    assert _update(tmp_path).bytes_parsed == 0
+
+
+def test_rotated_log_keeps_its_offset(tmp_path):
+    log = tmp_path / "session-1.log"
+    _append(log, _line(1) + _line(2))
+    _update(tmp_path)
+
+    log.rename(tmp_path / "session-1.log.1")
+    _append(log, _line(3))
+    stats = _update(tmp_path)
+
+    assert stats.files == 2
+    assert stats.bytes_parsed == len(_line(3))
+    assert stats.days["2026-10-19"]["like"] == [3, 3]
+
+
+def test_truncated_or_rewritten_log_is_parsed_again(tmp_path):
+    log = tmp_path / "session-1.log"
+    _append(log, _line(1) + _line(2) + _line(3))
+    _update(tmp_path)
+
+    log.write_text(_line(7, like=False), encoding="utf-8")  # shrank below the stored offset
+    stats = _update(tmp_path)
+    assert stats.bytes_parsed == len(_line(7, like=False))
+    assert stats.cycles == 1
+    assert stats.days["2026-10-19"]["like"] == [1, 0]
+
+    # Longer than the stored offset again, but the first bytes changed: also a new file.
+    log.write_text(_line(8, day="2026-10-20") * 3, encoding="utf-8")
+    stats = _update(tmp_path)
+    assert stats.bytes_parsed == 3 * len(_line(8))
+    assert list(stats.days) == ["2026-10-20"]
+
+
+def test_deleted_logs_drop_out_of_the_totals(tmp_path):
+    _append(tmp_path / "session-1.log", _line(1))
+    _append(tmp_path / "session-2.log", _line(1) + _line(2))
+    assert _update(tmp_path).cycles == 3
+
+    (tmp_path / "session-2.log").unlink()
+    stats = _update(tmp_path)
+    assert (stats.files, stats.cycles, stats.bytes_parsed) == (1, 1, 0)
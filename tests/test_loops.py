@@ -0,0 +1,91 @@
+"""LoopManager stops a running script within the 100 ms budget."""
+from __future__ import annotations
+
+import threading
+import time
+
+from weBot.brains.loops import LoopManager
+from weBot.core.actions import timeline
+from weBot.core.actions.utils import random_delay
+from weBot.core.state import PageState
+
+
+class FakeContext:
+    current_state = PageState.HOME_TIMELINE
+
+
+class FakeBot:
+    def __init__(self) -> None:
+        self.loop_manager = LoopManager(self)
+        self.context = FakeContext()
+        self.driver = object()
+        self.seen_posts = None
+        self.store = None
+        self.home_visits = 0
+        self.in_action = threading.Event()
+
+    def ensure_home(self):
+        return PageState.HOME_TIMELINE
+
+    def go_home(self):
+        self.home_visits += 1
+        return PageState.HOME_TIMELINE
+
+    def like_center_post(self) -> bool:
+        self.in_action.set()
+        random_delay(30, 30)  # a long humanised pause inside the action
+        return True
+
+    def repost_center_post(self) -> bool:
+        return True
+
+    def comment_on_center_post(self, text: str) -> bool:
+        return True
+
+    def record_action(self, *args, **kwargs) -> None:
+        pass
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_stop_during_cycle_pause_is_under_100_ms(monkeypatch):
+    monkeypatch.setattr(timeline, "refresh_feed", lambda driver, context: None)
+    bot = FakeBot()
+    # No posts per cycle: the loop goes straight home and into its 2-4 s cycle pause.
+    bot.loop_manager.start("random_engage", posts_per_cycle=0)
+    _wait_for(lambda: bot.home_visits == 1)
+    time.sleep(0.05)
+
+    assert bot.loop_manager.stop(wait=5.0)
+
+    assert not bot.loop_manager.is_running()
+    assert bot.loop_manager.last_stop_latency is not None
+    assert bot.loop_manager.last_stop_latency < 0.1
+
+
+def test_stop_inside_an_action_delay_is_under_100_ms(monkeypatch):
+    monkeypatch.setattr(timeline, "refresh_feed", lambda driver, context: None)
+    monkeypatch.setattr(timeline, "fetch_post", lambda driver, seen=None: {"status_id": 1, "username": "nasa"})
+    monkeypatch.setattr("weBot.brains.loops.random.random", lambda: 0.0)  # always like
+    bot = FakeBot()
+    bot.loop_manager.start("random_engage", posts_per_cycle=1)
+    assert bot.in_action.wait(5)
+    time.sleep(0.05)
+
+    assert bot.loop_manager.stop(wait=5.0)
+
+    assert bot.loop_manager.last_stop_latency is not None
+    assert bot.loop_manager.last_stop_latency < 0.1
+    assert bot.home_visits == 0
+
+
+def test_stop_without_a_loop_reports_nothing_to_stop():
+    manager = LoopManager(FakeBot())
+
+    assert manager.stop() is False
+    assert manager.last_stop_latency is None
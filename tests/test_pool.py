@@ -0,0 +1,223 @@
+"""SessionPool leasing, reset and shutdown against a fake driver."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from weBot.core import pool as pool_module
+from weBot.core.driver import DriverConfig
+from weBot.core.pool import SessionPool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver: "FakeDriver") -> None:
+        self._driver = driver
+
+    def window(self, handle: str) -> None:
+        self._driver.current_handle = handle
+
+
+class FakeDriver:
+    def __init__(self) -> None:
+        self.window_handles = ["main"]
+        self.current_handle = "main"
+        self.urls = {"main": "about:blank"}
+        self.history = {"main": ["about:blank"]}
+        self.cdp_calls = []
+        self.cookies_cleared = 0
+        self.switch_to = FakeSwitchTo(self)
+
+    @property
+    def current_url(self) -> str:
+        return self.urls[self.current_handle]
+
+    def get(self, url: str) -> None:
+        self.urls[self.current_handle] = url
+        self.history[self.current_handle].append(url)
+
+    def open_window(self, handle: str, url: str) -> None:
+        self.window_handles.append(handle)
+        self.urls[handle] = url
+        self.history[handle] = [url]
+
+    def close(self) -> None:
+        self.window_handles.remove(self.current_handle)
+
+    def execute_cdp_cmd(self, method: str, params: dict) -> dict:
+        self.cdp_calls.append((method, params))
+        if method == "Page.getNavigationHistory":
+            entries = self.history[self.current_handle]
+            return {"currentIndex": len(entries) - 1, "entries": [{"url": url} for url in entries]}
+        if method == "Page.resetNavigationHistory":
+            self.history[self.current_handle] = [self.current_url]
+        return {}
+
+    def cleared_origins(self) -> set:
+        return {params["origin"] for method, params in self.cdp_calls if method == "Storage.clearDataForOrigin"}
+
+    def delete_all_cookies(self) -> None:
+        self.cookies_cleared += 1
+
+
+class FakeManager:
+    launched = 0
+    fail_next = False
+
+    def __init__(self, config: DriverConfig) -> None:
+        self.config = config
+        self._driver = None
+        self.quit_calls = 0
+
+    @property
+    def driver(self) -> FakeDriver:
+        if self._driver is None:
+            raise RuntimeError("Driver has not been created yet. Call create() first.")
+        return self._driver
+
+    @property
+    def profile_path(self):
+        return None
+
+    @property
+    def profile_is_persistent(self) -> bool:
+        return False
+
+    def create(self) -> FakeDriver:
+        if self._driver is None:
+            if FakeManager.fail_next:
+                FakeManager.fail_next = False
+                raise RuntimeError("chrome failed to start")
+            FakeManager.launched += 1
+            self._driver = FakeDriver()
+        return self._driver
+
+    def quit(self) -> None:
+        self.quit_calls += 1
+        self._driver = None
+
+
+@pytest.fixture(autouse=True)
+def fake_manager(monkeypatch):
+    FakeManager.launched = 0
+    FakeManager.fail_next = False
+    monkeypatch.setattr(pool_module, "DriverManager", FakeManager)
+    return FakeManager
+
+
+def test_lease_reuses_warm_browser_with_fresh_bot():
+    with SessionPool() as pool:
+        with pool.lease() as first:
+            first_driver = first.driver
+            first.context.attributes["marker"] = "x"
+        with pool.lease() as second:
+            assert second.driver is first_driver
+            assert second is not first
+            assert "marker" not in second.context.attributes
+    assert FakeManager.launched == 1
+
+
+def test_leased_bot_accepts_ephemeral_profile():
+    with SessionPool() as pool:
+        with pool.lease() as bot:
+            bot._require_persisted_profile()  # does not raise
+
+
+def test_reset_closes_extra_windows_and_clears_visited_origins():
+    with SessionPool(clear_cookies=True) as pool:
+        with pool.lease() as bot:
+            driver = bot.driver
+            driver.get("https://twitter.com/home")
+            driver.open_window("popup", "https://example.org/page")
+        assert driver.window_handles == ["main"]
+        assert driver.current_url == "about:blank"
+        assert driver.cleared_origins() == {"https://twitter.com", "https://example.org"}
+        assert driver.cookies_cleared == 1
+
+
+def test_reset_clears_origins_the_lease_navigated_away_from():
+    with SessionPool() as pool:
+        with pool.lease() as bot:
+            driver = bot.driver
+            driver.get("https://example.org/login")
+            driver.get("https://twitter.com/home")
+        assert driver.cleared_origins() == {"https://twitter.com", "https://example.org"}
+
+        driver.cdp_calls.clear()
+        with pool.lease() as bot:
+            bot.driver.get("https://example.net/")
+        # The next lease only clears what it visited itself.
+        assert driver.cleared_origins() == {"https://example.net"}
+
+
+def test_failed_reset_discards_browser():
+    with SessionPool() as pool:
+        with pool.lease() as bot:
+            manager = bot.driver_manager
+            bot.driver.window_handles.clear()  # reset will fail on handles[0]
+        assert manager.quit_calls == 1
+        assert pool.stats()["launched"] == 0
+
+
+def test_failed_launch_frees_the_slot():
+    with SessionPool() as pool:
+        FakeManager.fail_next = True
+        with pytest.raises(RuntimeError):
+            with pool.lease():
+                pass
+        assert pool.stats()["launched"] == 0
+        with pool.lease() as bot:
+            assert bot.driver is not None
+
+
+def test_lease_blocks_until_release_and_times_out():
+    with SessionPool(size=1) as pool:
+        with pool.lease():
+            with pytest.raises(TimeoutError):
+                with pool.lease(timeout=0.05):
+                    pass
+
+
+def test_warm_launches_outside_the_lock():
+    pool = SessionPool(size=2)
+    seen_locked = []
+    original_create = FakeManager.create
+
+    def create(manager):
+        acquired = pool._condition.acquire(blocking=False)
+        seen_locked.append(not acquired)
+        if acquired:
+            pool._condition.release()
+        return original_create(manager)
+
+    FakeManager.create = create
+    try:
+        worker = threading.Thread(target=pool.warm)
+        worker.start()
+        worker.join(timeout=5)
+    finally:
+        FakeManager.create = original_create
+    assert seen_locked == [False, False]
+    assert pool.stats() == {"size": 2, "launched": 2, "idle": 2, "leased": 0}
+    pool.close()
+
+
+def test_close_quits_idle_and_released_browsers():
+    pool = SessionPool(size=2)
+    pool.warm()
+    with pool.lease() as bot:
+        leased_manager = bot.driver_manager
+        (idle_manager,) = pool._idle
+        pool.close()
+        assert idle_manager.quit_calls == 1
+        assert leased_manager.quit_calls == 0
+    assert leased_manager.quit_calls == 1
+    with pytest.raises(RuntimeError):
+        with pool.lease():
+            pass
+
+
+def test_shared_profile_directory_rejected_for_multiple_slots(tmp_path):
+    with pytest.raises(ValueError):
+        SessionPool(DriverConfig(user_data_dir=tmp_path), size=2)
+    SessionPool(DriverConfig(user_data_dir=tmp_path), size=1).close()
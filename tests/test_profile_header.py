@@ -0,0 +1,44 @@
+"""Profile header extraction through the per-field fallbacks (offline pages)."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from weBot.core.offline import HtmlPage
+from weBot.core import selectors
+from weBot.core.selectors import SelectorStats
+from weBot.workflows.profile import read_profile_header
+
+_PAGE = """
+<html><body>
+  <div data-testid="UserName"><span>Ada Lovelace</span><div>@ada</div></div>
+  <div data-testid="UserDescription">Analytical engines.</div>
+  <a href="/ada/following"><span><span>12</span></span></a>
+  <a href="/ada/{followers_path}"><span><span>3,456</span></span></a>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def isolated_selector_stats(tmp_path, monkeypatch):
+    monkeypatch.setattr(selectors, "_STATS", SelectorStats(tmp_path / "selector-stats.json"))
+
+
+@pytest.mark.parametrize("followers_path", ["followers", "verified_followers"])
+def test_followers_count_fallback_accepts_both_links(followers_path):
+    page = HtmlPage(_PAGE.format(followers_path=followers_path), url="https://twitter.com/ada")
+
+    header = read_profile_header(page)
+
+    assert header.followers_count == "3,456"
+    assert header.following_count == "12"
+    assert header.display_name == "Ada Lovelace"
+    assert header.handle == "ada"
+
+
+def test_missing_followers_link_falls_back_to_zero():
+    page = HtmlPage("<html><body><div data-testid='UserName'>Ada</div></body></html>", url="https://twitter.com/ada")
+
+    assert read_profile_header(page).followers_count == "0"
@@ -0,0 +1,67 @@
+"""score_corpus over a JSONL export and a local store."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("vaderSentiment")
+
+from weBot.brains import scoring
+from weBot.brains.scoring import SentimentScorer
+from weBot.data.storage import iter_records, open_record_writer
+from weBot.data.store import LocalStore
+from weBot.workflows.score import score_corpus
+
+POSTS = [
+    {"status_id": 1, "username": "nasa", "tweet_text": "What a GREAT launch!", "link": "https://x.com/nasa/status/1"},
+    {"status_id": 2, "username": "esa", "tweet_text": "Terrible weather, scrubbed again.", "link": "https://x.com/esa/status/2"},
+    {"status_id": 3, "username": "jaxa", "tweet_text": "", "link": "https://x.com/jaxa/status/3"},
+    {"status_id": 4, "username": "isro", "tweet_text": "Orbit reached", "link": "https://x.com/isro/status/4"},
+    {"status_id": 5, "username": "cnsa", "tweet_text": "What a GREAT launch!", "link": "https://x.com/cnsa/status/5"},
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated_scorer(tmp_path, monkeypatch):
+    # Keep the precompiled lexicon out of the working directory.
+    scorer = SentimentScorer(lexicon_cache=tmp_path / "vader-lexicon.pickle")
+    monkeypatch.setattr(scoring, "_scorer", scorer)
+    return scorer
+
+
+def _expected(posts, scorer):
+    return [pytest.approx(score) for score in scorer.score_batch(posts)]
+
+
+def _flatten(chunks):
+    return [row for rows in chunks for row in rows]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scores_jsonl_export_in_input_order(tmp_path, workers, isolated_scorer):
+    path = tmp_path / "posts.jsonl"
+    writer = open_record_writer(path)
+    writer.write_many(POSTS)
+    writer.close()
+
+    chunks = list(score_corpus(iter_records(path), workers=workers, chunk_size=2))
+
+    assert [len(rows) for rows in chunks] == [2, 2, 1]
+    rows = _flatten(chunks)
+    assert [row["status_id"] for row in rows] == [1, 2, 3, 4, 5]
+    assert [row["score"] for row in rows] == _expected(POSTS, isolated_scorer)
+    assert rows[2]["length"] == 0 and rows[2]["sentiment"] == 0.0
+    assert rows[0]["username"] == "nasa" and rows[0]["link"] == POSTS[0]["link"]
+
+
+def test_scores_local_store(tmp_path, isolated_scorer):
+    with LocalStore(tmp_path / "webot.db") as store:
+        store.upsert_posts(POSTS)
+        store.flush()
+        rows = _flatten(score_corpus(store.iter_posts(batch_size=2), workers=1, chunk_size=3))
+
+    assert [row["status_id"] for row in rows] == [1, 2, 3, 4, 5]
+    assert [row["score"] for row in rows] == _expected(POSTS, isolated_scorer)
+
+
+def test_empty_corpus_yields_nothing(tmp_path):
+    assert list(score_corpus(iter([]), workers=2)) == []
@@ -0,0 +1,136 @@
+"""VADER lexicon caching and the SentimentScorer result cache."""
+from __future__ import annotations
+
+import pickle
+import random
+
+import pytest
+
+pytest.importorskip("vaderSentiment")
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from weBot.brains.scoring import SentimentScorer, load_analyzer
+
+_FIXED_SENTENCES = [
+    "",
+    "This is great!",
+    "This is NOT great at all...",
+    "I kinda love it but the ending was terrible :(",
+    "Absolutely the WORST service ever!!!",
+    "meh",
+    "Not bad, not bad at all 😂",
+    "I ❤️ this so much 🎉🎉",
+    "The food was good, but the staff were rude.",
+    "Hardly amazing, though never boring.",
+]
+
+
+@pytest.fixture(scope="module")
+def fresh():
+    return SentimentIntensityAnalyzer()
+
+
+@pytest.fixture(scope="module")
+def cached(tmp_path_factory):
+    path = tmp_path_factory.mktemp("lexicon") / "vader-lexicon.pickle"
+    load_analyzer(path)  # builds and writes the pickle
+    assert path.exists()
+    return load_analyzer(path)  # loads it back without parsing the text files
+
+
+def _random_sentences(fresh, count: int = 2000):
+    rng = random.Random(1234)
+    words = sorted(fresh.lexicon)
+    emojis = sorted(fresh.emojis)
+    fillers = ["the", "but", "not", "very", "really", "!!!", "?", "and", "kind of", "never"]
+    for _ in range(count):
+        tokens = [rng.choice(words) for _ in range(rng.randint(1, 6))]
+        tokens += [rng.choice(fillers) for _ in range(rng.randint(0, 3))]
+        if rng.random() < 0.3:
+            tokens.append(rng.choice(emojis))
+        rng.shuffle(tokens)
+        sentence = " ".join(tokens)
+        yield sentence.upper() if rng.random() < 0.1 else sentence
+
+
+def test_cached_lexicon_matches_package(fresh, cached):
+    assert cached.lexicon == fresh.lexicon
+    assert cached.emojis == fresh.emojis
+
+
+@pytest.mark.parametrize("sentence", _FIXED_SENTENCES)
+def test_polarity_parity_on_fixtures(fresh, cached, sentence):
+    assert cached.polarity_scores(sentence) == fresh.polarity_scores(sentence)
+
+
+def test_polarity_parity_on_random_lexicon_sentences(fresh, cached):
+    mismatches = [
+        sentence
+        for sentence in _random_sentences(fresh)
+        if cached.polarity_scores(sentence) != fresh.polarity_scores(sentence)
+    ]
+    assert mismatches == []
+
+
+def test_stale_pickle_is_rebuilt(tmp_path, fresh):
+    path = tmp_path / "vader-lexicon.pickle"
+    path.write_bytes(pickle.dumps({"fingerprint": "stale", "lexicon": {"great": -4.0}, "emojis": {}}))
+
+    analyzer = load_analyzer(path)
+
+    assert analyzer.lexicon == fresh.lexicon
+    assert pickle.loads(path.read_bytes())["fingerprint"] != "stale"
+
+
+def test_corrupt_pickle_is_rebuilt(tmp_path, fresh):
+    path = tmp_path / "vader-lexicon.pickle"
+    path.write_bytes(b"not a pickle")
+
+    assert load_analyzer(path).lexicon == fresh.lexicon
+
+
+class CountingAnalyzer:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def polarity_scores(self, text):
+        self.calls.append(text)
+        return {"compound": len(text) / 100}
+
+
+def test_lru_evicts_least_recently_used_text():
+    analyzer = CountingAnalyzer()
+    scorer = SentimentScorer(maxsize=2, analyzer=analyzer)
+    scorer.compound("alpha")
+    scorer.compound("beta")
+    scorer.compound("alpha")  # refreshes alpha, so beta is now the oldest
+    scorer.compound("gamma")  # evicts beta
+
+    scorer.compound("alpha")
+    scorer.compound("beta")
+
+    assert analyzer.calls == ["alpha", "beta", "gamma", "beta"]
+    assert scorer.stats()["size"] == 2
+    assert (scorer.hits, scorer.misses) == (2, 4)
+
+
+def test_batch_scores_each_distinct_text_once():
+    analyzer = CountingAnalyzer()
+    scorer = SentimentScorer(analyzer=analyzer)
+    posts = [
+        {"tweet_text": "Great  news"},
+        {"tweet_text": "great news"},
+        {"tweet_text": "bad news"},
+        {},
+    ]
+
+    scores = scorer.score_batch(posts)
+    again = scorer.score_batch(posts, inverse=True)
+
+    assert analyzer.calls == ["great news", "bad news", ""]
+    assert scores[1] == pytest.approx(0.1 * 120 + len("great news") / 6)
+    assert again == [-score for score in scores]
+    stats = scorer.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (5, 3, 3)
+    assert stats["hit_rate"] == pytest.approx(5 / 8)
@@ -0,0 +1,64 @@
+"""SeenPostIndex lookups, compaction and journal recovery."""
+from __future__ import annotations
+
+from weBot.data.seen import SeenPostIndex
+
+
+def test_lookup_spans_the_index_and_the_journal(tmp_path):
+    path = tmp_path / "seen.idx"
+    with SeenPostIndex(path) as index:
+        index.add_many([30, 10, 20])
+    with SeenPostIndex(path) as index:
+        assert index.add(15) is True
+        assert index.add(20) is False
+        assert all(value in index for value in (10, 15, 20, 30))
+        assert 25 not in index
+        assert None not in index
+        assert len(index) == 4
+
+
+def test_compaction_sorts_and_empties_the_journal(tmp_path):
+    path = tmp_path / "seen.idx"
+    index = SeenPostIndex(path, compact_threshold=3)
+    index.add_many([5, 1])
+    assert index.journal_path.stat().st_size > 0
+
+    index.add(3)  # reaches the threshold
+
+    assert index.journal_path.stat().st_size == 0
+    assert all(value in index for value in (1, 3, 5))
+    index.close()
+
+
+def test_reopening_after_compaction(tmp_path):
+    path = tmp_path / "seen.idx"
+    with SeenPostIndex(path) as index:
+        index.add_many(range(100, 0, -1))
+    with SeenPostIndex(path) as index:
+        assert len(index) == 100
+        assert 1 in index and 100 in index and 101 not in index
+        index.add(101)
+    with SeenPostIndex(path) as index:
+        assert 101 in index
+        assert len(index) == 101
+
+
+def test_torn_trailing_record_is_dropped_and_later_ids_stay_aligned(tmp_path):
+    path = tmp_path / "seen.idx"
+    index = SeenPostIndex(path)
+    index.add_many([7, 8])
+    index._journal.close()  # simulate a crash: no compaction on close
+    index._unmap()
+    with index.journal_path.open("ab") as fh:
+        fh.write(b"\x01\x02\x03")  # half-written record
+
+    recovered = SeenPostIndex(path)
+    assert 7 in recovered and 8 in recovered
+    recovered.add(9)
+    recovered._journal.close()
+    recovered._unmap()
+
+    reopened = SeenPostIndex(path)
+    assert {value for value in (7, 8, 9) if value in reopened} == {7, 8, 9}
+    assert len(reopened) == 3
+    reopened.close()
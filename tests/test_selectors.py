@@ -0,0 +1,86 @@
+"""Selector statistics only cover real fallback groups."""
+from __future__ import annotations
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from weBot.core import selectors
+from weBot.core.recognizers import recognize_state
+from weBot.core.selectors import SelectorGroup, SelectorStats, selector_report, set_selector_stats
+from weBot.core.state import PageState
+
+
+class ScriptDriver:
+    """Answers the state probe with a fixed set of present cues."""
+
+    def __init__(self, url: str, present) -> None:
+        self.current_url = url
+        self.present = present
+        self.scripts = 0
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        candidates = args[0]
+        return {
+            "url": self.current_url,
+            "present": [candidate[1] in self.present for candidate in candidates],
+            "alerts": [],
+            "aria_label": "",
+            "aria_labelledby": "",
+            "home_link_displayed": False,
+        }
+
+
+@pytest.fixture
+def stats(tmp_path, monkeypatch):
+    monkeypatch.setattr(selectors, "_GROUPS", {})
+    recorded = SelectorStats(tmp_path / "selector-stats.json")
+    previous = selectors._STATS
+    set_selector_stats(recorded)
+    yield recorded
+    set_selector_stats(previous)
+
+
+def test_recognize_state_probes_once_and_records_nothing(stats):
+    driver = ScriptDriver("https://x.com/nasa", {"div[data-testid='UserName']"})
+
+    snapshot = recognize_state(driver)
+
+    assert snapshot.state is PageState.PROFILE
+    assert driver.scripts == 1
+    assert stats.snapshot() == {}
+    assert selector_report() == []
+
+
+def test_report_flags_dead_candidates_of_a_group(stats):
+    first = (By.CSS_SELECTOR, "[data-testid='a']")
+    second = (By.CSS_SELECTOR, "[data-testid='b']")
+    group = SelectorGroup("compose_button", (first, second))
+
+    group.record([first])
+    group.record([first])
+
+    rows = selector_report()
+    assert ("compose_button", "css selector:[data-testid='a']", 2, 2, "") in rows
+    assert ("compose_button", "css selector:[data-testid='b']", 0, 2, "never hit") in rows
+
+
+class ProfileProbeDriver:
+    def __init__(self, matched) -> None:
+        self.matched = matched
+
+    def execute_script(self, script, *args):
+        return {"display_name": "NASA", "handle": "nasa", "followers_count": "1K", "followers_matched": self.matched}
+
+
+def test_profile_probe_records_every_matching_followers_selector(stats):
+    from weBot.workflows import profile
+
+    group = SelectorGroup("profile_followers_count", profile.FOLLOWERS_COUNT_GROUP.candidates)
+    profile._probe_profile(ProfileProbeDriver([True, True]))
+    profile._probe_profile(ProfileProbeDriver([False, True]))
+
+    hits = {row[1]: (row[2], row[4]) for row in selector_report() if row[0] == group.name}
+    verified, plain = (selectors.selector_key(selector) for selector in group.candidates)
+    assert hits[verified] == (1, "")
+    assert hits[plain] == (2, "")
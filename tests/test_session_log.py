@@ -0,0 +1,59 @@
+"""SessionLog renders messages at the call site and keeps structured fields."""
+from __future__ import annotations
+
+import json
+import logging
+
+from weBot.data.session_log import SessionLog
+
+
+def _read(path):
+    return path.read_text(encoding="utf-8")
+
+
+def test_message_is_rendered_before_args_are_mutated(tmp_path):
+    log = SessionLog("test.session_log.mutation", log_dir=tmp_path)
+    handles = ["alice"]
+    log.logger.info("cycle=%s handles=%s", 1, handles)
+    handles.append("bob")
+    log.close()
+
+    assert "handles=['alice']" in _read(log.text_path)
+    (line,) = _read(log.json_path).splitlines()
+    payload = json.loads(line)
+    assert payload["message"] == "cycle=1 handles=['alice']"
+    assert payload["cycle"] == 1
+
+
+def test_structured_fields_and_actions_survive_the_queue(tmp_path):
+    log = SessionLog("test.session_log.fields", log_dir=tmp_path)
+    log.logger.info("post=%s like=%s", "123", True, extra={"fields": {"cycle": 4}})
+    log.close()
+
+    payload = json.loads(_read(log.json_path))
+    assert payload["post"] == "123"
+    assert payload["action"] == "like"
+    assert payload["success"] is True
+    assert payload["cycle"] == 4
+
+
+def test_exceptions_are_written_to_both_files(tmp_path):
+    log = SessionLog("test.session_log.exc", log_dir=tmp_path)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        log.logger.exception("step=%s failed", "like")
+    log.close()
+
+    assert "ValueError: boom" in _read(log.text_path)
+    payload = json.loads(_read(log.json_path))
+    assert payload["step"] == "like"
+    assert "ValueError: boom" in payload["exc"]
+
+
+def test_close_detaches_the_handler(tmp_path):
+    log = SessionLog("test.session_log.close", log_dir=tmp_path)
+    log.close()
+    log.close()
+
+    assert not logging.getLogger("test.session_log.close").handlers
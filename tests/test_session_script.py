@@ -0,0 +1,126 @@
+"""Session script mode reports commands that fail by return value."""
+from __future__ import annotations
+
+import logging
+import threading
+from types import SimpleNamespace
+
+import main
+from weBot.brains.loops import LoopManager
+
+
+class FakeBot:
+    profile_is_persistent = True
+
+    def __init__(self, *, like: bool = True) -> None:
+        self.loop_manager = LoopManager(self)
+        self.store = None
+        self.likes = 0
+        self._like = like
+
+    def ensure_home(self):
+        return main.PageState.HOME_TIMELINE
+
+    def selected_post_summary(self):
+        return None
+
+    def like_center_post(self) -> bool:
+        self.likes += 1
+        return self._like
+
+
+def _run(bot, lines, tmp_path, *, continue_on_error=False):
+    script = tmp_path / "commands.txt"
+    script.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return main._run_session_script(
+        bot,
+        logging.getLogger("test.session_script"),
+        None,
+        script=str(script),
+        continue_on_error=continue_on_error,
+    )
+
+
+def test_failed_like_stops_a_fail_fast_script(tmp_path, capsys):
+    bot = FakeBot(like=False)
+
+    assert _run(bot, ["like", "like"], tmp_path) is False
+
+    out = capsys.readouterr().out
+    assert bot.likes == 1
+    assert "Stopping script after failure on line 1." in out
+    assert "0 ok, 1 failed" in out
+    assert "command reported failure" in out
+
+
+def test_continue_on_error_runs_every_line(tmp_path, capsys):
+    bot = FakeBot(like=False)
+
+    assert _run(bot, ["like", "help", "like"], tmp_path, continue_on_error=True) is False
+
+    assert bot.likes == 2
+    assert "1 ok, 2 failed" in capsys.readouterr().out
+
+
+def test_successful_commands_are_ok(tmp_path, capsys):
+    bot = FakeBot(like=True)
+
+    assert _run(bot, ["like", "loop list"], tmp_path) is True
+    assert "2 ok, 0 failed" in capsys.readouterr().out
+
+
+def test_refusals_count_as_failures(tmp_path, capsys):
+    bot = FakeBot()
+
+    assert _run(bot, ["store posts", "behaviour reload"], tmp_path, continue_on_error=True) is False
+    out = capsys.readouterr().out
+    assert "--no-store" in out
+    assert "hot-reload is not active" in out
+    assert "0 ok, 2 failed" in out
+
+
+def test_dispatcher_returns_the_navigation_outcome():
+    bot = SimpleNamespace(
+        navigate=lambda url: SimpleNamespace(success=False, next_state=main.PageState.UNKNOWN),
+        context=SimpleNamespace(current_state=main.PageState.UNKNOWN),
+    )
+    options = SimpleNamespace(url="https://twitter.com/home")
+
+    assert main._dispatch_session_command(bot, "navigate", options, logging.getLogger("test")) is False
+
+
+class FakeStore:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def flush(self, timeout=None) -> None:
+        pass
+
+    def query(self, name, *, limit=None, handle=None):
+        assert self.release.wait(5)
+        return ("handle", "posts"), [("nasa", 3)]
+
+
+def test_interactive_store_query_does_not_block_the_prompt(capsys):
+    bot = FakeBot()
+    bot.store = FakeStore()
+    logger = logging.getLogger("test.session_script")
+
+    result = main._run_session_line(bot, "store posts", 1, logger, None, background=True)
+
+    assert result.ok
+    assert "running in the background" in capsys.readouterr().out
+    bot.store.release.set()
+    bot.loop_manager.shutdown()
+    assert "nasa" in capsys.readouterr().out
+
+
+def test_background_failures_are_reported(capsys):
+    bot = FakeBot()
+    bot.store = FakeStore()
+    bot.store.query = lambda *args, **kwargs: (_ for _ in ()).throw(RuntimeError("database is locked"))
+
+    main._run_session_line(bot, "store posts", 1, logging.getLogger("test"), None, background=True)
+    bot.loop_manager.shutdown()
+
+    assert "[store] failed: database is locked" in capsys.readouterr().out
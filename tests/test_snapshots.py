@@ -0,0 +1,94 @@
+"""Snapshot recording must never break state recognition."""
+from __future__ import annotations
+
+import threading
+
+from weBot.core import recognizers
+from weBot.core.state import PageState, StateSnapshot
+from weBot.data.snapshots import SnapshotRecorder, SnapshotStore
+
+
+class PageDriver:
+    def __init__(self, html: str) -> None:
+        self.html = html
+
+    def execute_script(self, script: str, *args: object) -> str:
+        return self.html
+
+
+class BrokenStore:
+    def add(self, html: str, *, url: str, state: str):
+        raise OSError(28, "No space left on device")
+
+
+def test_capture_writes_in_the_background(tmp_path):
+    store = SnapshotStore(tmp_path)
+    recorder = SnapshotRecorder(store)
+    try:
+        assert recorder.capture(PageDriver("<html>a</html>"), url="https://twitter.com/home", state="HOME_TIMELINE")
+        assert recorder.capture(PageDriver("<html>a</html>"), url="https://twitter.com/home", state="HOME_TIMELINE")
+        recorder.flush()
+    finally:
+        recorder.close()
+        store.close()
+    assert (recorder.captured, recorder.stored) == (2, 1)
+
+
+def test_store_errors_are_logged_not_raised(caplog):
+    recorder = SnapshotRecorder(BrokenStore())
+    assert recorder.capture(PageDriver("<html></html>"), url="https://twitter.com/home", state="HOME_TIMELINE")
+    recorder.close()
+    assert recorder.failed == 1
+    assert "No space left" in caplog.text
+
+
+def test_full_queue_drops_instead_of_blocking():
+    release = threading.Event()
+
+    class SlowStore:
+        def add(self, html: str, *, url: str, state: str):
+            release.wait(5)
+            return "digest", True
+
+    recorder = SnapshotRecorder(SlowStore(), max_pending=1)
+    driver = PageDriver("<html></html>")
+    results = [recorder.capture(driver, url="u", state="s") for _ in range(4)]
+    release.set()
+    recorder.close()
+
+    assert results[0] and not results[-1]
+    assert recorder.dropped >= 1
+    assert recorder.captured + recorder.dropped == 4
+
+
+def test_repeated_polls_of_one_page_are_captured_once(monkeypatch):
+    class CountingRecorder:
+        def __init__(self) -> None:
+            self.captures = []
+
+        def capture(self, driver, *, url: str, state: str) -> bool:
+            self.captures.append((url, state))
+            return True
+
+    pages = iter([
+        StateSnapshot(PageState.UNKNOWN, "https://twitter.com/home"),
+        StateSnapshot(PageState.UNKNOWN, "https://twitter.com/home"),
+        StateSnapshot(PageState.HOME_TIMELINE, "https://twitter.com/home"),
+        StateSnapshot(PageState.HOME_TIMELINE, "https://twitter.com/home"),
+        StateSnapshot(PageState.PROFILE, "https://twitter.com/nasa"),
+        StateSnapshot(PageState.HOME_TIMELINE, "https://twitter.com/home"),
+    ])
+    recorder = CountingRecorder()
+    monkeypatch.setattr(recognizers, "_recognize", lambda driver, config: next(pages))
+    monkeypatch.setattr(recognizers, "get_snapshot_recorder", lambda: recorder)
+    driver = PageDriver("<html></html>")
+
+    for _ in range(6):
+        recognizers.recognize_state(driver)
+
+    assert recorder.captures == [
+        ("https://twitter.com/home", "UNKNOWN"),
+        ("https://twitter.com/home", "HOME_TIMELINE"),
+        ("https://twitter.com/nasa", "PROFILE"),
+        ("https://twitter.com/home", "HOME_TIMELINE"),
+    ]
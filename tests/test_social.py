@@ -0,0 +1,199 @@
+"""Follower collection against a scripted, virtualised list page."""
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from weBot.core.actions import social
+
+NODE = shutil.which("node")
+pytestmark = pytest.mark.skipif(NODE is None, reason="node is required to run the collector scripts")
+
+# A minimal DOM for a virtualised follower list, run by node. Like the real
+# list it recycles cell nodes by rewriting their links, and every fifth
+# cell gets its follow button one render after the cell itself appears.
+# Observer callbacks are delivered after each script, as microtasks would be.
+_PAGE = r"""
+const readline = require('readline');
+const vm = require('vm');
+
+const USERS = Number(process.argv[1]);
+const ROW = 100, VIEWPORT = 800, WINDOW = 8;
+const observers = [];
+let records = [];
+
+const parse = (selector) => {
+    const match = /^(\w+)\[([\w-]+)(\^?=)'([^']*)'\]$/.exec(selector);
+    return {tag: match[1], attr: match[2], prefix: match[3] === '^=', value: match[4]};
+};
+
+class Element {
+    constructor(tag, attrs) {
+        this.nodeType = 1;
+        this.tagName = tag;
+        this.attrs = Object.assign({}, attrs);
+        this.children = [];
+    }
+    getAttribute(name) { return name in this.attrs ? this.attrs[name] : null; }
+    setAttribute(name, value) {
+        this.attrs[name] = value;
+        records.push({type: 'attributes', target: this, addedNodes: []});
+    }
+    appendChild(child) {
+        this.children.push(child);
+        records.push({type: 'childList', target: this, addedNodes: [child]});
+        return child;
+    }
+    matches(selector) {
+        const sel = parse(selector);
+        const value = this.getAttribute(sel.attr);
+        return this.tagName === sel.tag && value !== null && (sel.prefix ? value.startsWith(sel.value) : value === sel.value);
+    }
+    querySelectorAll(selector) {
+        const found = [];
+        const walk = (node) => node.children.forEach((child) => {
+            if (child.matches(selector)) found.push(child);
+            walk(child);
+        });
+        walk(this);
+        return found;
+    }
+    querySelector(selector) { return this.querySelectorAll(selector)[0] || null; }
+}
+
+const body = new Element('body', {});
+const root = {scrollTop: 0, clientHeight: VIEWPORT, scrollHeight: USERS * ROW};
+const cells = [];
+let hydrate = [];
+
+const render = () => {
+    hydrate.forEach((cell) => cell.appendChild(new Element('button', {'data-testid': 'UserCell'})));
+    hydrate = [];
+    root.scrollTop = Math.max(0, Math.min(root.scrollTop, root.scrollHeight - root.clientHeight));
+    const first = Math.floor(root.scrollTop / ROW);
+    for (let index = first; index < first + WINDOW && index < USERS; index++) {
+        const slot = index % WINDOW;
+        const href = '/user' + index;
+        let cell = cells[slot];
+        if (!cell) {
+            cell = new Element('div', {'data-testid': 'cellInnerDiv'});
+            cell.appendChild(new Element('a', {href: href}));
+            body.appendChild(cell);
+            cells[slot] = cell;
+        } else if (cell.children[0].getAttribute('href') !== href) {
+            cell.children.splice(1);
+            cell.children[0].setAttribute('href', href);
+        } else {
+            continue;
+        }
+        if (index % 5 === 0) {
+            hydrate.push(cell);
+        } else {
+            cell.appendChild(new Element('button', {'data-testid': 'UserCell'}));
+        }
+    }
+};
+
+const deliver = () => {
+    const pending = records;
+    records = [];
+    observers.forEach((observer) => observer.active && observer.callback(pending.filter((r) => r.type === 'childList')));
+};
+
+class MutationObserver {
+    constructor(callback) { this.callback = callback; this.active = false; }
+    observe() { this.active = true; observers.push(this); }
+    disconnect() { this.active = false; }
+}
+
+const document = {
+    body: body,
+    scrollingElement: root,
+    documentElement: root,
+    querySelectorAll: (selector) => body.querySelectorAll(selector),
+};
+const context = vm.createContext({document: document, MutationObserver: MutationObserver});
+context.window = context;
+
+render();
+records = [];
+readline.createInterface({input: process.stdin}).on('line', (line) => {
+    const call = JSON.parse(line);
+    let reply;
+    try {
+        context.__args = call.args;
+        const value = vm.runInContext('(function () {' + call.script + '\n}).apply(null, __args)', context);
+        reply = {value: value === undefined ? null : value};
+    } catch (error) {
+        reply = {error: String(error)};
+    }
+    deliver();
+    render();
+    deliver();
+    process.stdout.write(JSON.stringify(reply) + '\n');
+});
+"""
+
+
+class ScriptedListDriver:
+    """WebDriver stand-in whose scripts run against the node page."""
+
+    def __init__(self, users: int) -> None:
+        self._node = subprocess.Popen(
+            [NODE, "-e", _PAGE, str(users)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+
+    def find_element(self, by, value):
+        return object()
+
+    def execute_script(self, script: str, *args):
+        self._node.stdin.write(json.dumps({"script": script, "args": list(args)}) + "\n")
+        self._node.stdin.flush()
+        reply = json.loads(self._node.stdout.readline())
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        return reply["value"]
+
+    def quit(self) -> None:
+        self._node.stdin.close()
+        self._node.wait(5)
+
+
+@pytest.fixture
+def scripted_list(monkeypatch):
+    monkeypatch.setattr(social, "random_delay", lambda *args, **kwargs: None)
+    drivers = []
+
+    def make(users: int) -> ScriptedListDriver:
+        drivers.append(ScriptedListDriver(users))
+        return drivers[-1]
+
+    yield make
+    for driver in drivers:
+        driver.quit()
+
+
+def test_collects_recycled_and_late_hydrated_cells(scripted_list):
+    driver = scripted_list(40)
+
+    handles, fully_explored = social.collect_handles_from_modal(driver, scroll_pause=(0, 0), scroll_step=300)
+
+    assert fully_explored
+    assert sorted(handles, key=lambda handle: int(handle[4:])) == [f"user{index}" for index in range(40)]
+
+
+def test_max_count_stops_early(scripted_list):
+    driver = scripted_list(40)
+
+    handles, fully_explored = social.collect_handles_from_modal(
+        driver, max_count=10, scroll_pause=(0, 0), scroll_step=300
+    )
+
+    assert len(handles) == 10
+    assert fully_explored
@@ -0,0 +1,73 @@
+"""TransitionJournal ring buffer and SessionContext attribute handling."""
+from __future__ import annotations
+
+import threading
+
+from weBot.core.state import PageState, SessionContext, TransitionJournal, TransitionReason
+
+CYCLE = [PageState.HOME_TIMELINE, PageState.PROFILE, PageState.SEARCH_RESULTS]
+
+
+def _fill(journal: TransitionJournal, count: int) -> None:
+    previous = PageState.UNKNOWN
+    for index in range(count):
+        state = CYCLE[index % len(CYCLE)]
+        reason = TransitionReason.FAILED if index % 4 == 3 else TransitionReason.NAVIGATION
+        journal.record(previous, state, reason)
+        previous = state
+
+
+def test_ring_wraps_and_evicts_oldest_first():
+    journal = TransitionJournal(capacity=4)
+    _fill(journal, 10)
+
+    assert len(journal) == 4
+    assert journal.total == 10
+    assert journal.failures == 2  # transitions 3 and 7, one of them already evicted
+    entries = list(journal.entries())
+    # Transitions 6..9 survive, oldest first.
+    assert [entry.state for entry in entries] == [CYCLE[index % 3] for index in range(6, 10)]
+    assert [entry.from_state for entry in entries] == [CYCLE[index % 3] for index in range(5, 9)]
+    assert [entry.state for entry in journal.entries(2)] == [CYCLE[8 % 3], CYCLE[9 % 3]]
+    assert [entry.entered_at for entry in entries] == sorted(entry.entered_at for entry in entries)
+    assert all(entry.duration is not None for entry in entries[:-1])
+    assert entries[-1].duration is None
+
+
+def test_time_in_state_covers_evicted_entries():
+    journal = TransitionJournal(capacity=2)
+    _fill(journal, 6)
+
+    totals = journal.time_in_state()
+    assert set(totals) == set(CYCLE)
+
+
+def test_concurrent_records_keep_counters_consistent():
+    journal = TransitionJournal(capacity=16)
+    threads = [threading.Thread(target=_fill, args=(journal, 500)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    snapshots = []
+    while any(thread.is_alive() for thread in threads):
+        snapshots.append(list(journal.entries()))
+    for thread in threads:
+        thread.join()
+
+    assert journal.total == 2000
+    assert len(journal) == 16
+    assert all(len(snapshot) <= 16 for snapshot in snapshots)
+
+
+def test_update_state_replaces_metadata_but_keeps_direct_attributes():
+    context = SessionContext()
+    context.update_state(PageState.PROFILE, handle="alice", post_count="3")
+    assert context.attributes["handle"] == "alice"
+
+    # A direct write claims the key back from the metadata.
+    context.attributes["post_count"] = "12"
+    context.update_state(PageState.HOME_TIMELINE, feed="following")
+
+    assert "handle" not in context.attributes
+    assert context.attributes["post_count"] == "12"
+    assert context.attributes["feed"] == "following"
+    assert context.attributes["login_method"] == "manual"
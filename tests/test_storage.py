@@ -0,0 +1,98 @@
+"""RecordWriter segments, crash recovery and read-back."""
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from weBot.data.storage import RecordWriter, iter_records, open_record_writer, recover_partial_segments
+
+
+def _write(path, records, **options):
+    with open_record_writer(path, **options) as writer:
+        writer.write_many(records)
+    return writer
+
+
+def test_repeated_runs_add_numbered_segments(tmp_path):
+    path = tmp_path / "posts.jsonl"
+    _write(path, [{"id": 1}])
+    second = _write(path, [{"id": 2}])
+
+    assert second.completed == [tmp_path / "posts.1.jsonl"]
+    assert [record["id"] for record in iter_records(path)] == [1, 2]
+
+
+def test_gaps_between_segments_do_not_hide_later_ones(tmp_path):
+    path = tmp_path / "posts.jsonl"
+    _write(path, [{"id": 1}])
+    (tmp_path / "posts.3.jsonl").write_text('{"id": 3}\n', encoding="utf-8")
+
+    assert [record["id"] for record in iter_records(path)] == [1, 3]
+
+
+@pytest.mark.parametrize("name, opener", [("posts.jsonl", open), ("posts.jsonl.gz", gzip.open)])
+def test_orphan_part_is_recovered_without_torn_line(tmp_path, name, opener):
+    path = tmp_path / name
+    _write(path, [{"id": 0}])
+    orphan = tmp_path / name.replace("posts.jsonl", "posts.1.jsonl")
+    part = orphan.with_name(orphan.name + ".part")
+    with opener(part, "wb") as fh:
+        fh.write(b'{"id": 1}\n{"id": 2}\n{"id": 3, "tor')
+
+    # Readers see the complete lines even before a writer recovers the segment.
+    assert [record["id"] for record in iter_records(path)] == [0, 1, 2]
+
+    writer = _write(path, [{"id": 4}])
+
+    assert writer.recovered == [orphan]
+    assert not part.exists()
+    assert writer.completed == [tmp_path / name.replace("posts.jsonl", "posts.2.jsonl")]
+    assert [record["id"] for record in iter_records(path)] == [0, 1, 2, 4]
+
+
+def test_truncated_gzip_part_keeps_decodable_lines(tmp_path):
+    part = tmp_path / "posts.jsonl.gz.part"
+    lines = b"".join(b'{"id": %d}\n' % index for index in range(5000))
+    part.write_bytes(gzip.compress(lines)[:-200])
+
+    recovered = recover_partial_segments(tmp_path / "posts.jsonl.gz")
+
+    assert recovered == [tmp_path / "posts.jsonl.gz"]
+    ids = [record["id"] for record in iter_records(tmp_path / "posts.jsonl.gz")]
+    assert 0 < len(ids) < 5000
+    assert ids == list(range(len(ids)))
+
+
+def test_empty_orphan_part_is_removed(tmp_path):
+    part = tmp_path / "posts.jsonl.part"
+    part.write_text('{"id": 1', encoding="utf-8")
+
+    assert recover_partial_segments(tmp_path / "posts.jsonl") == []
+    assert not part.exists()
+
+
+def test_csv_new_keys_start_a_segment_with_the_wider_header(tmp_path):
+    path = tmp_path / "rows.csv"
+    with RecordWriter(path, flush_every=1) as writer:
+        writer.write({"a": 1})
+        writer.write({"a": 2, "b": 3})
+
+    assert len(writer.completed) == 2
+    rows = list(iter_records(path))
+    assert rows == [{"a": "1"}, {"a": "2", "b": "3"}]
+
+
+def test_csv_keys_within_one_batch_are_merged(tmp_path):
+    path = tmp_path / "rows.csv"
+    writer = _write(path, [{"a": 1}, {"b": 2}])
+
+    assert len(writer.completed) == 1
+    assert list(iter_records(path)) == [{"a": "1", "b": ""}, {"a": "", "b": "2"}]
+
+
+def test_csv_explicit_fieldnames_select_columns(tmp_path):
+    path = tmp_path / "rows.csv"
+    _write(path, [{"a": 1, "b": 2}], fieldnames=["a"])
+
+    assert list(iter_records(path)) == [{"a": "1"}]
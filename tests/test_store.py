@@ -0,0 +1,106 @@
+"""LocalStore write-behind round trips, shutdown flush and overload policy."""
+from __future__ import annotations
+
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from weBot.data.store import LocalStore
+
+POSTS = [
+    {"status_id": 2, "username": "nasa", "tweet_text": "Launch", "link": "https://x.com/nasa/status/2", "likes": 5},
+    {"username": "esa", "tweet_text": "Orbit", "link": "https://x.com/esa/status/3"},
+    {"username": "nobody", "tweet_text": "no id"},
+]
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+@contextmanager
+def _writer_blocked(store: LocalStore):
+    """Hold an exclusive lock so the writer thread stalls on its next transaction."""
+
+    blocker = sqlite3.connect(store.path, isolation_level=None)
+    blocker.execute("BEGIN EXCLUSIVE")
+    try:
+        yield
+    finally:
+        blocker.execute("COMMIT")
+        blocker.close()
+
+
+def test_posts_round_trip_and_repeat_sightings(tmp_path):
+    with LocalStore(tmp_path / "webot.db") as store:
+        assert store.upsert_posts(POSTS) == 2
+        store.upsert_posts(POSTS[:1])
+        store.flush()
+
+        rows = list(store.iter_posts())
+        columns, recent = store.query("posts", handle="@nasa")
+
+    assert [row["status_id"] for row in rows] == [2, 3]
+    assert rows[0]["username"] == "nasa"
+    assert columns[:2] == ["status_id", "username"]
+    assert [(row[0], row[3]) for row in recent] == [(2, 2)]
+
+
+def test_close_flushes_queued_writes(tmp_path):
+    path = tmp_path / "webot.db"
+    store = LocalStore(path)
+    store.record_profile({"handle": "NASA", "display_name": "NASA", "followers": 10, "following": 2})
+    store.record_transition("UNKNOWN", "HOME_TIMELINE", {"url": "https://x.com/home"})
+    store.record_action("like", True, post=POSTS[0], cycle=1, index=0)
+    store.close()
+
+    reopened = LocalStore(path)
+    try:
+        assert reopened.query("profiles")[1][0][0] == "nasa"
+        assert reopened.query("transitions")[1][0][1:3] == ("UNKNOWN", "HOME_TIMELINE")
+        assert reopened.query("actions")[1][0][1:4] == ("like", 1, 1)
+    finally:
+        reopened.close()
+
+
+def test_reads_work_for_paths_with_uri_characters(tmp_path):
+    directory = tmp_path / "odd?dir#50%"
+    with LocalStore(directory / "webot.db") as store:
+        store.upsert_posts(POSTS[:1])
+        store.flush()
+        assert [row["status_id"] for row in store.iter_posts()] == [2]
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    store = LocalStore(tmp_path / "webot.db", max_pending=1)
+    try:
+        with _writer_blocked(store):
+            store.upsert_posts(POSTS[:1])
+            _wait_until(lambda: store._queue.qsize() == 0)  # writer holds the first batch
+            store.upsert_posts(POSTS[1:2])  # fills the queue
+            started = time.perf_counter()
+            store.upsert_posts([{"status_id": 9}])
+            assert time.perf_counter() - started < 0.1
+            assert store.dropped == 1
+        store.flush()
+        assert [row["status_id"] for row in store.iter_posts()] == [2, 3]
+    finally:
+        store.close()
+
+
+def test_a_failing_batch_does_not_take_coalesced_batches_with_it(tmp_path):
+    store = LocalStore(tmp_path / "webot.db")
+    try:
+        with _writer_blocked(store):
+            store.upsert_posts(POSTS[:1])
+            _wait_until(lambda: store._queue.qsize() == 0)
+            store._submit("INSERT INTO missing_table VALUES (?)", [(1,)])
+            store.upsert_posts(POSTS[1:2])
+        store.flush()
+        assert [row["status_id"] for row in store.iter_posts()] == [2, 3]
+        assert store.failed == 1
+    finally:
+        store.close()
@@ -1,5 +1,6 @@
 """Top-level package for the restructured weBot project."""
 
 from .bot import BotController
+from .async_bot import AsyncBotController
 
-__all__ = ["BotController"]
+__all__ = ["AsyncBotController", "BotController"]
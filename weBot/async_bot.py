@@ -0,0 +1,154 @@
+"""asyncio facade over :class:`~weBot.bot.BotController`."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar
+
+from .bot import BotController
+from .core.recognizers import RecognizerConfig, recognize_state
+from .core.state import ActionResult, StateSnapshot
+from .workflows.profile import ProfileData, complete_profile, lookup_cached_profile
+
+if TYPE_CHECKING:  # pragma: no cover - type checking helper without runtime import
+    from .data.cache import ProfileCache
+
+T = TypeVar("T")
+
+
+class AsyncBotController:
+    """Awaitable browser calls for code that overlaps them with local work.
+
+    Every driver-bound call is handed to one dedicated worker thread, so
+    browser commands still run one at a time and in submission order while
+    the event loop stays free for scoring, persistence or log flushing. The
+    worker also takes the bot's ``driver_lock``, which keeps these calls
+    from interleaving with a running loop script or session command.
+    :meth:`run_local` sends work that never touches the driver to the bot's
+    task pool instead.
+
+    Parameters
+    ----------
+    bot:
+        Controller to wrap. When omitted a new one is built from
+        ``bot_kwargs``.
+    bot_kwargs:
+        Passed to :class:`~weBot.bot.BotController` when ``bot`` is omitted.
+    """
+
+    def __init__(self, bot: Optional[BotController] = None, **bot_kwargs: Any) -> None:
+        if bot is not None and bot_kwargs:
+            raise ValueError("Pass either an existing bot or BotController arguments, not both")
+        self.bot = bot or BotController(**bot_kwargs)
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="weBot-driver"
+        )
+
+    async def __aenter__(self) -> "AsyncBotController":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def start(self) -> None:
+        await self._call(self.bot.start)
+
+    async def stop(self) -> None:
+        """Quit the browser and release the worker thread."""
+
+        try:
+            # Not under driver_lock: stop joins the loop thread, which may be waiting for that lock.
+            await self._submit(self.bot.stop)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the worker thread without quitting the browser (e.g. for a pooled bot)."""
+
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Browser calls
+    # ------------------------------------------------------------------
+    async def navigate(self, url: str) -> ActionResult:
+        return await self._call(self.bot.navigate, url)
+
+    async def recognize_state(self, config: Optional[RecognizerConfig] = None) -> StateSnapshot:
+        return await self._call(lambda: recognize_state(self.bot.driver, config))
+
+    async def harvest(self, count: int = 10) -> List[Dict[str, Any]]:
+        """Collect up to ``count`` distinct timeline posts, scrolling between them.
+
+        Each fetch and scroll is a separate call on the worker, so other
+        coroutines run between steps and cancelling the task stops the
+        harvest at the next step.
+        """
+
+        posts: List[Dict[str, Any]] = []
+        keys = set()
+        while len(posts) < count:
+            post = await self._call(self.bot.fetch_center_post)
+            if post:
+                key = post.get("status_id") or post.get("link") or (post.get("username"), post.get("tweet_text"))
+                if key not in keys:
+                    keys.add(key)
+                    posts.append(post)
+                    if len(posts) >= count:
+                        break
+            result = await self._call(self.bot.scroll_feed)
+            if not result.success:
+                break
+        return posts
+
+    async def fetch_profile(
+        self,
+        handle: str,
+        *,
+        descriptive: bool = False,
+        cache: Optional["ProfileCache"] = None,
+        refresh: bool = False,
+    ) -> ProfileData:
+        """Async :func:`~weBot.workflows.profile.fetch_profile`; cache hits never reach the worker.
+
+        The cache is read once on the task pool; only the parts it lacks are
+        scraped on the worker.
+        """
+
+        cached = await self.run_local(
+            lookup_cached_profile, handle, descriptive=descriptive, cache=cache, refresh=refresh
+        )
+        if not cached.needs_browser:
+            return complete_profile(self.bot, cached, cache=cache)
+        return await self._call(complete_profile, self.bot, cached, cache=cache)
+
+    # ------------------------------------------------------------------
+    # Local work
+    # ------------------------------------------------------------------
+    async def run_local(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run CPU or disk work on the bot's task pool and await its result."""
+
+        name = getattr(func, "__name__", "task")
+        return await asyncio.wrap_future(self.bot.loop_manager.run_task(name, func, *args, **kwargs))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    async def _call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        driver_lock = self.bot.loop_manager.driver_lock
+
+        def locked() -> T:
+            with driver_lock:
+                return func(*args, **kwargs)
+
+        return await self._submit(locked)
+
+    async def _submit(self, func: Callable[[], T]) -> T:
+        if self._executor is None:
+            raise RuntimeError("AsyncBotController is closed")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
@@ -3,17 +3,21 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from .brains.loops import LoopManager
 from .core.actions import navigation, timeline
-from .core.actions.utils import random_delay
+from .core.actions.utils import cancellable_sleep, random_delay
 from .core.driver import DriverConfig, DriverManager, validate_profile_name
 from .core.recognizers import recognize_state
 from .core.state import ActionResult, PageState, SessionContext
 
+if TYPE_CHECKING:  # pragma: no cover - type checking helper without runtime import
+    from .data.seen import SeenPostIndex
+    from .data.store import LocalStore
+
 
 class BotController:
     """Entry point for interacting with Twitter/X via Selenium."""
@@ -24,11 +28,18 @@ class BotController:
         login_url: str = "https://twitter.com/login",
         home_url: str = "https://twitter.com/home",
         driver_config: Optional[DriverConfig] = None,
+        driver_manager: Optional[DriverManager] = None,
+        allow_ephemeral_profile: bool = False,
     ):
+        if driver_manager is not None and driver_config is not None:
+            raise ValueError("Pass either driver_config or driver_manager, not both")
         self.context = SessionContext(login_url=login_url, home_url=home_url)
-        self.driver_manager = DriverManager(driver_config)
+        self.driver_manager = driver_manager or DriverManager(driver_config)
+        self.allow_ephemeral_profile = allow_ephemeral_profile
         self._driver: Optional[WebDriver] = None
         self.loop_manager = LoopManager(self)
+        self.store: Optional["LocalStore"] = None
+        self.seen_posts: Optional["SeenPostIndex"] = None
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -51,11 +62,32 @@ class BotController:
         self._driver = self.driver_manager.create()
 
     def stop(self) -> None:
-        if self.loop_manager.is_running():
-            self.loop_manager.stop(wait=5.0)
+        self.loop_manager.shutdown(wait=5.0)
         self.driver_manager.quit()
         self._driver = None
 
+    def detach(self) -> None:
+        """Stop background work and drop the driver reference without quitting Chrome.
+
+        Used by :class:`~weBot.core.pool.SessionPool` to hand a warm browser
+        back to the pool.
+        """
+
+        self.loop_manager.shutdown(wait=5.0)
+        self._driver = None
+
+    def attach_store(self, store: "LocalStore") -> None:
+        """Record page-state transitions, harvested posts and action outcomes in ``store``."""
+
+        self.store = store
+        self.context.listeners.append(
+            lambda previous, current, attributes: store.record_transition(previous.name, current.name, attributes)
+        )
+
+    def record_action(self, action: str, success: bool, *, post: Optional[dict] = None, **extra: object) -> None:
+        if self.store is not None:
+            self.store.record_action(action, success, post=post, **extra)
+
     # ------------------------------------------------------------------
     # Login workflow (manual only)
     # ------------------------------------------------------------------
@@ -135,13 +167,13 @@ class BotController:
                 return snapshot.state
             if deadline is not None and time.time() >= deadline:
                 raise RuntimeError("Manual login timed out before reaching the home timeline.")
-            time.sleep(poll_interval)
+            cancellable_sleep(poll_interval)
 
     # ------------------------------------------------------------------
     # Navigation helpers
     # ------------------------------------------------------------------
     def _require_persisted_profile(self) -> None:
-        if not self.profile_is_persistent:
+        if not self.profile_is_persistent and not self.allow_ephemeral_profile:
             raise RuntimeError(
                 "A saved Chrome profile is required. Run manual_login() first and reuse the persisted profile."
             )
@@ -181,7 +213,7 @@ class BotController:
 
     def fetch_center_post(self):
         self._require_persisted_profile()
-        return timeline.fetch_post(self.driver)
+        return timeline.fetch_post(self.driver, seen=self.seen_posts)
 
     def like_center_post(self) -> bool:
         self._require_persisted_profile()
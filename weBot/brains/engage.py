@@ -1,26 +1,260 @@
 """High-level routines for engaging with timeline content."""
 from __future__ import annotations
 
+import logging
+import queue
+import threading
 import time
-from typing import Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from ..config.behaviour import get_behaviour_settings
 from ..core.state import ActionResult
 from ..core.actions import timeline
+from ..core.actions.utils import cancellable_sleep
 from .policy import InteractionTracker, choose_actions, execute_actions
+from .scoring import get_scorer
 
+if TYPE_CHECKING:  # pragma: no cover - type checking helper without runtime import
+    from ..data.storage import RecordWriter
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+@dataclass
+class StageCounter:
+    """Throughput bookkeeping for one pipeline stage."""
+
+    name: str
+    items: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    max_backlog: int = 0
+
+    @property
+    def rate(self) -> float:
+        return self.items / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+    def describe(self) -> str:
+        return (
+            f"{self.name} {self.items} item(s) ({self.rate:.1f}/s busy, "
+            f"{self.blocked_seconds:.2f}s blocked, max backlog {self.max_backlog})"
+        )
+
+
+class FeedPipeline:
+    """Score and persist harvested posts off the driver thread.
+
+    The driver thread hands posts to :meth:`submit`; a pool of scoring
+    threads scores them in batches and a single writer thread streams them
+    to the export sink, the local store and the seen-post index. Stages are
+    joined by bounded queues, so a slow disk or scorer eventually blocks
+    ``submit`` (backpressure) instead of growing memory.
+
+    Parameters
+    ----------
+    bot:
+        Controller whose ``store`` and ``seen_posts`` receive the posts.
+    sink:
+        Optional ``RecordWriter`` for every harvested post.
+    score_workers:
+        Number of scoring threads.
+    queue_size:
+        Capacity of each inter-stage queue.
+    persist_batch:
+        Posts buffered by the writer before a store upsert.
+    """
+
+    def __init__(
+        self,
+        bot,
+        *,
+        sink: Optional["RecordWriter"] = None,
+        score_workers: int = 1,
+        queue_size: int = 32,
+        persist_batch: int = 20,
+    ) -> None:
+        self.bot = bot
+        self.sink = sink
+        self.persist_batch = max(1, int(persist_batch))
+        self.counters = {name: StageCounter(name) for name in ("harvest", "score", "persist")}
+        self._score_queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._persist_queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._errors: List[BaseException] = []
+        self._lock = threading.Lock()
+        self._scorers = [
+            threading.Thread(target=self._score_stage, name=f"weBot-score-{index}", daemon=True)
+            for index in range(max(1, int(score_workers)))
+        ]
+        self._writer = threading.Thread(target=self._persist_stage, name="weBot-persist", daemon=True)
+        for thread in (*self._scorers, self._writer):
+            thread.start()
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Driver-thread API
+    # ------------------------------------------------------------------
+    def submit(self, post: Dict[str, Any], *, harvest_seconds: float = 0.0) -> None:
+        """Queue a harvested post, blocking while the scoring stage is saturated."""
+
+        self._raise_errors()
+        counter = self.counters["harvest"]
+        counter.items += 1
+        counter.busy_seconds += harvest_seconds
+        self._put(self._score_queue, post, counter)
+
+    def close(self) -> None:
+        """Drain every stage and re-raise the first worker error, if any."""
+
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._scorers:
+            self._score_queue.put(_STOP)
+        for thread in self._scorers:
+            thread.join()
+        self._persist_queue.put(_STOP)
+        self._writer.join()
+        self._raise_errors()
+
+    def describe_stats(self) -> str:
+        return "Pipeline: " + "; ".join(counter.describe() for counter in self.counters.values())
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+    def _score_stage(self) -> None:
+        counter = self.counters["score"]
+        scorer = get_scorer()
+        running = True
+        while running:
+            batch = [self._score_queue.get()]
+            while len(batch) < 32:
+                try:
+                    batch.append(self._score_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _STOP in batch:
+                # Leave any remaining sentinels for sibling scorers.
+                for _ in range(batch.count(_STOP) - 1):
+                    self._score_queue.put(_STOP)
+                batch = [item for item in batch if item is not _STOP]
+                running = False
+            if not batch:
+                continue
+            started = time.perf_counter()
+            try:
+                unscored = [post for post in batch if "score" not in post]
+                for post, score in zip(unscored, scorer.score_batch(unscored)):
+                    post["score"] = score
+            except BaseException as exc:  # pragma: no cover - surfaced by close()
+                self._record_error(exc)
+            with self._lock:
+                counter.items += len(batch)
+                counter.busy_seconds += time.perf_counter() - started
+            for post in batch:
+                self._put(self._persist_queue, post, counter)
+
+    def _persist_stage(self) -> None:
+        counter = self.counters["persist"]
+        pending: List[Dict[str, Any]] = []
+        while True:
+            item = self._persist_queue.get()
+            if item is not _STOP:
+                pending.append(item)
+            if pending and (item is _STOP or len(pending) >= self.persist_batch or self._persist_queue.empty()):
+                started = time.perf_counter()
+                try:
+                    self._persist(pending)
+                except BaseException as exc:  # pragma: no cover - surfaced by close()
+                    self._record_error(exc)
+                counter.items += len(pending)
+                counter.busy_seconds += time.perf_counter() - started
+                pending = []
+            if item is _STOP:
+                return
+
+    def _persist(self, posts: List[Dict[str, Any]]) -> None:
+        if self.sink is not None:
+            self.sink.write_many(posts)
+        if self.bot.store is not None:
+            self.bot.store.upsert_posts(posts)
+        if self.bot.seen_posts is not None:
+            self.bot.seen_posts.add_many(post.get("status_id") for post in posts)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _put(self, target: "queue.Queue[Any]", item: Any, counter: StageCounter) -> None:
+        backlog = target.qsize()
+        started = time.perf_counter()
+        target.put(item)
+        with self._lock:
+            counter.blocked_seconds += time.perf_counter() - started
+            counter.max_backlog = max(counter.max_backlog, backlog + 1)
+
+    def _record_error(self, exc: BaseException) -> None:
+        with self._lock:
+            self._errors.append(exc)
+
+    def _raise_errors(self) -> None:
+        with self._lock:
+            if self._errors:
+                raise RuntimeError(f"Feed pipeline stage failed: {self._errors[0]}") from self._errors[0]
+
+
+def process_feed(
+    bot,
+    *,
+    posts: int = 10,
+    tracker: Optional[InteractionTracker] = None,
+    sink: Optional["RecordWriter"] = None,
+    read_only: bool = False,
+    score_workers: int = 1,
+    queue_size: int = 32,
+) -> FeedPipeline:
+    """Engage with ``posts`` timeline posts, optionally streaming each harvested post to ``sink``.
+
+    Scoring for export and persistence happen on a :class:`FeedPipeline`, so
+    the driver thread only harvests and acts. With ``read_only`` no actions
+    are taken and the driver never waits on scoring.
+    """
 
-def process_feed(bot, *, posts: int = 10, tracker: Optional[InteractionTracker] = None) -> None:
     tracker = tracker or InteractionTracker()
     settings = get_behaviour_settings()
+    scorer = get_scorer()
+    pipeline = FeedPipeline(bot, sink=sink, score_workers=score_workers, queue_size=queue_size)
+    # Ids handled in this run; the seen index itself is updated by the writer stage.
+    handled = set()
 
-    for _ in range(posts):
-        post = timeline.fetch_post(bot.driver)
-        if post:
-            actions = choose_actions(bot, post, tracker)
-            execute_actions(bot, actions)
-        result: ActionResult = timeline.scroll(bot.driver, bot.context)
-        timeline.refresh_feed(bot.driver, bot.context)
-        if not result.success:
-            break
-        time.sleep(settings.post_pause_seconds)
+    try:
+        for index in range(1, posts + 1):
+            started = time.perf_counter()
+            post = timeline.fetch_post(bot.driver, seen=bot.seen_posts)
+            harvest_seconds = time.perf_counter() - started
+            if post and not post.get("seen") and post.get("status_id") not in handled:
+                if post.get("status_id") is not None:
+                    handled.add(post["status_id"])
+                if not read_only:
+                    # Decisions need the score before scrolling on; the shared cache makes this cheap.
+                    post["score"] = scorer.score(post)
+                    actions = choose_actions(bot, post, tracker, score=post["score"])
+                    for name, success in execute_actions(bot, actions):
+                        bot.record_action(name, success, post=post, index=index)
+                pipeline.submit(post, harvest_seconds=harvest_seconds)
+            result: ActionResult = timeline.scroll(bot.driver, bot.context)
+            timeline.refresh_feed(bot.driver, bot.context)
+            if not result.success:
+                break
+            cancellable_sleep(settings.post_pause_seconds)
+    except BaseException:
+        # Still drain what was harvested, but never let a close error mask the original one.
+        try:
+            pipeline.close()
+        except Exception:
+            logger.exception("Feed pipeline failed while closing after an earlier error")
+        raise
+    pipeline.close()
+    return pipeline
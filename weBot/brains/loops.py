@@ -5,11 +5,13 @@ import logging
 import random
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, TypeVar
 
 from ..config.behaviour import get_behaviour_settings
 from ..core.actions import timeline
+from ..core.actions.utils import CancellationToken, OperationCancelled, cancellation_scope
 from ..core.state import ActionResult
 
 if TYPE_CHECKING:  # pragma: no cover - type checking helper without runtime import
@@ -18,6 +20,7 @@ else:  # Fallback for runtime when annotations are not evaluated
     BotController = Any  # type: ignore[invalid-name]
 
 ScriptFunction = Callable[[Any, threading.Event, logging.Logger, Dict[str, object]], None]
+T = TypeVar("T")
 
 
 PRESET_COMMENTS = (
@@ -46,6 +49,29 @@ def _log_post(logger: logging.Logger, cycle: int, index: int, post: dict) -> Non
     logger.info("cycle=%s post=%s author=%s text=%s", cycle, index, username, text or "<no text>")
 
 
+def _log_action(
+    logger: logging.Logger,
+    bot: "BotController",
+    cycle: int,
+    index: int,
+    action: str,
+    success: bool,
+    started: float,
+    *,
+    text: Optional[str] = None,
+) -> None:
+    """Log an action outcome; latency and page state go to the structured log only."""
+
+    template = "cycle=%s post=%s " + action + "=%s" + (" text=%s" if text is not None else "")
+    args = (cycle, index, success) + ((text,) if text is not None else ())
+    state = bot.context.current_state
+    fields = {
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+        "state": state.name if state is not None else None,
+    }
+    logger.info(template, *args, extra={"fields": fields})
+
+
 def random_engage_loop(
     bot: "BotController",
     stop_event: threading.Event,
@@ -59,10 +85,6 @@ def random_engage_loop(
     min_delay = float(options.get("min_delay", 0.8))
     max_delay = float(options.get("max_delay", 1.6))
 
-    behaviour = get_behaviour_settings()
-    loop_error_pause = behaviour.loop_error_pause
-    cycle_pause_min, cycle_pause_max = behaviour.loop_cycle_pause.as_tuple()
-
     logger.info(
         "random_engage loop starting (posts_per_cycle=%s iteration_limit=%s)",
         posts_per_cycle,
@@ -71,53 +93,71 @@ def random_engage_loop(
 
     cycle = 0
     consecutive_errors = 0
+    driver_lock = bot.loop_manager.driver_lock
 
     while not stop_event.is_set():
         cycle += 1
+        # Re-read each cycle so a hot-reloaded behaviour config applies to the running loop.
+        behaviour = get_behaviour_settings()
+        loop_error_pause = behaviour.loop_error_pause
+        cycle_pause_min, cycle_pause_max = behaviour.loop_cycle_pause.as_tuple()
         try:
-            bot.ensure_home()
-            timeline.refresh_feed(bot.driver, bot.context)
+            with driver_lock:
+                bot.ensure_home()
+                timeline.refresh_feed(bot.driver, bot.context)
         except Exception as exc:  # pragma: no cover - defensive logging
             consecutive_errors += 1
             logger.exception("failed to prepare home timeline: %s", exc)
             if consecutive_errors >= 3:
                 logger.error("aborting random_engage loop after repeated setup failures")
                 break
-            time.sleep(loop_error_pause)
+            stop_event.wait(loop_error_pause)
             continue
 
         consecutive_errors = 0
         processed = 0
+        harvested = []
         while processed < posts_per_cycle and not stop_event.is_set():
             processed += 1
-            post = timeline.fetch_post(bot.driver)
-            if post:
-                _log_post(logger, cycle, processed, post)
-                if random.random() < 0.30:
-                    success = bot.like_center_post()
-                    logger.info("cycle=%s post=%s like=%s", cycle, processed, success)
-                if not stop_event.is_set() and random.random() < 0.20:
-                    success = bot.repost_center_post()
-                    logger.info("cycle=%s post=%s repost=%s", cycle, processed, success)
-                if not stop_event.is_set() and random.random() < 0.10:
-                    comment_text = random.choice(PRESET_COMMENTS)
-                    success = bot.comment_on_center_post(comment_text)
-                    logger.info(
-                        "cycle=%s post=%s comment=%s text=%s",
-                        cycle,
-                        processed,
-                        success,
-                        comment_text,
-                    )
-
-            result: ActionResult = bot.scroll_feed()
+            # Hold the driver only for the browser work; delays below run unlocked.
+            with driver_lock:
+                post = timeline.fetch_post(bot.driver, seen=bot.seen_posts)
+                if post and post.get("seen"):
+                    logger.info("cycle=%s post=%s skipped=seen status_id=%s", cycle, processed, post["status_id"])
+                elif post:
+                    harvested.append(post)
+                    _log_post(logger, cycle, processed, post)
+                    if random.random() < 0.30:
+                        started = time.perf_counter()
+                        success = bot.like_center_post()
+                        _log_action(logger, bot, cycle, processed, "like", success, started)
+                        bot.record_action("like", success, post=post, cycle=cycle, index=processed)
+                    if not stop_event.is_set() and random.random() < 0.20:
+                        started = time.perf_counter()
+                        success = bot.repost_center_post()
+                        _log_action(logger, bot, cycle, processed, "repost", success, started)
+                        bot.record_action("repost", success, post=post, cycle=cycle, index=processed)
+                    if not stop_event.is_set() and random.random() < 0.10:
+                        comment_text = random.choice(PRESET_COMMENTS)
+                        started = time.perf_counter()
+                        success = bot.comment_on_center_post(comment_text)
+                        _log_action(logger, bot, cycle, processed, "comment", success, started, text=comment_text)
+                        bot.record_action(
+                            "comment", success, post=post, cycle=cycle, index=processed, detail=comment_text
+                        )
+                    if bot.seen_posts is not None:
+                        bot.seen_posts.add(post["status_id"])
+
+                result: ActionResult = bot.scroll_feed()
             if not result.success:
                 logger.warning(
                     "cycle=%s post=%s scroll failed: %s",
                     cycle,
                     processed,
                     result.message or "unknown error",
+                    extra={"fields": {"action": "scroll", "success": False}},
                 )
+                bot.record_action("scroll", False, cycle=cycle, index=processed, detail=result.message)
                 stop_event.wait(loop_error_pause)
                 break
 
@@ -125,6 +165,9 @@ def random_engage_loop(
             if stop_event.wait(random.uniform(min_delay, max_delay)):
                 break
 
+        if bot.store is not None and harvested:
+            bot.store.upsert_posts(harvested)
+
         if iteration_limit is not None and cycle >= iteration_limit:
             logger.info("random_engage loop completed iteration_limit=%s", iteration_limit)
             break
@@ -133,10 +176,11 @@ def random_engage_loop(
             break
 
         try:
-            bot.go_home()
+            with driver_lock:
+                bot.go_home()
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.warning("cycle=%s failed to reset home timeline: %s", cycle, exc)
-            time.sleep(loop_error_pause)
+            stop_event.wait(loop_error_pause)
 
         if stop_event.wait(random.uniform(cycle_pause_min, cycle_pause_max)):
             break
@@ -162,15 +206,72 @@ SCRIPT_REGISTRY: Dict[str, ScriptDefinition] = {
 }
 
 
+class DriverLock:
+    """Re-entrant lock that serialises WebDriver access and records contention."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._stats_lock = threading.Lock()
+        self._holder: Optional[str] = None
+        self._depth = 0
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_seconds = 0.0
+
+    def __enter__(self) -> "DriverLock":
+        started = time.perf_counter()
+        contended = not self._lock.acquire(blocking=False)
+        if contended:
+            self._lock.acquire()
+        waited = time.perf_counter() - started
+        self._depth += 1
+        self._holder = threading.current_thread().name
+        with self._stats_lock:
+            self.acquisitions += 1
+            self.contended += int(contended)
+            self.wait_seconds += waited
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._depth -= 1
+        if not self._depth:
+            self._holder = None
+        self._lock.release()
+
+    @property
+    def holder(self) -> Optional[str]:
+        return self._holder
+
+    def stats(self) -> Dict[str, object]:
+        with self._stats_lock:
+            return {
+                "holder": self._holder,
+                "acquisitions": self.acquisitions,
+                "contended": self.contended,
+                "wait_seconds": self.wait_seconds,
+            }
+
+
 class LoopManager:
-    """Coordinate background execution of long-running scripts."""
+    """Coordinate background scripts, browser access and local background tasks.
+
+    At most one loop script drives the browser at a time. Every browser step
+    (from loop scripts or session commands) runs under :attr:`driver_lock`,
+    while CPU and disk work that never touches the driver runs on a small
+    thread pool via :meth:`run_task` and can proceed alongside a loop.
+    """
 
-    def __init__(self, bot: "BotController") -> None:
+    def __init__(self, bot: "BotController", *, task_workers: int = 2) -> None:
         self._bot = bot
         self._lock = threading.Lock()
         self._thread: Optional[threading.Thread] = None
         self._stop_event: Optional[threading.Event] = None
         self._active_script: Optional[ScriptDefinition] = None
+        self.driver_lock = DriverLock()
+        self.last_stop_latency: Optional[float] = None
+        self._task_workers = max(1, int(task_workers))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._task_stats = {"submitted": 0, "running": 0, "completed": 0, "failed": 0, "wait_seconds": 0.0, "run_seconds": 0.0}
 
     # ------------------------------------------------------------------
     # Script registry accessors
@@ -222,8 +323,12 @@ class LoopManager:
             log = logger or logging.getLogger(f"webot.loop.{definition.name}")
 
             def runner() -> None:
+                # Every delay and wait inside the script observes stop_event via this token.
                 try:
-                    definition.func(self._bot, stop_event, log, options)
+                    with cancellation_scope(CancellationToken(stop_event)):
+                        definition.func(self._bot, stop_event, log, options)
+                except OperationCancelled:
+                    log.info("Loop script '%s' cancelled mid-action", definition.name)
                 except Exception:  # pragma: no cover - background safety
                     log.exception("Loop script '%s' terminated due to an unexpected error", definition.name)
                 finally:
@@ -249,13 +354,77 @@ class LoopManager:
         if not thread or not event:
             return False
 
+        self.last_stop_latency = None
+        requested = time.perf_counter()
         event.set()
         if wait is not None:
             thread.join(timeout=wait)
+            if not thread.is_alive():
+                self.last_stop_latency = time.perf_counter() - requested
         return True
 
     def status(self) -> Dict[str, object]:
         with self._lock:
             running = self._thread.is_alive() if self._thread else False
             script = self._active_script.name if self._active_script else None
-        return {"running": running, "script": script}
\ No newline at end of file
+        return {"running": running, "script": script}
+
+    # ------------------------------------------------------------------
+    # Background tasks
+    # ------------------------------------------------------------------
+    def run_task(self, name: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Run CPU/disk work that must not touch the driver on the task pool."""
+
+        queued_at = time.perf_counter()
+
+        def wrapper() -> T:
+            started = time.perf_counter()
+            with self._lock:
+                self._task_stats["running"] += 1
+                self._task_stats["wait_seconds"] += started - queued_at
+            failed = False
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                with self._lock:
+                    self._task_stats["running"] -= 1
+                    self._task_stats["failed" if failed else "completed"] += 1
+                    self._task_stats["run_seconds"] += time.perf_counter() - started
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._task_workers, thread_name_prefix="weBot-task")
+            self._task_stats["submitted"] += 1
+            executor = self._executor
+        return executor.submit(wrapper)
+
+    def scheduler_stats(self) -> Dict[str, object]:
+        with self._lock:
+            tasks = dict(self._task_stats)
+        finished = tasks["completed"] + tasks["failed"]
+        tasks["queued"] = tasks["submitted"] - finished - tasks["running"]
+        tasks["avg_wait_ms"] = 1000 * tasks["wait_seconds"] / (finished + tasks["running"]) if finished + tasks["running"] else 0.0
+        return {"driver": self.driver_lock.stats(), "tasks": tasks}
+
+    def describe_scheduler(self) -> str:
+        stats = self.scheduler_stats()
+        driver, tasks = stats["driver"], stats["tasks"]
+        return (
+            f"Driver lock: held by {driver['holder'] or 'nobody'}, {driver['acquisitions']} acquisition(s), "
+            f"{driver['contended']} contended, {driver['wait_seconds']:.2f}s waited\n"
+            f"Tasks: {tasks['running']} running, {tasks['queued']} queued, {tasks['completed']} completed, "
+            f"{tasks['failed']} failed, avg queue wait {tasks['avg_wait_ms']:.1f} ms"
+        )
+
+    def shutdown(self, *, wait: float | None = 5.0) -> None:
+        """Stop the active loop and the task pool."""
+
+        if self.is_running():
+            self.stop(wait=wait)
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
\ No newline at end of file
@@ -4,7 +4,7 @@ from __future__ import annotations
 import random
 from collections import deque
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
 
 from ..core.actions import timeline
 from .scoring import calculate_post_score
@@ -36,8 +36,9 @@ class InteractionTracker:
         return random.random() < 0.4
 
 
-def choose_actions(bot, post: dict, tracker: InteractionTracker) -> List[str]:
-    score = calculate_post_score(post)
+def choose_actions(bot, post: dict, tracker: InteractionTracker, *, score: Optional[float] = None) -> List[str]:
+    if score is None:
+        score = calculate_post_score(post)
     if not tracker.should_interact() or score < 30:
         tracker.add(False)
         return []
@@ -57,15 +58,20 @@ def choose_actions(bot, post: dict, tracker: InteractionTracker) -> List[str]:
     return actions
 
 
-def execute_actions(bot, actions: Iterable[str]) -> None:
+def execute_actions(bot, actions: Iterable[str]) -> List[Tuple[str, bool]]:
+    outcomes: List[Tuple[str, bool]] = []
     for name in actions:
         if name == "like":
-            timeline.like(bot.driver)
+            success = timeline.like(bot.driver)
         elif name == "bookmark":
-            timeline.bookmark(bot.driver)
+            success = timeline.bookmark(bot.driver)
         elif name in {"reply", "comment"}:
-            timeline.comment(bot.driver, "Thanks for sharing this!")
+            success = timeline.comment(bot.driver, "Thanks for sharing this!")
         elif name == "repost":
-            timeline.repost(bot.driver)
+            success = timeline.repost(bot.driver)
         elif name == "quote":
-            timeline.quote(bot.driver, "Worth a share!")
+            success = timeline.quote(bot.driver, "Worth a share!")
+        else:
+            continue
+        outcomes.append((name, success))
+    return outcomes
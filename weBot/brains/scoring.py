@@ -1,18 +1,234 @@
 """Content scoring helpers powered by Vader sentiment."""
 from __future__ import annotations
 
-from typing import Dict
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
 
+from vaderSentiment import vaderSentiment as _vader
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
-_analyzer = SentimentIntensityAnalyzer()
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEXICON_CACHE = Path(".webot/cache/vader-lexicon.pickle")
+
+_LEXICON_FORMAT = 1
+_LEXICON_FILES = ("vader_lexicon.txt", "emoji_utf8_lexicon.txt")
+
+
+def _lexicon_fingerprint() -> str:
+    """Hash identifying the installed vaderSentiment lexicon files.
+
+    Built from file metadata rather than contents so validating the cache
+    never reads the text files it replaces.
+    """
+
+    package_dir = Path(_vader.__file__).resolve().parent
+    digest = hashlib.sha256(f"format={_LEXICON_FORMAT}".encode())
+    for name in _LEXICON_FILES:
+        stat = (package_dir / name).stat()
+        digest.update(f"|{name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _write_lexicon_cache(path: Path, payload: Dict[str, object]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}-", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_analyzer(cache_path: Optional[Path] = None) -> SentimentIntensityAnalyzer:
+    """Build a VADER analyser from a precompiled lexicon, generating it when stale.
+
+    ``SentimentIntensityAnalyzer()`` parses two text lexicons on every start.
+    The parsed dictionaries are pickled under ``.webot/cache`` together with a
+    fingerprint of the installed lexicon files; a matching pickle is loaded
+    directly, anything else is rebuilt from the package and rewritten.
+    """
+
+    path = Path(cache_path or DEFAULT_LEXICON_CACHE).expanduser()
+    try:
+        fingerprint = _lexicon_fingerprint()
+    except OSError:
+        return SentimentIntensityAnalyzer()
+
+    try:
+        with path.open("rb") as fh:
+            payload = pickle.load(fh)
+        if isinstance(payload, dict) and payload.get("fingerprint") == fingerprint:
+            analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+            analyzer.lexicon = payload["lexicon"]
+            analyzer.emojis = payload["emojis"]
+            return analyzer
+    except FileNotFoundError:
+        pass
+    except Exception as exc:  # corrupt or incompatible pickle; regenerate it
+        logger.debug("Ignoring unreadable lexicon cache %s: %s", path, exc)
+
+    analyzer = SentimentIntensityAnalyzer()
+    try:
+        _write_lexicon_cache(
+            path,
+            {"fingerprint": fingerprint, "lexicon": analyzer.lexicon, "emojis": analyzer.emojis},
+        )
+    except OSError as exc:
+        logger.debug("Could not write lexicon cache %s: %s", path, exc)
+    return analyzer
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lower-case ``text`` and collapse whitespace (VADER tokenises on whitespace)."""
+
+    return " ".join((text or "").lower().split())
+
+
+def _text_key(normalized: str) -> bytes:
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+class SentimentScorer:
+    """VADER compound scores behind an LRU cache keyed on the normalised-text hash.
+
+    Reposts, quotes and re-visited posts repeat the same text, and VADER's
+    per-call overhead dominates for short posts, so each distinct text is
+    analysed once. :meth:`score_batch` additionally de-duplicates within a
+    harvested page before touching the analyser.
+
+    Parameters
+    ----------
+    maxsize:
+        Number of distinct texts kept in the cache.
+    analyzer:
+        Pre-built analyser. Loaded on first use from the precompiled lexicon
+        when omitted, so commands that never score pay nothing.
+    lexicon_cache:
+        Location of the precompiled lexicon (default ``.webot/cache``).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        *,
+        analyzer: Optional[SentimentIntensityAnalyzer] = None,
+        lexicon_cache: Optional[Path] = None,
+    ) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self.lexicon_cache = lexicon_cache
+        self._analyzer = analyzer
+        self._cache: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def analyzer(self) -> SentimentIntensityAnalyzer:
+        if self._analyzer is None:
+            with self._lock:
+                if self._analyzer is None:
+                    self._analyzer = load_analyzer(self.lexicon_cache)
+        return self._analyzer
+
+    # ------------------------------------------------------------------
+    # Sentiment
+    # ------------------------------------------------------------------
+    def compound(self, text: Optional[str]) -> float:
+        return self.compound_batch((text,))[0]
+
+    def compound_batch(self, texts: Iterable[Optional[str]]) -> List[float]:
+        """Compound sentiment for each text, analysing every distinct text at most once."""
+
+        keyed = []
+        for text in texts:
+            normalized = normalize_text(text)
+            keyed.append((_text_key(normalized), normalized))
+
+        results: Dict[bytes, float] = {}
+        missing: Dict[bytes, str] = {}
+        with self._lock:
+            for key, normalized in keyed:
+                if key in results or key in missing:
+                    self.hits += 1
+                    continue
+                cached = self._cache.get(key)
+                if cached is None:
+                    self.misses += 1
+                    missing[key] = normalized
+                else:
+                    self.hits += 1
+                    self._cache.move_to_end(key)
+                    results[key] = cached
+
+        # Analyse outside the lock; VADER is pure Python and slow relative to the bookkeeping.
+        computed = {key: self.analyzer.polarity_scores(text)["compound"] for key, text in missing.items()}
+        results.update(computed)
+
+        with self._lock:
+            for key, value in computed.items():
+                self._cache[key] = value
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return [results[key] for key, _ in keyed]
+
+    # ------------------------------------------------------------------
+    # Post scores
+    # ------------------------------------------------------------------
+    def score(self, post: Mapping[str, object], inverse: bool = False) -> float:
+        return self.score_batch((post,), inverse=inverse)[0]
+
+    def score_batch(self, posts: Sequence[Mapping[str, object]], inverse: bool = False) -> List[float]:
+        """Score a whole harvested page of posts in one pass."""
+
+        texts = [str(post.get("tweet_text") or "").lower() for post in posts]
+        sentiments = self.compound_batch(texts)
+        sign = -1 if inverse else 1
+        return [sign * (sentiment * 120 + len(text) / 6) for sentiment, text in zip(sentiments, texts)]
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._cache),
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def describe_stats(self) -> str:
+        stats = self.stats()
+        return (
+            f"Sentiment cache: {stats['hits']} hit(s)/{stats['misses']} miss(es) "
+            f"({stats['hit_rate']:.0%} hit rate, {stats['size']} cached)"
+        )
+
+
+_scorer = SentimentScorer()
+
+
+def get_scorer() -> SentimentScorer:
+    """Return the process-wide scorer shared by the policy and commands."""
+
+    return _scorer
+
+
+def score_batch(posts: Sequence[Mapping[str, object]], inverse: bool = False) -> List[float]:
+    return _scorer.score_batch(posts, inverse=inverse)
 
 
 def calculate_post_score(post: Dict[str, str], inverse: bool = False) -> float:
-    text = (post.get("tweet_text") or "").lower()
-    sentiment_score = _analyzer.polarity_scores(text)["compound"]
-    text_multiplier = len(text) / 6
-    score = sentiment_score * 120 + text_multiplier
-    if inverse:
-        score *= -1
-    return score
+    return _scorer.score(post, inverse=inverse)
@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import json
+import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 try:  # Optional dependency for YAML support
     import yaml  # type: ignore
@@ -46,8 +49,31 @@ class BehaviourSettings:
             return entry.as_tuple()
         return fallback
 
+    def describe(self) -> str:
+        """Multi-line summary of every setting, as shown by the session REPL."""
+
+        def fmt(value: DelayRange) -> str:
+            low, high = value.as_tuple()
+            return f"{low:g}-{high:g}s"
+
+        lines = [
+            f"typing_delay: {fmt(self.typing_delay)}",
+            f"random_delay: {fmt(self.random_delay)}",
+            f"micro_wait: {fmt(self.micro_wait)}",
+            f"navigation_wait: {self.navigation_wait:g}s",
+            f"post_pause_seconds: {self.post_pause_seconds:g}s",
+            f"loop.error_pause: {self.loop_error_pause:g}s",
+            f"loop.cycle_pause: {fmt(self.loop_cycle_pause)}",
+        ]
+        lines.extend(f"named_ranges.{name}: {fmt(value)}" for name, value in sorted(self.named_ranges.items()))
+        return "\n".join(lines)
+
 
 DEFAULT_BEHAVIOUR = BehaviourSettings()
+DEFAULT_BEHAVIOUR_PATHS = (Path("config/behavior.yaml"), Path("config/behaviour.yaml"))
+
+logger = logging.getLogger(__name__)
+
 _CURRENT_SETTINGS: BehaviourSettings = DEFAULT_BEHAVIOUR
 
 
@@ -79,10 +105,7 @@ def load_behaviour_settings(path: Optional[Path] = None) -> BehaviourSettings:
     if path:
         candidates = (Path(path).expanduser(),)
     else:
-        candidates = (
-            Path("config/behavior.yaml"),
-            Path("config/behaviour.yaml"),
-        )
+        candidates = DEFAULT_BEHAVIOUR_PATHS
 
     last_error: Optional[Tuple[Path, Exception]] = None
     for candidate in candidates:
@@ -103,6 +126,126 @@ def load_behaviour_settings(path: Optional[Path] = None) -> BehaviourSettings:
     return DEFAULT_BEHAVIOUR
 
 
+def resolve_behaviour_path(path: Optional[Path] = None) -> Path:
+    """Return the file ``load_behaviour_settings`` reads (or would read once it exists)."""
+
+    if path:
+        return Path(path).expanduser().absolute()
+    for candidate in DEFAULT_BEHAVIOUR_PATHS:
+        if candidate.is_file():
+            return candidate.absolute()
+    return DEFAULT_BEHAVIOUR_PATHS[0].absolute()
+
+
+class BehaviourWatcher:
+    """Reload behaviour settings whenever the configuration file changes.
+
+    A daemon thread polls the file's modification time and size. A changed
+    file is read and parsed in full before the result is swapped in with
+    :func:`set_behaviour_settings`. Callers therefore always see either the
+    old or the new immutable settings object, never a mix. When parsing
+    fails, the active settings are kept and the error is reported once per
+    change. A deleted file also leaves the active settings in place.
+
+    Parameters
+    ----------
+    path:
+        Configuration file to watch; see :func:`resolve_behaviour_path`.
+    interval:
+        Seconds between polls.
+    on_reload / on_error:
+        Optional callbacks for a successful reload and for a failed parse.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        interval: float = 1.0,
+        on_reload: Optional[Callable[[BehaviourSettings], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.interval = max(0.1, float(interval))
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self.reloads = 0
+        self.last_reload: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._signature = self._stat()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="weBot-behaviour-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1.0)
+            self._thread = None
+
+    def check(self, *, force: bool = False) -> bool:
+        """Reload if the file changed (or unconditionally with ``force``); ``True`` on a swap."""
+
+        with self._lock:
+            signature = self._stat()
+            if not force and signature == self._signature:
+                return False
+            self._signature = signature
+            if signature is None:
+                return False
+            try:
+                settings = _parse_behaviour_settings(_read_config_file(self.path))
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                logger.debug("Keeping current behaviour settings; %s is invalid: %s", self.path, exc)
+                failure: Optional[Exception] = exc
+            else:
+                set_behaviour_settings(settings)
+                self.reloads += 1
+                self.last_reload = time.time()
+                self.last_error = None
+                failure = None
+        if failure is not None:
+            if self.on_error is not None:
+                self.on_error(failure)
+            return False
+        if self.on_reload is not None:
+            self.on_reload(settings)
+        return True
+
+    def describe(self) -> str:
+        lines: List[str] = [f"Behaviour config: {self.path}" + ("" if self.path.is_file() else " (missing; defaults)")]
+        if self.last_reload is not None:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.last_reload))
+            lines.append(f"Reloaded {self.reloads} time(s); last at {stamp}")
+        if self.last_error:
+            lines.append(f"Last reload failed: {self.last_error}")
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as exc:  # pragma: no cover - never let the watcher die
+                logger.warning("Behaviour watcher error: %s", exc)
+
+
 def _read_config_file(path: Path) -> Dict[str, object]:
     text = path.read_text(encoding="utf-8")
     if not text.strip():
@@ -1,14 +1,14 @@
 """Navigation helpers built around state detection."""
 from __future__ import annotations
 
-import time
 from typing import Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from ...config.behaviour import get_behaviour_settings
 from ..recognizers import recognize_state
-from ..state import ActionResult, PageState, SessionContext
+from ..state import ActionResult, PageState, SessionContext, TransitionReason
+from .utils import cancellable_sleep
 
 
 def navigate_to(
@@ -21,9 +21,9 @@ def navigate_to(
     settings = get_behaviour_settings()
     pause = settings.navigation_wait if wait_seconds is None else wait_seconds
     driver.get(url)
-    time.sleep(pause)
+    cancellable_sleep(pause)
     snapshot = recognize_state(driver)
-    context.update_state(snapshot.state, **snapshot.metadata)
+    context.update_state(snapshot.state, reason=TransitionReason.NAVIGATION, **snapshot.metadata)
     context.post_index = 0
     return ActionResult(success=True, next_state=snapshot.state, metadata=snapshot.metadata)
 
@@ -36,7 +36,6 @@ def ensure_state(driver: WebDriver, context: SessionContext, desired: PageState,
     if fallback_url:
         navigate_to(driver, context, fallback_url)
         snapshot = recognize_state(driver)
-        context.update_state(snapshot.state, **snapshot.metadata)
-        return snapshot.state
-    context.update_state(snapshot.state, **snapshot.metadata)
+    reason = TransitionReason.RECOGNIZED if snapshot.state == desired else TransitionReason.MISMATCH
+    context.update_state(snapshot.state, reason=reason, **snapshot.metadata)
     return snapshot.state
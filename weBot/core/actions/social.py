@@ -4,11 +4,12 @@ from __future__ import annotations
 import logging
 from typing import List, Optional, Tuple
 
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 
+from ..cdp import evaluate_value
 from ..state import ActionResult, PageState
 from .utils import random_delay, wait_for
 
@@ -41,48 +42,146 @@ def navigate_follow_list(
     return ActionResult(True, PageState.FOLLOWERS_MODAL, metadata={"handle": handle, "list_type": list_type})
 
 
+_COLLECTOR_INSTALL_SCRIPT = """
+const cellSelector = arguments[0];
+const buttonSelector = arguments[1];
+const linkSelector = arguments[2];
+const previous = window.__webotHandleCollector;
+if (previous && previous.observer) {
+    previous.observer.disconnect();
+}
+const state = {seen: new Set(), pending: [], observer: null, cellSelector: cellSelector, harvest: null};
+const harvest = (cell) => {
+    if (!cell.querySelector(buttonSelector)) {
+        return;
+    }
+    const link = cell.querySelector(linkSelector);
+    const href = link ? link.getAttribute('href') || '' : '';
+    const handle = href.replace(/\\/+$/, '').split('/').pop();
+    if (handle && !state.seen.has(handle)) {
+        state.seen.add(handle);
+        state.pending.push(handle);
+    }
+};
+const visit = (node) => {
+    if (node.nodeType !== 1) {
+        return;
+    }
+    if (node.matches(cellSelector)) {
+        harvest(node);
+    }
+    node.querySelectorAll(cellSelector).forEach(harvest);
+};
+state.harvest = harvest;
+document.querySelectorAll(cellSelector).forEach(harvest);
+state.observer = new MutationObserver((mutations) => {
+    for (const mutation of mutations) {
+        mutation.addedNodes.forEach(visit);
+    }
+});
+state.observer.observe(document.body, {childList: true, subtree: true});
+window.__webotHandleCollector = state;
+return state.pending.length;
+"""
+
+_COLLECTOR_DRAIN_SCRIPT = """
+const step = arguments[0];
+const state = window.__webotHandleCollector;
+if (!state) {
+    return null;
+}
+// The observer only sees added nodes: re-harvest the rendered cells so late-hydrated
+// follow buttons and cells recycled through attribute changes are not missed.
+document.querySelectorAll(state.cellSelector).forEach(state.harvest);
+const batch = state.pending.splice(0, state.pending.length);
+const root = document.scrollingElement || document.documentElement;
+const atEnd = Math.ceil(root.scrollTop + root.clientHeight) >= root.scrollHeight - 2;
+root.scrollTop += step;
+return {handles: batch, at_end: atEnd};
+"""
+
+_COLLECTOR_TEARDOWN_SCRIPT = """
+const state = window.__webotHandleCollector;
+if (state && state.observer) {
+    state.observer.disconnect();
+}
+delete window.__webotHandleCollector;
+"""
+
+
 def collect_handles_from_modal(
     driver: WebDriver,
     *,
     max_count: Optional[int] = None,
     scroll_pause: Tuple[float, float] = (0.9, 1.6),
+    scroll_step: int = 600,
+    idle_rounds: int = 2,
 ) -> Tuple[List[str], bool]:
+    """Collect user handles from a followers/following list.
+
+    A ``MutationObserver`` installed in the page records handles as new cells
+    are rendered, so each scroll step costs one round trip that returns only
+    the handles added since the previous step. Each step also re-reads the
+    rendered cells, which catches follow buttons that hydrate after their
+    cell and cells the list recycles by rewriting their links. The list counts as fully
+    explored once the page is scrolled to the bottom and ``idle_rounds``
+    consecutive steps produced no new handles.
+    """
+
     try:
         wait_for(driver, EC.presence_of_element_located((By.CSS_SELECTOR, USER_CELL_SELECTOR)), timeout=10)
     except TimeoutException:
         logger.info("Follower modal did not populate; returning empty handle list.")
         return [], True
+
+    try:
+        driver.execute_script(
+            _COLLECTOR_INSTALL_SCRIPT,
+            USER_CELL_SELECTOR,
+            USER_BUTTON_SELECTOR,
+            HANDLE_LINK_SELECTOR,
+        )
+    except Exception as exc:  # pragma: no cover - JS execution depends on driver state
+        logger.warning("Installing follower collector failed: %s", exc)
+        return [], False
+
     seen_handles: List[str] = []
     unique = set()
     fully_explored = False
+    idle = 0
 
-    while True:
-        user_cells = driver.find_elements(By.CSS_SELECTOR, USER_CELL_SELECTOR)
-        for cell in user_cells:
+    try:
+        while True:
             try:
-                cell.find_element(By.CSS_SELECTOR, USER_BUTTON_SELECTOR)
-                link = cell.find_element(By.CSS_SELECTOR, HANDLE_LINK_SELECTOR)
-                href = link.get_attribute("href")
-                if not href:
-                    continue
-                handle = href.rstrip("/").split("/")[-1]
+                batch = evaluate_value(driver, _COLLECTOR_DRAIN_SCRIPT, scroll_step)
+            except Exception as exc:  # pragma: no cover - JS execution depends on driver state
+                logger.warning("Scrolling followers modal failed: %s", exc)
+                break
+            if not batch:
+                logger.warning("Follower collector disappeared; the list was likely closed.")
+                break
+
+            added = 0
+            for handle in batch.get("handles") or ():
                 if handle and handle not in unique:
                     unique.add(handle)
                     seen_handles.append(handle)
+                    added += 1
                     if max_count and len(seen_handles) >= max_count:
                         return seen_handles, True
-            except NoSuchElementException:
-                continue
 
-        previous_count = len(unique)
+            if added == 0 and batch.get("at_end"):
+                idle += 1
+                if idle >= idle_rounds:
+                    fully_explored = True
+                    break
+            else:
+                idle = 0
+            random_delay(*scroll_pause)
+    finally:
         try:
-            driver.execute_script("document.documentElement.scrollTop += 600;")
-        except Exception as exc:  # pragma: no cover - JS execution depends on driver state
-            logger.warning("Scrolling followers modal failed: %s", exc)
-            break
-        random_delay(*scroll_pause)
-        if len(unique) == previous_count:
-            fully_explored = True
-            break
+            driver.execute_script(_COLLECTOR_TEARDOWN_SCRIPT)
+        except Exception:  # pragma: no cover - best effort cleanup
+            pass
 
     return seen_handles, fully_explored
@@ -1,7 +1,7 @@
 """Timeline interaction helpers (scrolling, post actions, etc.)."""
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
@@ -12,11 +12,16 @@ from selenium.common.exceptions import (
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
+from ...data.extractors import status_id_from_link
+from ..cdp import evaluate_value
+from ..selectors import SelectorGroup
 from ..state import ActionResult, PageState, SessionContext
 from .utils import human_type, micro_wait, random_delay, wait_for
 
+if TYPE_CHECKING:  # pragma: no cover - type checking helper without runtime import
+    from ...data.seen import SeenPostIndex
+
 ARTICLE_SELECTOR = "article[data-testid='tweet']"
 COMPOSE_BUTTON_SELECTORS = (
     (By.CSS_SELECTOR, "a[data-testid='SideNav_NewTweet_Button']"),
@@ -30,12 +35,38 @@ COMPOSE_SUBMIT_SELECTORS = (
     (By.CSS_SELECTOR, "button[data-testid='tweetButton']"),
     (By.CSS_SELECTOR, "button[data-testid='tweetButtonInline']"),
 )
+# ``get_centered_post`` plus the field reads in one by-value call (no element handles).
+_HARVEST_CENTERED_SCRIPT = """
+const centerY = window.innerHeight / 2;
+let closest = null;
+let closestDistance = Infinity;
+for (const post of document.querySelectorAll(arguments[0])) {
+    const rect = post.getBoundingClientRect();
+    const distance = Math.abs(rect.top + rect.height / 2 - centerY);
+    if (distance < closestDistance) {
+        closest = post;
+        closestDistance = distance;
+    }
+}
+if (!closest) {
+    return null;
+}
+const name = closest.querySelector("div[data-testid='User-Name'] span");
+const text = closest.querySelector("div[data-testid='tweetText']");
+const time = closest.querySelector('time');
+return {
+    username: name ? name.innerText : null,
+    tweet_text: text ? text.innerText || '' : '',
+    link: time && time.parentElement && time.parentElement.href ? time.parentElement.href : null,
+};
+"""
+
+COMPOSE_BUTTON_GROUP = SelectorGroup("compose_button", COMPOSE_BUTTON_SELECTORS)
+COMPOSE_SUBMIT_GROUP = SelectorGroup("compose_submit", COMPOSE_SUBMIT_SELECTORS)
 
 
 def update_post_cache(driver: WebDriver, context: SessionContext, timeout: float = 10) -> List[object]:
-    posts = WebDriverWait(driver, timeout).until(
-        EC.presence_of_all_elements_located((By.CSS_SELECTOR, ARTICLE_SELECTOR))
-    )
+    posts = wait_for(driver, EC.presence_of_all_elements_located((By.CSS_SELECTOR, ARTICLE_SELECTOR)), timeout)
     context.attributes["post_count"] = str(len(posts))
     return posts
 
@@ -110,11 +141,11 @@ def scroll(driver: WebDriver, context: SessionContext) -> ActionResult:
         target = _find_next_post(driver, current)
 
         if target is None:
-            last_height = driver.execute_script("return document.body.scrollHeight")
+            last_height = evaluate_value(driver, "return document.body.scrollHeight")
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             random_delay(1.2, 2.0, label="scroll_fetch")
             refresh_feed(driver, context)
-            new_height = driver.execute_script("return document.body.scrollHeight")
+            new_height = evaluate_value(driver, "return document.body.scrollHeight")
             if new_height > last_height:
                 current = get_centered_post(driver)
                 target = _find_next_post(driver, current)
@@ -193,7 +224,7 @@ def _click_button_on_centered_post(driver: WebDriver, data_testid: str, aria_lab
             escaped = aria_label_pattern.replace('"', '\"')
             scoped_selector += f"[aria-label*=\"{escaped}\"]"
         button = centered_post.find_element(By.CSS_SELECTOR, scoped_selector)
-        WebDriverWait(driver, 5).until(EC.element_to_be_clickable(button))
+        wait_for(driver, EC.element_to_be_clickable(button), 5)
         driver.execute_script("arguments[0].click();", button)
         return True
     except (NoSuchElementException, TimeoutException, ElementClickInterceptedException, StaleElementReferenceException):
@@ -266,14 +297,9 @@ def go_to_top(driver: WebDriver) -> None:
 
 def create_post(driver: WebDriver, text: str) -> bool:
     try:
-        compose_button = None
-        for by, value in COMPOSE_BUTTON_SELECTORS:
-            elements = driver.find_elements(by, value)
-            if elements:
-                compose_button = elements[0]
-                break
+        compose_button = COMPOSE_BUTTON_GROUP.find(driver)
         if compose_button is None:
-            compose_button = wait_for(driver, EC.element_to_be_clickable(COMPOSE_BUTTON_SELECTORS[0]), 10)
+            compose_button = COMPOSE_BUTTON_GROUP.wait(driver, 10)
 
         driver.execute_script("arguments[0].click();", compose_button)
         random_delay(0.3, 0.6, label="pause_short")
@@ -282,16 +308,7 @@ def create_post(driver: WebDriver, text: str) -> bool:
         driver.execute_script("arguments[0].focus();", textarea)
         human_type(textarea, text)
 
-        submit = None
-        for by, value in COMPOSE_SUBMIT_SELECTORS:
-            try:
-                submit = wait_for(driver, EC.element_to_be_clickable((by, value)), 5)
-                if submit:
-                    break
-            except TimeoutException:
-                continue
-        if submit is None:
-            raise TimeoutException("Post submit button not found")
+        submit = COMPOSE_SUBMIT_GROUP.wait(driver, 10)
 
         driver.execute_script("arguments[0].click();", submit)
         random_delay(0.5, 1.0, label="pause_medium")
@@ -305,8 +322,10 @@ def open_author_profile(driver: WebDriver) -> bool:
         centered_post = get_centered_post(driver)
         if not centered_post:
             return False
-        username_element = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "article[data-testid='tweet'] div[data-testid='User-Name'] a"))
+        username_element = wait_for(
+            driver,
+            EC.presence_of_element_located((By.CSS_SELECTOR, "article[data-testid='tweet'] div[data-testid='User-Name'] a")),
+            10,
         )
         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", username_element)
         micro_wait()
@@ -345,34 +364,25 @@ def unfollow(driver: WebDriver) -> bool:
         return False
 
 
-def fetch_post(driver: WebDriver):
-    centered = get_centered_post(driver)
-    if not centered:
+def fetch_post(driver: WebDriver, seen: Optional["SeenPostIndex"] = None):
+    """Return the centred post's author, text, link and status id.
+
+    The post is located and read in a single by-value evaluation, which
+    goes over the direct DevTools channel when the driver has one.
+    When ``seen`` is given the result also carries ``seen=True`` for posts a
+    previous run (or an earlier cycle) already processed.
+    """
+
+    harvested = evaluate_value(driver, _HARVEST_CENTERED_SCRIPT, ARTICLE_SELECTOR)
+    if not harvested:
         return None
-    try:
-        username = driver.execute_script(
-            "return arguments[0].querySelector(\"div[data-testid='User-Name'] span\").innerText;",
-            centered,
-        )
-    except Exception:
-        username = None
-    try:
-        tweet_text = driver.execute_script(
-            "return arguments[0].querySelector(\"div[data-testid='tweetText']\")?.innerText || '';",
-            centered,
-        )
-    except Exception:
-        tweet_text = ""
-    try:
-        link = driver.execute_script(
-            "var timeEl = arguments[0].querySelector('time'); return timeEl ? timeEl.parentElement.href : null;",
-            centered,
-        )
-    except Exception:
-        link = None
-    # engagement stats reuse util.extract maybe later
-    return {
-        "username": username,
-        "tweet_text": tweet_text,
+    link = harvested.get("link")
+    post = {
+        "username": harvested.get("username"),
+        "tweet_text": harvested.get("tweet_text") or "",
         "link": link,
+        "status_id": status_id_from_link(link),
     }
+    if seen is not None:
+        post["seen"] = post["status_id"] in seen
+    return post
@@ -2,19 +2,110 @@
 from __future__ import annotations
 
 import random
+import threading
 import time
-from typing import Iterable, Tuple
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Tuple
 
 from ...config.behaviour import get_behaviour_settings
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.wait import IGNORED_EXCEPTIONS, POLL_FREQUENCY
+
+
+class OperationCancelled(BaseException):
+    """Raised inside a cancelled scope by any wait or delay helper.
+
+    Derives from ``BaseException`` (like ``KeyboardInterrupt``) so the broad
+    ``except Exception`` blocks around individual actions do not swallow it.
+    """
+
+
+class CancellationToken:
+    """Cooperative cancellation flag shared between a controller and a worker thread."""
+
+    def __init__(self, event: Optional[threading.Event] = None) -> None:
+        self._event = event or threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise OperationCancelled()
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep for ``seconds`` unless cancelled first, in which case raise immediately."""
+
+        if self._event.wait(max(0.0, seconds)):
+            raise OperationCancelled()
+
+
+_scope = threading.local()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Make ``token`` govern every wait and delay helper on the current thread."""
+
+    previous = getattr(_scope, "token", None)
+    _scope.token = token
+    try:
+        yield token
+    finally:
+        _scope.token = previous
+
+
+def current_token() -> Optional[CancellationToken]:
+    return getattr(_scope, "token", None)
+
+
+def cancellable_sleep(seconds: float) -> None:
+    """``time.sleep`` that returns early with :class:`OperationCancelled` inside a cancelled scope."""
+
+    token = current_token()
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.sleep(seconds)
 
 
 def wait_for(driver, condition, timeout: float = 10):
-    return WebDriverWait(driver, timeout).until(condition)
+    """``WebDriverWait(driver, timeout).until(condition)`` that a cancelled scope interrupts.
+
+    Polls at Selenium's usual cadence; inside a cancellation scope the pause
+    between polls is a :func:`cancellable_sleep`, so stopping the scope
+    raises :class:`OperationCancelled` without waiting for the next poll.
+    """
+
+    token = current_token()
+    if token is None:
+        return WebDriverWait(driver, timeout).until(condition)
+    token.raise_if_cancelled()
+
+    end_time = time.monotonic() + timeout
+    screen = stacktrace = None
+    while True:
+        try:
+            value = condition(driver)
+            if value:
+                return value
+        except IGNORED_EXCEPTIONS as exc:
+            screen = getattr(exc, "screen", None)
+            stacktrace = getattr(exc, "stacktrace", None)
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            break
+        token.sleep(min(POLL_FREQUENCY, remaining))
+    raise TimeoutException("", screen, stacktrace)
 
 
 def human_delay_range(delay_range: Iterable[float]) -> Tuple[float, float]:
@@ -32,8 +123,8 @@ def human_type(element: WebElement, content: str, delay_range: Iterable[float] |
     min_delay, max_delay = human_delay_range(delay_range or default_range)
     for char in content:
         element.send_keys(char)
-        time.sleep(random.uniform(min_delay, max_delay))
-    time.sleep(random.uniform(min_delay, max_delay))
+        cancellable_sleep(random.uniform(min_delay, max_delay))
+    cancellable_sleep(random.uniform(min_delay, max_delay))
 
 
 def element_exists(driver, locator: tuple[By, str], timeout: float = 5) -> bool:
@@ -67,7 +158,7 @@ def random_delay(
     high = explicit_max if explicit_max is not None else configured_max
     if high < low:
         high = low
-    time.sleep(random.uniform(low, high))
+    cancellable_sleep(random.uniform(low, high))
 
 
 def micro_wait() -> None:
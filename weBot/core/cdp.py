@@ -0,0 +1,254 @@
+"""Direct DevTools channel for by-value page evaluations on hot paths."""
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import threading
+import time
+import urllib.request
+import weakref
+from typing import Any, Dict, Optional
+
+from selenium.common.exceptions import JavascriptException
+
+try:  # Optional dependency for the direct channel (websocket-client)
+    import websocket  # type: ignore
+except ImportError:  # pragma: no cover - websocket-client is optional
+    websocket = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+TRANSPORT_CDP = "cdp"
+TRANSPORT_WEBDRIVER = "webdriver"
+
+_DISCOVERY_TIMEOUT = 2.0
+
+
+class CdpError(RuntimeError):
+    """The DevTools connection failed (as opposed to the script throwing)."""
+
+
+def cdp_channel_available() -> bool:
+    return websocket is not None
+
+
+class CdpChannel:
+    """One DevTools WebSocket to the page target a Selenium driver controls.
+
+    Every WebDriver command crosses chromedriver's HTTP server before it is
+    translated into DevTools messages; this channel sends ``Runtime.evaluate``
+    straight to Chrome instead. Results come back by value (JSON), so only
+    scripts that return plain data may use it — anything that needs a
+    ``WebElement`` keeps going through Selenium.
+
+    Parameters
+    ----------
+    url:
+        ``webSocketDebuggerUrl`` of the page target.
+    target_id:
+        DevTools id of that target; chromedriver uses it as the window handle.
+    timeout:
+        Seconds to wait for a reply before the channel is considered broken.
+    """
+
+    def __init__(self, url: str, *, target_id: Optional[str] = None, timeout: float = 10.0) -> None:
+        if websocket is None:
+            raise RuntimeError("The websocket-client package is required for the direct CDP channel")
+        self.url = url
+        self.target_id = target_id
+        # Set when the driver switches windows; the next evaluation checks the target first.
+        self.window_changed = False
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        try:
+            self._socket = websocket.create_connection(url, timeout=timeout, suppress_origin=True)
+        except (OSError, websocket.WebSocketException) as exc:
+            raise CdpError(f"Could not connect to {url}: {exc}") from exc
+
+    @classmethod
+    def connect(cls, driver, *, timeout: float = 10.0) -> "CdpChannel":
+        """Open a channel to the tab ``driver`` currently controls."""
+
+        options = getattr(driver, "capabilities", {}).get("goog:chromeOptions") or {}
+        address = options.get("debuggerAddress")
+        if not address:
+            raise CdpError("The driver does not expose a DevTools debugger address")
+        try:
+            with urllib.request.urlopen(f"http://{address}/json/list", timeout=_DISCOVERY_TIMEOUT) as response:
+                targets = json.loads(response.read().decode("utf-8"))
+        except (OSError, ValueError) as exc:
+            raise CdpError(f"Could not list DevTools targets at {address}: {exc}") from exc
+
+        pages = [target for target in targets if target.get("type") == "page" and target.get("webSocketDebuggerUrl")]
+        handle = driver.current_window_handle
+        target = next((page for page in pages if page.get("id") == handle), pages[0] if pages else None)
+        if target is None:
+            raise CdpError(f"No page target found at {address}")
+        return cls(target["webSocketDebuggerUrl"], target_id=target.get("id"), timeout=timeout)
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send one command and return its ``result``; events are skipped."""
+
+        with self._lock:
+            message_id = next(self._ids)
+            try:
+                self._socket.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+                while True:
+                    reply = json.loads(self._socket.recv())
+                    if reply.get("id") == message_id:
+                        break
+            except (OSError, ValueError, websocket.WebSocketException) as exc:
+                raise CdpError(f"{method} failed: {exc}") from exc
+        if "error" in reply:
+            raise CdpError(f"{method} failed: {reply['error'].get('message', reply['error'])}")
+        return reply.get("result") or {}
+
+    def evaluate(self, script: str, *args: Any) -> Any:
+        """Run ``script`` like ``execute_script`` and return its JSON result.
+
+        The script body sees ``arguments`` and may ``return``, exactly as
+        with Selenium; arguments must be JSON-serialisable.
+        """
+
+        expression = f"(function() {{\n{script}\n}}).apply(null, {json.dumps(list(args))})"
+        result = self.send(
+            "Runtime.evaluate",
+            {"expression": expression, "returnByValue": True, "awaitPromise": False, "silent": True},
+        )
+        details = result.get("exceptionDetails")
+        if details:
+            exception = details.get("exception") or {}
+            raise JavascriptException(exception.get("description") or details.get("text") or "Script failed")
+        return (result.get("result") or {}).get("value")
+
+    def close(self) -> None:
+        try:
+            self._socket.close()
+        except Exception:  # pragma: no cover - best effort cleanup
+            pass
+
+
+# ----------------------------------------------------------------------
+# Driver registry and dispatch
+# ----------------------------------------------------------------------
+_CHANNELS: "weakref.WeakKeyDictionary[Any, CdpChannel]" = weakref.WeakKeyDictionary()
+_TIMINGS: Dict[str, list] = {TRANSPORT_CDP: [0, 0.0], TRANSPORT_WEBDRIVER: [0, 0.0]}
+_TIMINGS_LOCK = threading.Lock()
+_TRACKED: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def attach_channel(driver, channel: CdpChannel) -> None:
+    _CHANNELS[driver] = channel
+    _track_window_switches(driver)
+
+
+def detach_channel(driver) -> None:
+    channel = _CHANNELS.pop(driver, None)
+    if channel is not None:
+        channel.close()
+
+
+def channel_for(driver) -> Optional[CdpChannel]:
+    return _CHANNELS.get(driver)
+
+
+def evaluate_value(driver, script: str, *args: Any) -> Any:
+    """Evaluate a by-value script over the direct channel when one is attached.
+
+    Falls back to ``driver.execute_script`` when the driver has no channel
+    or the channel breaks (the channel is then dropped for good). After a
+    window switch the channel is reconnected to the current tab first. Script
+    errors are raised as ``JavascriptException`` on either transport.
+    """
+
+    channel = _CHANNELS.get(driver)
+    if channel is not None and channel.window_changed:
+        channel = _follow_window(driver, channel)
+    if channel is not None:
+        started = time.perf_counter()
+        try:
+            value = channel.evaluate(script, *args)
+        except CdpError as exc:
+            logger.warning("Direct CDP channel failed, falling back to WebDriver: %s", exc)
+            detach_channel(driver)
+        else:
+            _record(TRANSPORT_CDP, started)
+            return value
+    started = time.perf_counter()
+    value = driver.execute_script(script, *args)
+    _record(TRANSPORT_WEBDRIVER, started)
+    return value
+
+
+def _track_window_switches(driver) -> None:
+    """Flag the driver's channel whenever ``switch_to.window``/``new_window`` runs.
+
+    The channel is bound to one tab; checking ``current_window_handle`` on
+    every evaluation would cost the WebDriver round trip the channel saves,
+    so the handle is only compared after a switch.
+    """
+
+    switch_to = getattr(driver, "switch_to", None)
+    if switch_to is None or driver in _TRACKED:
+        return
+    for name in ("window", "new_window"):
+        original = getattr(switch_to, name, None)
+        if original is None:
+            continue
+
+        def switched(*args: Any, _original=original, **kwargs: Any) -> Any:
+            try:
+                return _original(*args, **kwargs)
+            finally:
+                channel = _CHANNELS.get(driver)
+                if channel is not None:
+                    channel.window_changed = True
+
+        setattr(switch_to, name, switched)
+    _TRACKED.add(driver)
+
+
+def _follow_window(driver, channel: CdpChannel) -> Optional[CdpChannel]:
+    """Keep ``channel`` if it still targets the current window, otherwise reconnect."""
+
+    try:
+        handle = driver.current_window_handle
+    except Exception as exc:
+        logger.warning("Could not read the current window; page evaluations go through WebDriver: %s", exc)
+        detach_channel(driver)
+        return None
+    if handle == channel.target_id:
+        channel.window_changed = False
+        return channel
+    detach_channel(driver)
+    try:
+        replacement = CdpChannel.connect(driver)
+    except CdpError as exc:
+        logger.warning("Direct CDP channel lost after a window switch; falling back to WebDriver: %s", exc)
+        return None
+    _CHANNELS[driver] = replacement
+    return replacement
+
+
+def _record(transport: str, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    with _TIMINGS_LOCK:
+        totals = _TIMINGS[transport]
+        totals[0] += 1
+        totals[1] += elapsed
+
+
+def describe_evaluations() -> str:
+    """One-line summary of by-value evaluations per transport."""
+
+    with _TIMINGS_LOCK:
+        parts = [
+            f"{count} via {transport} (avg {1000.0 * seconds / count:.1f} ms)"
+            for transport, (count, seconds) in _TIMINGS.items()
+            if count
+        ]
+    return "Page evaluations: " + (", ".join(parts) if parts else "none yet")
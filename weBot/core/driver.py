@@ -1,6 +1,7 @@
 """Browser session management utilities."""
 from __future__ import annotations
 
+import logging
 import re
 import shutil
 import tempfile
@@ -13,6 +14,9 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+from .cdp import CdpChannel, CdpError, attach_channel, cdp_channel_available, detach_channel
+
+logger = logging.getLogger(__name__)
 
 _PROFILE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]{0,63}$")
 
@@ -44,6 +48,7 @@ class DriverConfig:
     profile_root: Optional[Path] = None
     user_agent: Optional[str] = None
     stealth: bool = True
+    cdp_channel: bool = True
 
 
 class DriverManager:
@@ -125,10 +130,14 @@ class DriverManager:
         if self.config.stealth:
             self._apply_stealth(self._driver)
 
+        if self.config.cdp_channel:
+            self._attach_cdp_channel(self._driver)
+
         return self._driver
 
     def quit(self) -> None:
         if self._driver:
+            detach_channel(self._driver)
             self._driver.quit()
             self._driver = None
         if self._cleanup_profile and self._profile_path and self._profile_path.exists():
@@ -230,6 +239,16 @@ class DriverManager:
     def _profile_prefix() -> str:
         return f"profile-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
 
+    @staticmethod
+    def _attach_cdp_channel(driver: webdriver.Chrome) -> None:  # pragma: no cover - dependent on Chrome
+        if not cdp_channel_available():
+            logger.info("websocket-client is not installed; page evaluations go through WebDriver.")
+            return
+        try:
+            attach_channel(driver, CdpChannel.connect(driver))
+        except CdpError as exc:
+            logger.warning("Direct CDP channel unavailable; page evaluations go through WebDriver: %s", exc)
+
     def _apply_stealth(self, driver: webdriver.Chrome) -> None:  # pragma: no cover - dependent on Chrome
         try:
             driver.execute_cdp_cmd(
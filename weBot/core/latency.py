@@ -0,0 +1,117 @@
+"""Simulated driver and network latency for benchmarking round-trip-heavy code."""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from .cdp import channel_for
+
+
+class CommandDelay:
+    """Delay and count every command a driver sends.
+
+    Each WebDriver command (and each message on the direct DevTools
+    channel, when one is attached) sleeps ``delay`` seconds before it is
+    sent, which is what a remote Selenium endpoint with that round-trip
+    time costs. Use as a context manager; the original transports are
+    restored on exit.
+
+    Parameters
+    ----------
+    driver:
+        Driver whose ``command_executor`` is wrapped.
+    delay:
+        Seconds added to every round trip.
+    """
+
+    def __init__(self, driver, delay: float) -> None:
+        self.driver = driver
+        self.delay = max(0.0, float(delay))
+        self.commands = 0
+        self.cdp_messages = 0
+        self._executor = None
+        self._channel = None
+
+    @property
+    def round_trips(self) -> int:
+        return self.commands + self.cdp_messages
+
+    def reset(self) -> None:
+        self.commands = 0
+        self.cdp_messages = 0
+
+    def __enter__(self) -> "CommandDelay":
+        executor = self.driver.command_executor
+        execute = executor.execute
+
+        def delayed_execute(command, params):
+            self.commands += 1
+            if self.delay:
+                time.sleep(self.delay)
+            return execute(command, params)
+
+        executor.execute = delayed_execute
+        self._executor = executor
+
+        channel = channel_for(self.driver)
+        if channel is not None:
+            send = channel.send
+
+            def delayed_send(method, params=None):
+                self.cdp_messages += 1
+                if self.delay:
+                    time.sleep(self.delay)
+                return send(method, params)
+
+            channel.send = delayed_send
+            self._channel = channel
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        # The wrappers are instance attributes shadowing the bound methods.
+        if self._executor is not None:
+            del self._executor.execute
+            self._executor = None
+        if self._channel is not None:
+            del self._channel.send
+            self._channel = None
+
+
+def emulate_network(
+    driver,
+    latency_ms: float,
+    *,
+    download_kbps: Optional[float] = None,
+    upload_kbps: Optional[float] = None,
+) -> None:
+    """Throttle the page's own network traffic with ``Network.emulateNetworkConditions``."""
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd(
+        "Network.emulateNetworkConditions",
+        {
+            "offline": False,
+            "latency": float(latency_ms),
+            "downloadThroughput": download_kbps * 1024 / 8 if download_kbps else -1,
+            "uploadThroughput": upload_kbps * 1024 / 8 if upload_kbps else -1,
+        },
+    )
+
+
+def clear_network_emulation(driver) -> None:
+    emulate_network(driver, 0)
+
+
+@contextmanager
+def simulated_latency(driver, rtt_ms: float, *, throttle_network: bool = True) -> Iterator[CommandDelay]:
+    """Apply ``rtt_ms`` to driver commands and (optionally) page loads for the block."""
+
+    if throttle_network:
+        emulate_network(driver, rtt_ms)
+    try:
+        with CommandDelay(driver, rtt_ms / 1000.0) as delay:
+            yield delay
+    finally:
+        if throttle_network:
+            clear_network_emulation(driver)
@@ -0,0 +1,139 @@
+"""Driver-compatible view over saved HTML so recognisers run without Chrome."""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import List, Optional
+
+from selenium.common.exceptions import JavascriptException, NoSuchElementException
+from selenium.webdriver.common.by import By
+
+try:  # Optional dependency for the offline backend
+    from lxml import html as lxml_html  # type: ignore
+except ImportError:  # pragma: no cover - lxml is optional
+    lxml_html = None  # type: ignore
+
+try:  # lxml needs cssselect to translate CSS selectors
+    from cssselect import GenericTranslator  # type: ignore
+except ImportError:  # pragma: no cover - cssselect is optional
+    GenericTranslator = None  # type: ignore
+
+# Elements whose boundaries become line breaks in ``innerText``.
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "tr", "ul",
+}
+_SKIPPED_TAGS = {"script", "style", "noscript", "template"}
+
+
+def offline_backend_available() -> bool:
+    return lxml_html is not None and GenericTranslator is not None
+
+
+@lru_cache(maxsize=512)
+def _css_to_xpath(selector: str) -> str:
+    return GenericTranslator().css_to_xpath(selector, prefix="descendant-or-self::")
+
+
+def _xpath_for(by: str, value: str) -> str:
+    if by == By.CSS_SELECTOR:
+        return _css_to_xpath(value)
+    if by == By.XPATH:
+        return value
+    if by == By.NAME:
+        return _css_to_xpath(f"[name='{value}']")
+    if by == By.ID:
+        return _css_to_xpath(f"#{value}")
+    if by == By.TAG_NAME:
+        return _css_to_xpath(value)
+    raise ValueError(f"Unsupported locator strategy for offline pages: {by}")
+
+
+def _inner_text(element) -> str:
+    """Approximate ``HTMLElement.innerText`` (block elements break lines)."""
+
+    parts: List[str] = []
+
+    def walk(node) -> None:
+        tag = node.tag if isinstance(node.tag, str) else ""
+        if tag in _SKIPPED_TAGS:
+            return
+        block = tag in _BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        if node.text and tag:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append("\n")
+
+    walk(element)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+class HtmlElement:
+    """Subset of ``WebElement`` backed by an lxml element."""
+
+    def __init__(self, node) -> None:
+        self._node = node
+
+    @property
+    def text(self) -> str:
+        return _inner_text(self._node)
+
+    @property
+    def tag_name(self) -> str:
+        return str(self._node.tag)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self._node.get(name)
+
+    def is_displayed(self) -> bool:
+        return self._node.get("hidden") is None and "display: none" not in (self._node.get("style") or "")
+
+    def is_enabled(self) -> bool:
+        return self._node.get("disabled") is None
+
+    def find_element(self, by: str = By.ID, value: str = "") -> "HtmlElement":
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No offline element matches {by}={value!r}")
+        return elements[0]
+
+    def find_elements(self, by: str = By.ID, value: str = "") -> List["HtmlElement"]:
+        xpath = _xpath_for(by, value)
+        if by == By.XPATH and not xpath.startswith((".", "/")):
+            xpath = "./" + xpath
+        return [HtmlElement(node) for node in self._node.xpath(xpath) if not isinstance(node, str)]
+
+
+class HtmlPage(HtmlElement):
+    """Subset of ``WebDriver`` over one saved document.
+
+    Only what the recognisers and extractors use is provided: element
+    lookups, ``current_url`` and ``execute_script``, which always raises so
+    callers fall back to their per-selector paths.
+    """
+
+    def __init__(self, source: str, *, url: str = "") -> None:
+        if not offline_backend_available():
+            raise RuntimeError("The lxml and cssselect packages are required for the offline HTML backend")
+        document = lxml_html.document_fromstring(source or "<html></html>")
+        super().__init__(document)
+        self.page_source = source
+        self.current_url = url or _document_url(document)
+
+    def execute_script(self, script: str, *args: object) -> object:
+        raise JavascriptException("Scripts cannot run against an offline page")
+
+
+def _document_url(document) -> str:
+    for xpath in ("//link[@rel='canonical']/@href", "//meta[@property='og:url']/@content"):
+        found = document.xpath(xpath)
+        if found:
+            return str(found[0])
+    return ""
@@ -0,0 +1,284 @@
+"""Warm browser pool for test and benchmark suites."""
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .driver import DriverConfig, DriverManager
+
+if TYPE_CHECKING:  # pragma: no cover - type checking helper without runtime import
+    from ..bot import BotController
+else:  # Fallback for runtime when annotations are not evaluated
+    BotController = Any  # type: ignore[invalid-name]
+
+
+logger = logging.getLogger(__name__)
+
+_BLANK_URL = "about:blank"
+_STORAGE_TYPES = "local_storage,session_storage,indexeddb,websql,service_workers,cache_storage"
+
+
+class SessionPool:
+    """Keep one or more Chrome sessions alive and lease them out as bots.
+
+    Every lease hands out a fresh :class:`~weBot.bot.BotController` bound to a
+    warm driver. When the lease ends the driver is reset (extra windows closed,
+    storage for the visited origins cleared, page blanked) and returned to the
+    pool instead of being quit, so suites pay the Chrome launch only once per
+    slot.
+
+    Parameters
+    ----------
+    config:
+        Driver configuration shared by every slot. Defaults to a headless,
+        ephemeral profile.
+    size:
+        Maximum number of concurrent Chrome sessions. A config with a saved
+        ``user_data_dir`` only allows one, since Chrome locks the profile
+        directory.
+    clear_cookies:
+        Also drop cookies between leases. Leave disabled when the pool runs
+        against a persisted, authenticated profile because login lives in the
+        cookie jar.
+    """
+
+    def __init__(
+        self,
+        config: Optional[DriverConfig] = None,
+        *,
+        size: int = 1,
+        clear_cookies: bool = False,
+    ) -> None:
+        if size < 1:
+            raise ValueError("SessionPool size must be at least 1")
+        config = config or DriverConfig(headless=True)
+        if size > 1 and config.user_data_dir is not None:
+            raise ValueError(
+                "Chrome cannot share one user_data_dir between browsers; use size=1 with a saved profile"
+            )
+        self.config = config
+        self.size = size
+        self.clear_cookies = clear_cookies
+        self._condition = threading.Condition()
+        self._idle: List[DriverManager] = []
+        self._managers: List[DriverManager] = []
+        self._origins: dict[int, set[str]] = {}
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def warm(self, count: Optional[int] = None) -> None:
+        """Launch up to ``count`` (default: ``size``) sessions ahead of time."""
+
+        target = min(self.size, count if count is not None else self.size)
+        with self._condition:
+            reserved = [self._reserve() for _ in range(max(0, target - len(self._managers)))]
+        for index, manager in enumerate(reserved):
+            try:
+                self._launch(manager)
+            except Exception:
+                with self._condition:
+                    for unlaunched in reserved[index + 1:]:
+                        self._managers.remove(unlaunched)
+                    self._condition.notify_all()
+                raise
+            with self._condition:
+                self._idle.append(manager)
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        """Quit every pooled driver. Outstanding leases are quit on release."""
+
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            for manager in idle:
+                self._managers.remove(manager)
+                self._origins.pop(id(manager), None)
+            self._condition.notify_all()
+        for manager in idle:
+            _quit_quietly(manager)
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                "size": self.size,
+                "launched": len(self._managers),
+                "idle": len(self._idle),
+                "leased": len(self._managers) - len(self._idle),
+            }
+
+    # ------------------------------------------------------------------
+    # Leasing
+    # ------------------------------------------------------------------
+    @contextmanager
+    def lease(
+        self,
+        *,
+        timeout: Optional[float] = None,
+        login_url: str = "https://twitter.com/login",
+        home_url: str = "https://twitter.com/home",
+    ) -> Iterator["BotController"]:
+        """Yield an isolated ``BotController`` backed by a warm driver.
+
+        Each lease gets its own ``SessionContext`` and ``LoopManager``; only the
+        Chrome process is shared with earlier leases. Leased bots accept an
+        ephemeral profile, so action tests run against the default config.
+        """
+
+        from ..bot import BotController
+
+        manager = self._acquire(timeout)
+        bot = BotController(
+            login_url=login_url,
+            home_url=home_url,
+            driver_manager=manager,
+            allow_ephemeral_profile=True,
+        )
+        try:
+            bot.start()
+            yield bot
+        finally:
+            try:
+                self._remember_origins(manager, bot.driver)
+            except Exception:  # pragma: no cover - driver may already be gone
+                pass
+            bot.detach()
+            self._release(manager)
+
+    def _acquire(self, timeout: Optional[float]) -> DriverManager:
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("SessionPool has been closed")
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._managers) < self.size:
+                    manager = self._reserve()
+                    break
+                if not self._condition.wait(timeout=timeout):
+                    raise TimeoutError("No pooled browser session became available in time")
+        self._launch(manager)
+        return manager
+
+    def _release(self, manager: DriverManager) -> None:
+        healthy = True
+        try:
+            self._reset(manager)
+        except Exception as exc:
+            logger.warning("Discarding pooled browser after failed reset: %s", exc)
+            healthy = False
+
+        with self._condition:
+            if self._closed or not healthy:
+                self._managers.remove(manager)
+                self._origins.pop(id(manager), None)
+                discard = True
+            else:
+                self._idle.append(manager)
+                discard = False
+            self._condition.notify_all()
+        if discard:
+            _quit_quietly(manager)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _reserve(self) -> DriverManager:
+        """Claim a slot (caller holds the lock); the browser is launched later, outside it."""
+
+        manager = DriverManager(replace(self.config))
+        self._managers.append(manager)
+        return manager
+
+    def _launch(self, manager: DriverManager) -> None:
+        try:
+            manager.create()
+        except Exception:
+            with self._condition:
+                self._managers.remove(manager)
+                self._condition.notify_all()
+            raise
+        self._origins[id(manager)] = set()
+
+    def _remember_origins(self, manager: DriverManager, driver: WebDriver) -> None:
+        """Collect the origin of every page in each open window's back/forward history."""
+
+        origins = self._origins.setdefault(id(manager), set())
+        for handle in driver.window_handles:
+            driver.switch_to.window(handle)
+            for url in _visited_urls(driver):
+                origin = _origin_of(url)
+                if origin:
+                    origins.add(origin)
+
+    def _reset(self, manager: DriverManager) -> None:
+        driver = manager.driver
+        handles = driver.window_handles
+        primary = handles[0]
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(primary)
+        driver.get(_BLANK_URL)
+
+        origins = self._origins.get(id(manager), set())
+        for origin in origins:
+            try:
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": _STORAGE_TYPES},
+                )
+            except Exception as exc:  # pragma: no cover - dependent on Chrome
+                logger.debug("Failed to clear storage for %s: %s", origin, exc)
+        origins.clear()
+        try:
+            # Start the next lease with an empty history so its origins are its own.
+            driver.execute_cdp_cmd("Page.resetNavigationHistory", {})
+        except Exception as exc:  # pragma: no cover - dependent on Chrome
+            logger.debug("Failed to reset navigation history: %s", exc)
+
+        if self.clear_cookies:
+            driver.delete_all_cookies()
+
+
+def _visited_urls(driver: WebDriver) -> List[str]:
+    """URLs in the current tab's navigation history, plus the current one."""
+
+    try:
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+    except Exception as exc:  # pragma: no cover - dependent on Chrome
+        logger.debug("Failed to read navigation history: %s", exc)
+        history = None
+    urls = [entry.get("url", "") for entry in (history or {}).get("entries") or ()]
+    urls.append(driver.current_url)
+    return urls
+
+
+def _origin_of(url: str) -> Optional[str]:
+    parts = urlsplit(url or "")
+    if parts.scheme not in {"http", "https"} or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _quit_quietly(manager: DriverManager) -> None:
+    try:
+        manager.quit()
+    except Exception as exc:  # pragma: no cover - best effort shutdown
+        logger.debug("Failed to quit pooled browser: %s", exc)
+
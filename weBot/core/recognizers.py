@@ -1,13 +1,17 @@
 """State recognition helpers that infer the current page from DOM cues."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from ..data.snapshots import get_snapshot_recorder
+from .cdp import evaluate_value
+from .selectors import Selector, resolve_selectors, script_selectors
 from .state import PageState, StateSnapshot
 
 
@@ -17,77 +21,187 @@ class RecognizerConfig:
     followers_modal_selector: str = "div[aria-labelledby$='followers']"
 
 
-def _element_exists(driver: WebDriver, by: By, value: str) -> bool:
-    try:
-        driver.find_element(by, value)
-        return True
-    except NoSuchElementException:
-        return False
+LOGIN_USERNAME_CUE = (By.NAME, "text")
+LOGIN_CHALLENGE_CUE = (By.XPATH, "//label[contains(., 'Phone or email')]")
+LOGIN_PASSWORD_CUE = (By.NAME, "password")
+ALERT_CUE = (By.CSS_SELECTOR, "[role='alert']")
+PRIMARY_COLUMN_CUE = (By.CSS_SELECTOR, "div[data-testid='primaryColumn']")
+HOME_LINK_CUE = (By.CSS_SELECTOR, "a[data-testid='AppTabBar_Home_Link'][aria-current='page']")
+PROFILE_CUE = (By.CSS_SELECTOR, "div[data-testid='UserName']")
+
+# Last (url, state) captured per driver, so polling loops record each page once.
+_LAST_CAPTURED: "weakref.WeakKeyDictionary[Any, Tuple[str, PageState]]" = weakref.WeakKeyDictionary()
+
+
+def _cue_candidates(config: RecognizerConfig) -> Tuple[Selector, ...]:
+    """Every DOM cue ``recognize_state`` looks at, resolved in one in-page call.
+
+    The cues identify different pages rather than standing in for one
+    another, so they are not a :class:`SelectorGroup` and their lookups are
+    kept out of the selector statistics.
+    """
+
+    return (
+        LOGIN_USERNAME_CUE,
+        LOGIN_CHALLENGE_CUE,
+        LOGIN_PASSWORD_CUE,
+        ALERT_CUE,
+        (By.CSS_SELECTOR, config.followers_modal_selector),
+        PRIMARY_COLUMN_CUE,
+        HOME_LINK_CUE,
+        PROFILE_CUE,
+    )
 
 
 def recognize_state(driver: WebDriver, config: Optional[RecognizerConfig] = None) -> StateSnapshot:
-    """Infer the current state using lightweight DOM heuristics."""
-    config = config or RecognizerConfig()
-    current_url = driver.current_url
+    """Infer the current state using lightweight DOM heuristics.
+
+    When snapshot recording is enabled the page is captured together with the
+    recognised state whenever the URL or the state changed since the last
+    capture for this driver, so polls such as ``ensure_state`` do not record
+    the same page over and over.
+    """
+    snapshot = _recognize(driver, config or RecognizerConfig())
+    recorder = get_snapshot_recorder()
+    if recorder is not None:
+        key = (snapshot.url, snapshot.state)
+        try:
+            changed = _LAST_CAPTURED.get(driver) != key
+        except TypeError:  # driver cannot be weakly referenced; capture every call
+            changed = True
+        if changed and recorder.capture(driver, url=snapshot.url, state=snapshot.state.name):
+            try:
+                _LAST_CAPTURED[driver] = key
+            except TypeError:
+                pass
+    return snapshot
+
+
+# Presence of every cue plus the few element details the heuristics read,
+# returned by value so the whole probe is one evaluation.
+_STATE_PROBE_SCRIPT = """
+const [candidates, alertSelector, columnSelector, homeSelector] = arguments;
+const lookup = ([kind, value]) => {
+    try {
+        return kind === 'xpath'
+            ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(value);
+    } catch (error) {
+        return null;
+    }
+};
+const displayed = (el) => {
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+};
+const column = document.querySelector(columnSelector);
+const home = document.querySelector(homeSelector);
+return {
+    url: window.location.href,
+    present: candidates.map((candidate) => lookup(candidate) !== null),
+    alerts: Array.from(document.querySelectorAll(alertSelector), (el) => (el.innerText || '').trim()),
+    aria_label: column ? column.getAttribute('aria-label') || '' : '',
+    aria_labelledby: column ? column.getAttribute('aria-labelledby') || '' : '',
+    home_link_displayed: home ? displayed(home) : false,
+};
+"""
+
+
+@dataclass
+class _Cues:
+    url: str
+    present: Set[Selector]
+    alerts: List[str] = field(default_factory=list)
+    aria_label: str = ""
+    aria_labelledby: str = ""
+    home_link_displayed: bool = False
+
+
+def _read_cues(driver: WebDriver, config: RecognizerConfig) -> _Cues:
+    candidates = _cue_candidates(config)
+    converted = script_selectors(candidates)
+    if converted is not None:
+        try:
+            result = evaluate_value(
+                driver, _STATE_PROBE_SCRIPT, converted, ALERT_CUE[1], PRIMARY_COLUMN_CUE[1], HOME_LINK_CUE[1]
+            )
+        except WebDriverException:
+            result = None
+        if isinstance(result, dict) and len(result.get("present") or ()) == len(candidates):
+            present = {selector for selector, hit in zip(candidates, result["present"]) if hit}
+            return _Cues(
+                url=result.get("url") or driver.current_url,
+                present=present,
+                alerts=[text for text in result.get("alerts") or () if text],
+                aria_label=(result.get("aria_label") or "").strip(),
+                aria_labelledby=(result.get("aria_labelledby") or "").lower(),
+                home_link_displayed=bool(result.get("home_link_displayed")),
+            )
+
+    # Drivers without JavaScript: resolve elements and read their details one by one.
+    matches = resolve_selectors(driver, candidates)
+    cues = _Cues(url=driver.current_url, present=set(matches))
+    try:
+        if ALERT_CUE in matches:
+            cues.alerts = [text for text in ((alert.text or "").strip() for alert in driver.find_elements(*ALERT_CUE)) if text]
+        timeline = matches.get(PRIMARY_COLUMN_CUE)
+        if timeline is not None:
+            cues.aria_label = (timeline.get_attribute("aria-label") or "").strip()
+            cues.aria_labelledby = (timeline.get_attribute("aria-labelledby") or "").lower()
+        home_link = matches.get(HOME_LINK_CUE)
+        if home_link is not None:
+            cues.home_link_displayed = home_link.is_displayed()
+    except (NoSuchElementException, StaleElementReferenceException):
+        pass
+    return cues
+
+
+def _recognize(driver: WebDriver, config: RecognizerConfig) -> StateSnapshot:
+    cues = _read_cues(driver, config)
+    current_url = cues.url
     metadata: Dict[str, str] = {}
 
     # Login states
-    if _element_exists(driver, By.NAME, "text") and "login" in current_url:
+    if LOGIN_USERNAME_CUE in cues.present and "login" in current_url:
         metadata["step"] = "username"
         return StateSnapshot(PageState.LOGIN_USERNAME, current_url, metadata)
-    if _element_exists(driver, By.XPATH, "//label[contains(., 'Phone or email')]"):
+    if LOGIN_CHALLENGE_CUE in cues.present:
         metadata["step"] = "challenge-email"
         return StateSnapshot(PageState.LOGIN_CHALLENGE, current_url, metadata)
-    if _element_exists(driver, By.NAME, "password"):
+    if LOGIN_PASSWORD_CUE in cues.present:
         metadata["step"] = "password"
         return StateSnapshot(PageState.LOGIN_PASSWORD, current_url, metadata)
 
     # Login error banner
-    try:
-        alerts = driver.find_elements(By.CSS_SELECTOR, "[role='alert']")
-        for alert in alerts:
-            text = (alert.text or "").strip()
-            if text:
-                metadata["message"] = text
-                if "could not log" in text.lower() or "try again later" in text.lower():
-                    return StateSnapshot(PageState.LOGIN_ERROR, current_url, metadata)
-    except NoSuchElementException:
-        pass
+    for text in cues.alerts:
+        metadata["message"] = text
+        if "could not log" in text.lower() or "try again later" in text.lower():
+            return StateSnapshot(PageState.LOGIN_ERROR, current_url, metadata)
 
     # Followers modal
-    if _element_exists(driver, By.CSS_SELECTOR, config.followers_modal_selector):
+    if (By.CSS_SELECTOR, config.followers_modal_selector) in cues.present:
         return StateSnapshot(PageState.FOLLOWERS_MODAL, current_url, metadata)
 
     # Home timeline detection
-    try:
-        timeline = driver.find_element(By.CSS_SELECTOR, "div[data-testid='primaryColumn']")
-        aria_label = (timeline.get_attribute("aria-label") or "").strip()
-        if aria_label:
-            metadata["aria_label"] = aria_label
-            if config.home_aria_label.lower() in aria_label.lower() or "home timeline" in aria_label.lower():
-                return StateSnapshot(PageState.HOME_TIMELINE, current_url, metadata)
-        # Some builds expose the home indicator via aria-labelledby instead
-        aria_labelledby = (timeline.get_attribute("aria-labelledby") or "").lower()
-        if "home" in aria_labelledby and "timeline" in aria_labelledby:
-            metadata["aria_labelledby"] = aria_labelledby
+    if cues.aria_label:
+        metadata["aria_label"] = cues.aria_label
+        if config.home_aria_label.lower() in cues.aria_label.lower() or "home timeline" in cues.aria_label.lower():
             return StateSnapshot(PageState.HOME_TIMELINE, current_url, metadata)
-    except NoSuchElementException:
-        pass
+    # Some builds expose the home indicator via aria-labelledby instead
+    if "home" in cues.aria_labelledby and "timeline" in cues.aria_labelledby:
+        metadata["aria_labelledby"] = cues.aria_labelledby
+        return StateSnapshot(PageState.HOME_TIMELINE, current_url, metadata)
 
     # URL / nav fallbacks for home detection
     if any(token in current_url for token in ("/home", "?home")):
         metadata["url_match"] = "home"
         return StateSnapshot(PageState.HOME_TIMELINE, current_url, metadata)
-    try:
-        home_link = driver.find_element(By.CSS_SELECTOR, "a[data-testid='AppTabBar_Home_Link'][aria-current='page']")
-        if home_link.is_displayed():
-            metadata["nav"] = "home-active"
-            return StateSnapshot(PageState.HOME_TIMELINE, current_url, metadata)
-    except NoSuchElementException:
-        pass
+    if cues.home_link_displayed:
+        metadata["nav"] = "home-active"
+        return StateSnapshot(PageState.HOME_TIMELINE, current_url, metadata)
 
     # Profile page detection
-    if "/status/" not in current_url and _element_exists(driver, By.CSS_SELECTOR, "div[data-testid='UserName']"):
+    if "/status/" not in current_url and PROFILE_CUE in cues.present:
         return StateSnapshot(PageState.PROFILE, current_url, metadata)
 
     # Search page detection
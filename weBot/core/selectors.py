@@ -0,0 +1,300 @@
+"""Selector fallback groups evaluated in one in-page call, with persisted hit statistics."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from .actions.utils import wait_for
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SELECTOR_STATS_PATH = Path(".webot/selector-stats.json")
+
+Selector = Tuple[str, str]
+
+_STATS_VERSION = 1
+
+# Resolves every candidate in one round trip; ``null`` marks a miss.
+_EVALUATE_SCRIPT = """
+const visible = (el) => {
+    if (!el || el.disabled) {
+        return false;
+    }
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+};
+return arguments[0].map(([kind, value]) => {
+    let el = null;
+    try {
+        el = kind === 'xpath'
+            ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(value);
+    } catch (error) {
+        el = null;
+    }
+    return el && (!arguments[1] || visible(el)) ? el : null;
+});
+"""
+
+
+def selector_key(selector: Selector) -> str:
+    by, value = selector
+    return f"{by}:{value}"
+
+
+def _script_selector(selector: Selector) -> Optional[List[str]]:
+    by, value = selector
+    if by == By.CSS_SELECTOR:
+        return ["css", value]
+    if by == By.XPATH:
+        return ["xpath", value]
+    if by == By.NAME:
+        return ["css", f"[name=\"{value}\"]"]
+    if by == By.ID:
+        return ["css", f"[id=\"{value}\"]"]
+    return None
+
+
+class SelectorStats:
+    """Hit counts per selector group, persisted as JSON under ``.webot``.
+
+    A group is *evaluated* each time it is looked up; every candidate that
+    matched during that lookup scores a *hit*. Candidates that never hit in
+    a group that has been evaluated are likely dead after a site change.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path or DEFAULT_SELECTOR_STATS_PATH).expanduser()
+        self._lock = threading.Lock()
+        self._groups: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    def record(self, group: str, matched: Iterable[Selector]) -> None:
+        now = time.time()
+        with self._lock:
+            entry = self._groups.setdefault(group, {"evaluations": 0, "selectors": {}})
+            entry["evaluations"] += 1
+            for selector in matched:
+                stats = entry["selectors"].setdefault(selector_key(selector), {"hits": 0, "last_hit": None})
+                stats["hits"] += 1
+                stats["last_hit"] = now
+            self._dirty = True
+
+    def hits(self, group: str, selector: Selector) -> int:
+        with self._lock:
+            entry = self._groups.get(group)
+            if entry is None:
+                return 0
+            return int(entry["selectors"].get(selector_key(selector), {}).get("hits", 0))
+
+    def evaluations(self, group: str) -> int:
+        with self._lock:
+            return int(self._groups.get(group, {}).get("evaluations", 0))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Copy of the recorded groups, safe to read without the lock."""
+
+        with self._lock:
+            return json.loads(json.dumps(self._groups))
+
+    def save(self) -> None:
+        """Write the statistics if anything changed since the last save."""
+
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"version": _STATS_VERSION, "groups": self._groups}
+            text = json.dumps(payload, indent=1, sort_keys=True)
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{self.path.name}-", suffix=".tmp", dir=self.path.parent)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.write(text)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.warning("Could not save selector statistics to %s: %s", self.path, exc)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != _STATS_VERSION:
+            return {}
+        groups = payload.get("groups")
+        return groups if isinstance(groups, dict) else {}
+
+
+_STATS: Optional[SelectorStats] = None
+_STATS_LOCK = threading.Lock()
+_GROUPS: Dict[str, "SelectorGroup"] = {}
+
+
+def get_selector_stats() -> SelectorStats:
+    """Return the process-wide statistics, loading them on first use."""
+
+    global _STATS
+    if _STATS is None:
+        with _STATS_LOCK:
+            if _STATS is None:
+                _STATS = SelectorStats()
+    return _STATS
+
+
+def set_selector_stats(stats: SelectorStats) -> None:
+    """Replace the process-wide statistics (e.g. to use a different file)."""
+
+    global _STATS
+    _STATS = stats
+
+
+class SelectorGroup:
+    """Interchangeable selectors for one UI element, tried as a unit.
+
+    All candidates are resolved with a single ``execute_script`` call instead
+    of one WebDriver round trip (or one timed-out wait) per candidate. When
+    several match, the candidate with the most recorded hits wins, falling
+    back to declaration order. Drivers without JavaScript (such as the
+    offline HTML backend) fall back to ``find_elements`` per candidate.
+
+    Parameters
+    ----------
+    name:
+        Unique key for the statistics file and reports.
+    candidates:
+        ``(By, value)`` pairs in preferred order.
+    """
+
+    def __init__(self, name: str, candidates: Sequence[Selector]) -> None:
+        if not candidates:
+            raise ValueError(f"Selector group '{name}' needs at least one candidate")
+        self.name = name
+        self.candidates: Tuple[Selector, ...] = tuple(candidates)
+        _GROUPS[name] = self
+
+    def ordered(self) -> List[Selector]:
+        """Candidates sorted by recorded hits (most first), stable on declaration order."""
+
+        stats = get_selector_stats()
+        return sorted(self.candidates, key=lambda selector: -stats.hits(self.name, selector))
+
+    def record(self, matched: Iterable[Selector]) -> None:
+        get_selector_stats().record(self.name, matched)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def probe(self, driver, *, visible: bool = False) -> Dict[Selector, Any]:
+        """Resolve every candidate; returns the matching ones mapped to their first element."""
+
+        matches = resolve_selectors(driver, self.candidates, visible=visible)
+        self.record(matches)
+        return matches
+
+    def find(self, driver, *, visible: bool = False):
+        """Return the element of the best-ranked matching candidate, or ``None``."""
+
+        ordered = self.ordered()
+        matches = resolve_selectors(driver, ordered, visible=visible)
+        self.record(matches)
+        return next((matches[selector] for selector in ordered if selector in matches), None)
+
+    def wait(self, driver, timeout: float = 10, *, visible: bool = True):
+        """Poll :meth:`find` until a candidate matches; raises ``TimeoutException`` otherwise.
+
+        One timeout covers the whole group, so a dead selector no longer
+        costs a full wait of its own before the next one is tried.
+        """
+
+        ordered = self.ordered()
+        found: Dict[Selector, Any] = {}
+
+        def condition(current_driver):
+            matches = resolve_selectors(current_driver, ordered, visible=visible)
+            if matches:
+                found.update(matches)
+                return next(matches[selector] for selector in ordered if selector in matches)
+            return False
+
+        try:
+            return wait_for(driver, condition, timeout)
+        except TimeoutException:
+            raise TimeoutException(f"No selector of group '{self.name}' matched within {timeout}s") from None
+        finally:
+            self.record(found)
+
+
+def script_selectors(candidates: Sequence[Selector]) -> Optional[List[List[str]]]:
+    """``candidates`` as ``[kind, value]`` pairs for in-page scripts, or ``None`` if one cannot be expressed."""
+
+    converted = [_script_selector(selector) for selector in candidates]
+    return converted if all(item is not None for item in converted) else None
+
+
+def resolve_selectors(driver, candidates: Sequence[Selector], *, visible: bool = False) -> Dict[Selector, Any]:
+    """Map each matching candidate to its first element, without recording statistics.
+
+    Used by :class:`SelectorGroup` and by probes of unrelated cues that are
+    not fallbacks for one another (and so have no business in the report).
+    """
+
+    converted = script_selectors(candidates)
+    if converted is not None:
+        try:
+            elements = driver.execute_script(_EVALUATE_SCRIPT, converted, visible)
+        except WebDriverException:
+            elements = None
+        if isinstance(elements, list) and len(elements) == len(candidates):
+            return {selector: element for selector, element in zip(candidates, elements) if element is not None}
+
+    matches: Dict[Selector, Any] = {}
+    for selector in candidates:
+        try:
+            elements = driver.find_elements(*selector)
+        except WebDriverException:
+            continue
+        if visible:
+            elements = [element for element in elements if element.is_displayed() and element.is_enabled()]
+        if elements:
+            matches[selector] = elements[0]
+    return matches
+
+
+def selector_report() -> List[Tuple[str, str, int, int, str]]:
+    """``(group, selector, hits, evaluations, note)`` rows for every known group.
+
+    Groups recorded in the statistics file but not defined in this process
+    are included too. Candidates with zero hits in an evaluated group are
+    flagged ``never hit``.
+    """
+
+    recorded = get_selector_stats().snapshot()
+    rows: List[Tuple[str, str, int, int, str]] = []
+    names = sorted(set(_GROUPS) | set(recorded))
+    for name in names:
+        entry = recorded.get(name, {"evaluations": 0, "selectors": {}})
+        evaluations = int(entry.get("evaluations", 0))
+        group = _GROUPS.get(name)
+        keys = [selector_key(selector) for selector in group.candidates] if group else []
+        keys.extend(key for key in entry.get("selectors", {}) if key not in keys)
+        for key in keys:
+            hits = int(entry.get("selectors", {}).get(key, {}).get("hits", 0))
+            note = "never hit" if evaluations and not hits else ""
+            if group is not None and key not in {selector_key(selector) for selector in group.candidates}:
+                note = "retired"
+            rows.append((name, key, hits, evaluations, note))
+    return rows
@@ -1,9 +1,12 @@
 """Shared state definitions for workflows and actions."""
 from __future__ import annotations
 
+import threading
+import time
+from array import array
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Dict, Optional
+from enum import Enum, IntEnum, auto
+from typing import Callable, Dict, Iterator, List, Optional, Set
 
 
 class PageState(Enum):
@@ -21,6 +24,183 @@ class PageState(Enum):
     ERROR = auto()
 
 
+class TransitionReason(IntEnum):
+    """Why the session context changed state."""
+
+    RECOGNIZED = 1
+    NAVIGATION = 2
+    ACTION = 3
+    MANUAL = 4
+    MISMATCH = 5
+    FAILED = 6
+
+
+# Reasons that count as failed transitions in journal summaries.
+FAILURE_REASONS = frozenset({TransitionReason.MISMATCH, TransitionReason.FAILED})
+
+StateListener = Callable[["PageState", "PageState", Dict[str, str]], None]
+
+
+class Transition:
+    """One journal entry, materialised on demand from the ring buffer."""
+
+    __slots__ = ("from_state", "state", "entered_at", "duration", "reason")
+
+    def __init__(
+        self,
+        from_state: PageState,
+        state: PageState,
+        entered_at: float,
+        duration: Optional[float],
+        reason: TransitionReason,
+    ) -> None:
+        self.from_state = from_state
+        self.state = state
+        self.entered_at = entered_at
+        self.duration = duration
+        self.reason = reason
+
+    def as_record(self, wall_offset: float = 0.0) -> Dict[str, object]:
+        return {
+            "at": round(self.entered_at + wall_offset, 3),
+            "from_state": self.from_state.name,
+            "state": self.state.name,
+            "duration": None if self.duration is None else round(self.duration, 3),
+            "reason": self.reason.name,
+        }
+
+
+class TransitionJournal:
+    """Fixed-size ring buffer of page-state transitions.
+
+    Entries live in parallel ``array`` columns (state and reason codes as
+    bytes, monotonic timestamps and durations as doubles), so memory stays
+    constant no matter how long the session runs. Cumulative time per state
+    and failure counts are tracked separately and cover the whole session,
+    including entries the ring has already overwritten.
+
+    Parameters
+    ----------
+    capacity:
+        Number of transitions kept.
+    """
+
+    def __init__(self, capacity: int = 512) -> None:
+        self.capacity = max(1, int(capacity))
+        # Loop threads record while the CLI thread reads; guards the columns and counters.
+        self._lock = threading.Lock()
+        self._from = array("B", bytes(self.capacity))
+        self._state = array("B", bytes(self.capacity))
+        self._reason = array("B", bytes(self.capacity))
+        self._entered = array("d", bytes(8 * self.capacity))
+        self._duration = array("d", bytes(8 * self.capacity))
+        self._next = 0
+        self._count = 0
+        self.total = 0
+        self.failures = 0
+        self._time_in_state: Dict[PageState, float] = {}
+        # Offset converting monotonic timestamps to epoch seconds for exports.
+        self.wall_offset = time.time() - time.monotonic()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, previous: PageState, state: PageState, reason: TransitionReason) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._count:
+                last = (self._next - 1) % self.capacity
+                elapsed = now - self._entered[last]
+                self._duration[last] = elapsed
+                left = PageState(self._state[last])
+                self._time_in_state[left] = self._time_in_state.get(left, 0.0) + elapsed
+            index = self._next
+            self._from[index] = previous.value
+            self._state[index] = state.value
+            self._reason[index] = int(reason)
+            self._entered[index] = now
+            self._duration[index] = -1.0
+            self._next = (index + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            self.total += 1
+            if reason in FAILURE_REASONS:
+                self.failures += 1
+
+    def entries(self, limit: Optional[int] = None) -> Iterator[Transition]:
+        """Transitions oldest first (the ``limit`` most recent when given).
+
+        The entries are copied under the lock, so iterating never observes a
+        half-written slot.
+        """
+
+        with self._lock:
+            count = self._count if limit is None else max(0, min(int(limit), self._count))
+            start = (self._next - count) % self.capacity
+            rows = []
+            for offset in range(count):
+                index = (start + offset) % self.capacity
+                rows.append((
+                    self._from[index],
+                    self._state[index],
+                    self._entered[index],
+                    self._duration[index],
+                    self._reason[index],
+                ))
+        for from_code, state_code, entered, duration, reason_code in rows:
+            yield Transition(
+                PageState(from_code),
+                PageState(state_code),
+                entered,
+                None if duration < 0 else duration,
+                TransitionReason(reason_code),
+            )
+
+    def time_in_state(self) -> Dict[PageState, float]:
+        """Seconds spent in each state this session, including the current one."""
+
+        with self._lock:
+            totals = dict(self._time_in_state)
+            if self._count:
+                last = (self._next - 1) % self.capacity
+                current = PageState(self._state[last])
+                totals[current] = totals.get(current, 0.0) + time.monotonic() - self._entered[last]
+        return totals
+
+    def describe(self, recent: int = 5) -> str:
+        with self._lock:
+            total, failures = self.total, self.failures
+        lines = [f"State journal: {total} transition(s), {failures} failed (keeping last {self.capacity})"]
+        totals = sorted(self.time_in_state().items(), key=lambda item: -item[1])
+        if totals:
+            lines.append("Time in state: " + ", ".join(f"{state.name} {seconds:.1f}s" for state, seconds in totals))
+        for entry in self.entries(recent):
+            duration = "current" if entry.duration is None else f"{entry.duration:.1f}s"
+            lines.append(f"  {entry.from_state.name} -> {entry.state.name} ({entry.reason.name.lower()}, {duration})")
+        return "\n".join(lines)
+
+
+class _AttributeMap(dict):
+    """Context attributes that remember which keys came from state metadata.
+
+    Writing a key directly (``attributes[key] = value``) hands it back to the
+    caller, so the next :meth:`SessionContext.update_state` leaves it alone.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metadata_keys: Set[str] = set()
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self.metadata_keys.discard(key)
+        super().__setitem__(key, value)
+
+    def replace_metadata(self, metadata: Dict[str, str]) -> None:
+        for key in self.metadata_keys.difference(metadata):
+            self.pop(key, None)
+        dict.update(self, metadata)
+        self.metadata_keys = set(metadata)
+
+
 @dataclass
 class SessionContext:
     """Aggregated runtime metadata shared across workflows."""
@@ -32,14 +212,35 @@ class SessionContext:
     attributes: Dict[str, str] = field(default_factory=dict)
     post_index: int = 0
     login_method: str = "manual"
+    listeners: List[StateListener] = field(default_factory=list, repr=False, compare=False)
+    journal: TransitionJournal = field(default_factory=TransitionJournal, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        self.attributes = _AttributeMap(self.attributes)
         self.attributes.setdefault("login_method", self.login_method)
 
-    def update_state(self, new_state: PageState, **attributes: str) -> None:
+    def update_state(
+        self,
+        new_state: PageState,
+        *,
+        reason: TransitionReason = TransitionReason.RECOGNIZED,
+        **attributes: str,
+    ) -> None:
+        """Move to ``new_state``, journaling changes and failed transitions.
+
+        ``attributes`` replaces the metadata of the previous update instead of
+        accumulating, so keys describing an older page do not linger. Keys
+        written directly into :attr:`attributes` since then are kept.
+        """
+
+        previous = self.current_state
         self.current_state = new_state
-        if attributes:
-            self.attributes.update(attributes)
+        self.attributes.replace_metadata(attributes)
+        if new_state != previous or reason in FAILURE_REASONS:
+            self.journal.record(previous, new_state, reason)
+        if new_state != previous:
+            for listener in self.listeners:
+                listener(previous, new_state, attributes)
 
     def set_login_method(self, method: str) -> None:
         self.login_method = method
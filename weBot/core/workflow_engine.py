@@ -7,7 +7,7 @@ from typing import Callable, Dict
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from .recognizers import recognize_state
-from .state import ActionResult, PageState, SessionContext, TransitionError
+from .state import ActionResult, PageState, SessionContext, TransitionError, TransitionReason
 
 StateHandler = Callable[[WebDriver, SessionContext], ActionResult]
 
@@ -32,7 +32,8 @@ class WorkflowEngine:
                 )
             result = handler(self.driver, self.context)
             next_state = result.next_state or recognize_state(self.driver).state
-            self.context.update_state(next_state, **(result.metadata or {}))
+            reason = TransitionReason.ACTION if result.success else TransitionReason.FAILED
+            self.context.update_state(next_state, reason=reason, **(result.metadata or {}))
             if result.success and next_state == PageState.HOME_TIMELINE:
                 self.context.logged_in = True
                 return next_state
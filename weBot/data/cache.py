@@ -0,0 +1,121 @@
+"""On-disk cache for profile lookups."""
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+_HANDLE_PATTERN = re.compile(r"^[a-z0-9_]{1,50}$")
+
+HEADER_SECTION = "header"
+LISTS_SECTION = "lists"
+
+
+def normalize_handle(handle: str) -> Optional[str]:
+    """Return the cache key for ``handle`` or ``None`` if it cannot be cached."""
+
+    candidate = handle.strip().lstrip("@").rstrip("/").split("/")[-1].lower()
+    if not _HANDLE_PATTERN.fullmatch(candidate):
+        return None
+    return candidate
+
+
+class ProfileCache:
+    """JSON-file cache of profile data keyed by normalised handle.
+
+    Header fields (name, bio, counts) and follower/following lists are stored
+    as separate entries with their own TTL, so a cheap header refresh does not
+    invalidate an expensive list harvest and vice versa.
+
+    Parameters
+    ----------
+    root:
+        Cache directory. Defaults to ``.webot/cache/profiles``.
+    ttl:
+        Seconds a header entry stays fresh. ``0`` disables header caching.
+    lists_ttl:
+        Seconds a follower/following entry stays fresh. Defaults to ``ttl``.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        *,
+        ttl: float = 3600.0,
+        lists_ttl: Optional[float] = None,
+    ) -> None:
+        self.root = Path(root or Path(".webot/cache/profiles")).expanduser().absolute()
+        self.ttls = {
+            HEADER_SECTION: float(ttl),
+            LISTS_SECTION: float(ttl if lists_ttl is None else lists_ttl),
+        }
+        self._lock = threading.Lock()
+        self._stats = {section: {"hits": 0, "misses": 0} for section in self.ttls}
+
+    # ------------------------------------------------------------------
+    # Section access
+    # ------------------------------------------------------------------
+    def get(self, section: str, handle: str) -> Optional[Dict[str, Any]]:
+        key = normalize_handle(handle)
+        ttl = self.ttls[section]
+        entry = self._read(section, key) if key and ttl > 0 else None
+        fresh = entry is not None and time.time() - float(entry.get("stored_at", 0)) <= ttl
+        with self._lock:
+            self._stats[section]["hits" if fresh else "misses"] += 1
+        return entry.get("data") if fresh and entry else None
+
+    def put(self, section: str, handle: str, data: Dict[str, Any]) -> None:
+        key = normalize_handle(handle)
+        if not key or self.ttls[section] <= 0:
+            return
+        directory = self.root / section
+        directory.mkdir(parents=True, exist_ok=True)
+        payload = {"handle": key, "stored_at": time.time(), "data": data}
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{key}-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False)
+            os.replace(tmp_name, directory / f"{key}.json")
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def invalidate(self, handle: str) -> None:
+        key = normalize_handle(handle)
+        if not key:
+            return
+        for section in self.ttls:
+            (self.root / section / f"{key}.json").unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {section: dict(counts) for section, counts in self._stats.items()}
+
+    def describe_stats(self) -> str:
+        parts = []
+        for section, counts in self.stats().items():
+            parts.append(f"{section} {counts['hits']} hit(s)/{counts['misses']} miss(es)")
+        return "Profile cache: " + ", ".join(parts)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _read(self, section: str, key: str) -> Optional[Dict[str, Any]]:
+        path = self.root / section / f"{key}.json"
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        # Anything but a well-formed entry (say, a hand-edited file) counts as a miss.
+        if not isinstance(entry, dict) or not isinstance(entry.get("stored_at"), (int, float)):
+            return None
+        return entry
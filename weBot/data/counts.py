@@ -0,0 +1,91 @@
+"""Normalisation of display counts such as ``1.2K`` or ``3,456``."""
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+_SUFFIXES = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+_SPACES = re.compile(r"[\s\u00a0\u202f]+")
+_COUNT_TOKEN = re.compile(r"^(\d[\d.,]*)([KMB])?$")
+_GROUPED = re.compile(r"^\d{1,3}(?:[.,]\d{3})+$")
+
+# Matches "<count> <label>" pairs inside aria-labels such as
+# "12 replies, 1.2K reposts, 3,456 likes". Non-breaking spaces are accepted as
+# thousands separators, regular spaces only as the count/label delimiter.
+ENGAGEMENT_PATTERN = re.compile(r"(\d[\d.,\u00a0\u202f]*[KMBkmb]?)\s+(\w+)")
+
+
+def parse_count(raw: object) -> Optional[int]:
+    """Convert a display count to an integer.
+
+    Understands ``K``/``M``/``B`` suffixes (``"1.2K"`` -> ``1200``), comma,
+    dot and (non-breaking) space thousands separators (``"3,456"``,
+    ``"3.456"``, ``"3 456"``) and decimal commas in abbreviated values
+    (``"1,2K"``). Unabbreviated decimals are rounded like float inputs
+(``"1,5"`` -> ``2``, ``"1,234.6"`` -> ``1235``).
+    Returns ``None`` for missing or unparsable values.
+    """
+
+    if raw is None or isinstance(raw, bool):
+        return None
+    if isinstance(raw, int):
+        return raw
+    if isinstance(raw, float):
+        return int(round(raw))
+
+    text = _SPACES.sub("", str(raw)).upper()
+    match = _COUNT_TOKEN.match(text)
+    if not match:
+        return None
+    digits, suffix = match.groups()
+    digits = digits.rstrip(".,")
+
+    if suffix:
+        # Abbreviated values carry at most one decimal separator.
+        value_text = digits.replace(",", ".")
+        if value_text.count(".") > 1:
+            return None
+        return int(round(float(value_text) * _SUFFIXES[suffix]))
+
+    if "," in digits and "." in digits:
+        # Mixed separators: the last one is the decimal mark.
+        decimal = "," if digits.rfind(",") > digits.rfind(".") else "."
+        integer_part, fraction = digits.rsplit(decimal, 1)
+        return int(round(float(f"{integer_part.replace(',', '').replace('.', '')}.{fraction}")))
+    if _GROUPED.match(digits):
+        return int(digits.replace(",", "").replace(".", ""))
+    if "," in digits or "." in digits:
+        # A lone separator not followed by a three-digit group is a decimal
+        # mark; round like float inputs do.
+        return int(round(float(digits.replace(",", "."))))
+    return int(digits)
+
+
+def parse_counts(values: Iterable[object]) -> List[Optional[int]]:
+    """Vectorised :func:`parse_count` for many records at once.
+
+    Identical display strings (very common for ``"0"`` or rounded values such
+    as ``"1K"``) are parsed once per call.
+    """
+
+    memo: Dict[object, Optional[int]] = {}
+    results: List[Optional[int]] = []
+    for value in values:
+        key = value if isinstance(value, (str, int, float, type(None))) else str(value)
+        if key not in memo:
+            memo[key] = parse_count(value)
+        results.append(memo[key])
+    return results
+
+
+def parse_engagement_label(label: Optional[str]) -> Dict[str, int]:
+    """Extract ``{label: count}`` pairs from an engagement aria-label."""
+
+    stats: Dict[str, int] = {}
+    if not label:
+        return stats
+    for raw_value, key in ENGAGEMENT_PATTERN.findall(label):
+        value = parse_count(raw_value)
+        if value is not None:
+            stats[key] = value
+    return stats
@@ -7,13 +7,24 @@ from typing import Dict, Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+from .counts import parse_engagement_label
+
+_STATUS_ID_PATTERN = re.compile(r"/status/(\d+)")
+
+
+def status_id_from_link(link: Optional[str]) -> Optional[int]:
+    """Return the numeric status id embedded in a post permalink."""
+
+    if not link:
+        return None
+    match = _STATUS_ID_PATTERN.search(link)
+    return int(match.group(1)) if match else None
+
 
 def extract_engagement_stats(label: str) -> Dict[str, int]:
-    stats = {}
-    pattern = r"(\d+(?:,\d+)*)\s+(\w+)"
-    for value, key in re.findall(pattern, label):
-        stats[key] = int(value.replace(",", ""))
-    return stats
+    """Parse an engagement aria-label, including abbreviated counts like ``1.2K``."""
+
+    return parse_engagement_label(label)
 
 
 def fetch_post_data(post: WebElement) -> Optional[Dict[str, object]]:
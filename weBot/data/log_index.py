@@ -0,0 +1,215 @@
+"""Incremental indexer aggregating action outcomes from session logs."""
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .session_log import DEFAULT_LOG_DIR
+
+INDEX_NAME = ".stats-index.json"
+LOG_GLOB = "session-*.log*"
+
+_INDEX_VERSION = 1
+_HEAD_BYTES = 64
+_READ_CHUNK = 1 << 20
+
+_LINE = re.compile(rb"^(\d{4}-\d{2}-\d{2}) [\d:,]+ \[(\w+)\] (.*)$")
+_PAIR = re.compile(rb"(\w+)=(\S+)")
+_MANUAL_ACTION = re.compile(rb"^(Like|Repost|Quote|Comment|MakePost) command completed; success=(True|False)")
+_COMMAND = re.compile(rb"^Command received: (\S+)")
+_LOOP_ACTIONS = (b"like", b"repost", b"comment")
+
+
+@dataclass
+class FileStats:
+    """Aggregates for one log file plus the position parsing stopped at."""
+
+    path: str
+    offset: int = 0
+    head: str = ""
+    cycle: Optional[int] = None
+    cycles: int = 0
+    scroll_failures: int = 0
+    days: Dict[str, Dict[str, List[int]]] = field(default_factory=dict)
+    commands: Dict[str, int] = field(default_factory=dict)
+
+    def count_action(self, day: str, action: str, success: bool) -> None:
+        totals = self.days.setdefault(day, {}).setdefault(action, [0, 0])
+        totals[0] += 1
+        totals[1] += int(success)
+
+    def feed(self, line: bytes) -> None:
+        match = _LINE.match(line)
+        if match is None:  # traceback or other continuation line
+            return
+        day = match.group(1).decode()
+        message = match.group(3)
+        if message.startswith(b"cycle="):
+            pairs = dict(_PAIR.findall(message))
+            try:
+                cycle = int(pairs[b"cycle"])
+            except (KeyError, ValueError):
+                return
+            if cycle != self.cycle:
+                self.cycle = cycle
+                self.cycles += 1
+            if b"scroll failed" in message:
+                self.scroll_failures += 1
+                self.count_action(day, "scroll", False)
+                return
+            if b"author" in pairs:  # harvested post line; its text may contain anything
+                return
+            for action in _LOOP_ACTIONS:
+                value = pairs.get(action)
+                if value in (b"True", b"False"):
+                    self.count_action(day, action.decode(), value == b"True")
+            return
+        if message.startswith(b"random_engage loop starting"):
+            self.cycle = None
+            return
+        manual = _MANUAL_ACTION.match(message)
+        if manual is not None:
+            self.count_action(day, manual.group(1).decode().lower(), manual.group(2) == b"True")
+            return
+        command = _COMMAND.match(message)
+        if command is not None:
+            name = command.group(1).decode(errors="replace")
+            self.commands[name] = self.commands.get(name, 0) + 1
+
+
+@dataclass
+class LogStats:
+    """Totals across every indexed log file."""
+
+    files: int = 0
+    bytes_parsed: int = 0
+    cycles: int = 0
+    scroll_failures: int = 0
+    days: Dict[str, Dict[str, List[int]]] = field(default_factory=dict)
+    commands: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def scroll_failures_per_cycle(self) -> float:
+        return self.scroll_failures / self.cycles if self.cycles else 0.0
+
+    def add(self, stats: FileStats) -> None:
+        self.files += 1
+        self.cycles += stats.cycles
+        self.scroll_failures += stats.scroll_failures
+        for day, actions in stats.days.items():
+            merged = self.days.setdefault(day, {})
+            for action, (total, ok) in actions.items():
+                totals = merged.setdefault(action, [0, 0])
+                totals[0] += total
+                totals[1] += ok
+        for name, count in stats.commands.items():
+            self.commands[name] = self.commands.get(name, 0) + count
+
+    def rows(self) -> Iterator[Tuple[str, str, int, int, str]]:
+        """``(day, action, total, ok, success %)`` rows, most recent day first."""
+
+        for day in sorted(self.days, reverse=True):
+            for action, (total, ok) in sorted(self.days[day].items()):
+                yield day, action, total, ok, f"{100.0 * ok / total:.1f}" if total else ""
+
+
+class LogIndex:
+    """Sidecar index of how far each session log has been parsed.
+
+    Entries are keyed by device and inode, so a log renamed by size-based
+    rotation keeps its offset. Files are read in binary from the stored
+    offset and only complete lines are consumed; a file that shrank or whose
+    first bytes changed is parsed again from the start. Entries for deleted
+    files are dropped, so totals always describe the logs on disk.
+
+    Parameters
+    ----------
+    log_dir:
+        Directory holding ``session-*.log`` files. Defaults to ``logs/``.
+    index_path:
+        Location of the sidecar index (default ``<log_dir>/.stats-index.json``).
+    """
+
+    def __init__(self, log_dir: Optional[Path] = None, *, index_path: Optional[Path] = None) -> None:
+        self.log_dir = Path(log_dir or DEFAULT_LOG_DIR)
+        self.index_path = Path(index_path or self.log_dir / INDEX_NAME)
+        self._entries: Dict[str, FileStats] = self._load()
+
+    def update(self) -> LogStats:
+        """Parse data appended since the last run, save the index and return the totals."""
+
+        totals = LogStats()
+        entries: Dict[str, FileStats] = {}
+        for path in sorted(self.log_dir.glob(LOG_GLOB)):
+            if ".jsonl" in path.name or not path.is_file():
+                continue
+            stat = path.stat()
+            key = f"{stat.st_dev}:{stat.st_ino}"
+            entry = self._entries.get(key)
+            with path.open("rb") as fh:
+                head = fh.read(_HEAD_BYTES).hex()
+                if entry is None or stat.st_size < entry.offset or not head.startswith(entry.head):
+                    entry = FileStats(path=str(path))
+                entry.path = str(path)
+                entry.head = head
+                totals.bytes_parsed += self._parse(fh, entry)
+            entries[key] = entry
+            totals.add(entry)
+        self._entries = entries
+        self._save()
+        return totals
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _parse(fh, entry: FileStats) -> int:
+        fh.seek(entry.offset)
+        start = entry.offset
+        remainder = b""
+        while True:
+            chunk = fh.read(_READ_CHUNK)
+            if not chunk:
+                break
+            lines = (remainder + chunk).split(b"\n")
+            remainder = lines.pop()
+            for line in lines:
+                entry.feed(line.rstrip(b"\r"))
+                entry.offset += len(line) + 1
+        # A trailing partial line is left for the next run.
+        return entry.offset - start
+
+    def _load(self) -> Dict[str, FileStats]:
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != _INDEX_VERSION:
+            return {}
+        entries = {}
+        for key, raw in (payload.get("files") or {}).items():
+            try:
+                entries[key] = FileStats(**raw)
+            except TypeError:
+                continue
+        return entries
+
+    def _save(self) -> None:
+        payload: Dict[str, Any] = {
+            "version": _INDEX_VERSION,
+            "files": {key: entry.__dict__ for key, entry in self._entries.items()},
+        }
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{self.index_path.name}-", suffix=".tmp", dir=self.index_path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh)
+            os.replace(tmp_name, self.index_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
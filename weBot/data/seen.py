@@ -0,0 +1,176 @@
+"""Persistent index of processed post ids for cross-run deduplication."""
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterable, Optional, Set
+
+DEFAULT_SEEN_PATH = Path(".webot/seen-posts.idx")
+
+_ITEM_SIZE = array("q").itemsize
+
+
+class SeenPostIndex:
+    """Set of processed status ids backed by a memory-mapped sorted array.
+
+    The on-disk index is a flat array of native-endian int64 values in sorted
+    order, mapped read-only so opening even millions of ids only costs an
+    ``mmap`` call. Lookups binary-search the mapping (about 20 probes per
+    million ids, no parsing) and then check a small in-memory set of ids added
+    since the last compaction. New ids are appended to a ``.journal`` file so
+    a crash loses nothing that was already recorded; :meth:`compact` merges
+    the journal into a new sorted array and atomically replaces the index.
+
+    Parameters
+    ----------
+    path:
+        Index file. Defaults to ``.webot/seen-posts.idx``.
+    compact_threshold:
+        Number of journalled ids that triggers an automatic compaction.
+    """
+
+    def __init__(self, path: Optional[Path] = None, *, compact_threshold: int = 100_000) -> None:
+        self.path = Path(path or DEFAULT_SEEN_PATH).expanduser().absolute()
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        self.compact_threshold = max(1, int(compact_threshold))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._raw_view: Optional[memoryview] = None
+        self._sorted: memoryview | array = array("q")
+        self._pending: Set[int] = set()
+        self._map_index()
+        self._load_journal()
+        self._journal = self.journal_path.open("ab")
+
+    # ------------------------------------------------------------------
+    # Context manager helpers
+    # ------------------------------------------------------------------
+    def __enter__(self) -> "SeenPostIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Set API
+    # ------------------------------------------------------------------
+    def __contains__(self, status_id: object) -> bool:
+        if status_id is None:
+            return False
+        value = int(status_id)  # type: ignore[arg-type]
+        with self._lock:
+            if value in self._pending:
+                return True
+            return self._in_sorted(value)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sorted) + len(self._pending)
+
+    def add(self, status_id: object) -> bool:
+        """Record ``status_id``; returns ``False`` when it was already known."""
+
+        return self.add_many((status_id,)) == 1
+
+    def add_many(self, status_ids: Iterable[object]) -> int:
+        added = array("q")
+        with self._lock:
+            for status_id in status_ids:
+                if status_id is None:
+                    continue
+                value = int(status_id)  # type: ignore[arg-type]
+                if value in self._pending or self._in_sorted(value):
+                    continue
+                self._pending.add(value)
+                added.append(value)
+            if added:
+                added.tofile(self._journal)
+                self._journal.flush()
+            if len(self._pending) >= self.compact_threshold:
+                self.compact()
+        return len(added)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def compact(self) -> None:
+        """Merge journalled ids into the sorted index and truncate the journal."""
+
+        with self._lock:
+            if not self._pending:
+                return
+            merged = array("q", heapq.merge(self._sorted, sorted(self._pending)))
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with tmp_path.open("wb") as fh:
+                merged.tofile(fh)
+                fh.flush()
+                os.fsync(fh.fileno())
+            self._unmap()
+            os.replace(tmp_path, self.path)
+            self._journal.close()
+            self._journal = self.journal_path.open("wb")
+            self._pending.clear()
+            self._map_index()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._journal.closed:
+                return
+            self.compact()
+            self._journal.close()
+            self._unmap()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _in_sorted(self, value: int) -> bool:
+        view = self._sorted
+        index = bisect_left(view, value)
+        return index < len(view) and view[index] == value
+
+    def _map_index(self) -> None:
+        if not self.path.exists() or self.path.stat().st_size < _ITEM_SIZE:
+            self._sorted = array("q")
+            return
+        self._file = self.path.open("rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        usable = len(self._mmap) - len(self._mmap) % _ITEM_SIZE
+        self._raw_view = memoryview(self._mmap)[:usable]
+        self._sorted = self._raw_view.cast("q")
+
+    def _unmap(self) -> None:
+        if isinstance(self._sorted, memoryview):
+            self._sorted.release()
+        if self._raw_view is not None:
+            self._raw_view.release()
+            self._raw_view = None
+        self._sorted = array("q")
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _load_journal(self) -> None:
+        if not self.journal_path.exists():
+            return
+        data = self.journal_path.read_bytes()
+        usable = len(data) - len(data) % _ITEM_SIZE
+        if usable != len(data):
+            # A crash tore the last record; drop it so later appends stay aligned.
+            with self.journal_path.open("r+b") as fh:
+                fh.truncate(usable)
+        journal = array("q")
+        journal.frombytes(data[:usable])
+        for value in journal:
+            if not self._in_sorted(value):
+                self._pending.add(value)
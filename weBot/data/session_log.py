@@ -0,0 +1,164 @@
+"""Queue-backed session logging with a structured JSONL companion file."""
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import queue
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_LOG_DIR = Path("logs")
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+# Keys whose value is the outcome of a browser action.
+ACTION_KEYS = frozenset({"like", "repost", "comment", "quote", "bookmark", "scroll", "follow", "unfollow"})
+
+_PLACEHOLDER = re.compile(r"(?:(\w+)=)?%[-#0 +]*\d*(?:\.\d+)?[sdifr]")
+
+
+@lru_cache(maxsize=256)
+def _placeholder_keys(template: str) -> Tuple[Optional[str], ...]:
+    """Field name preceding each ``%s``-style placeholder (``None`` when unnamed)."""
+
+    return tuple(match.group(1) for match in _PLACEHOLDER.finditer(template.replace("%%", "")))
+
+
+def structured_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    """Pull ``key=%s`` pairs out of a record's format string and arguments.
+
+    ``logger.info("cycle=%s post=%s like=%s", 1, 2, True)`` yields
+    ``{"cycle": 1, "post": 2, "like": True, "action": "like", "success": True}``.
+    Fields passed via ``extra={"fields": {...}}`` are merged in as well.
+    """
+
+    fields: Dict[str, Any] = {}
+    template = getattr(record, "template", record.msg)
+    args = getattr(record, "template_args", record.args)
+    args = args if isinstance(args, tuple) else ()
+    if args and isinstance(template, str):
+        for key, value in zip(_placeholder_keys(template), args):
+            if key:
+                fields[key] = value
+    extra = getattr(record, "fields", None)
+    if isinstance(extra, dict):
+        fields.update(extra)
+    for key in ACTION_KEYS:
+        if key in fields and "action" not in fields:
+            fields["action"] = key
+            fields["success"] = fields[key]
+            break
+    return fields
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per record with the rendered message and its structured fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        payload.update(structured_fields(record))
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Render the message on the caller's thread; leave the structured fields to the writer.
+
+    The message is formatted before the record is queued, so arguments that
+    are mutated after the log call (a dict of counters, a list of handles)
+    are logged as they were at the call. The template and arguments are kept
+    on the record for :func:`structured_fields`, and the traceback is
+    rendered to ``exc_text`` so no frame references cross the queue.
+    """
+
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.template = record.msg
+        record.template_args = record.args
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class SessionLog:
+    """Session log files fed through a queue by a background writer thread.
+
+    The calling thread (often the one driving the browser) only appends the
+    record to an in-memory queue. A :class:`~logging.handlers.QueueListener`
+    formats and writes it to ``session-<ts>.log`` (human readable) and
+    ``session-<ts>.jsonl`` (structured), both rotated by size.
+
+    Parameters
+    ----------
+    logger_name:
+        Logger to attach to.
+    log_dir:
+        Directory for the log files. Defaults to ``logs/``.
+    max_bytes / backup_count:
+        Size-based rotation settings for both files.
+    """
+
+    def __init__(
+        self,
+        logger_name: str,
+        *,
+        log_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ) -> None:
+        self.logger = logging.getLogger(logger_name)
+        self.log_dir = Path(log_dir or DEFAULT_LOG_DIR)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        self.text_path = self.log_dir / f"session-{timestamp}.log"
+        self.json_path = self.log_dir / f"session-{timestamp}.jsonl"
+
+        text_handler = RotatingFileHandler(self.text_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        text_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        json_handler = RotatingFileHandler(self.json_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        json_handler.setFormatter(JsonLineFormatter())
+        self._handlers: List[logging.Handler] = [text_handler, json_handler]
+
+        self._queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._queue_handler = _DeferredQueueHandler(self._queue)
+        self._listener = QueueListener(self._queue, *self._handlers, respect_handler_level=True)
+        self._listener.start()
+
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(self._queue_handler)
+        self._closed = False
+
+    def close(self) -> None:
+        """Detach from the logger, write every queued record and close the files."""
+
+        if self._closed:
+            return
+        self._closed = True
+        self.logger.removeHandler(self._queue_handler)
+        self._listener.stop()
+        for handler in self._handlers:
+            handler.flush()
+            handler.close()
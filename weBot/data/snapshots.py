@@ -0,0 +1,329 @@
+"""Content-addressed store of page snapshots captured during normal runs."""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:  # Optional dependency for zstd compression
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - zstd is optional
+    zstandard = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_ROOT = Path(".webot/snapshots")
+
+# First path segments that are site routes rather than user handles.
+_RESERVED_ROUTES = {
+    "home",
+    "explore",
+    "search",
+    "notifications",
+    "messages",
+    "settings",
+    "login",
+    "logout",
+    "i",
+    "compose",
+    "tos",
+    "privacy",
+}
+_NUMERIC = re.compile(r"^\d+$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_objects_last_used ON objects(last_used);
+CREATE TABLE IF NOT EXISTS captures (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    hash TEXT NOT NULL REFERENCES objects(hash) ON DELETE CASCADE,
+    url TEXT NOT NULL,
+    url_pattern TEXT NOT NULL,
+    state TEXT NOT NULL,
+    captured_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_captures_lookup ON captures(url_pattern, state);
+CREATE INDEX IF NOT EXISTS idx_captures_hash ON captures(hash);
+"""
+
+
+def url_pattern(url: str) -> str:
+    """Collapse a URL into a route pattern such as ``/{handle}/status/{id}``."""
+
+    parts = urlsplit(url or "")
+    segments = [segment for segment in parts.path.split("/") if segment]
+    pattern = []
+    for index, segment in enumerate(segments):
+        if _NUMERIC.match(segment):
+            pattern.append("{id}")
+        elif index == 0 and segment.lower() not in _RESERVED_ROUTES:
+            pattern.append("{handle}")
+        else:
+            pattern.append(segment.lower())
+    return "/" + "/".join(pattern)
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    """Index row describing one captured page."""
+
+    hash: str
+    url: str
+    url_pattern: str
+    state: str
+    captured_at: float
+    path: Path
+
+
+class SnapshotStore:
+    """Deduplicated, compressed ``outerHTML`` snapshots with LRU eviction.
+
+    Each distinct document is stored once under ``objects/<aa>/<hash>`` and
+    compressed with zstd (gzip when ``zstandard`` is not installed). Every
+    capture adds an index row with the URL, its route pattern and the
+    recognised ``PageState``. When the stored bytes exceed ``max_bytes`` the
+    least recently captured objects are evicted.
+    """
+
+    def __init__(self, root: Optional[Path] = None, *, max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.root = Path(root or DEFAULT_SNAPSHOT_ROOT).expanduser().absolute()
+        self.objects = self.root / "objects"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self.suffix = ".html.zst" if zstandard is not None else ".html.gz"
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.root / "index.db", check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.executescript(_SCHEMA)
+        self._compressor = zstandard.ZstdCompressor(level=10) if zstandard is not None else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def add(self, html: str, *, url: str, state: str) -> Tuple[str, bool]:
+        """Store ``html`` for ``url``/``state``; returns ``(hash, newly_stored)``."""
+
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        now = time.time()
+        with self._lock:
+            exists = self._db.execute("SELECT 1 FROM objects WHERE hash = ?", (digest,)).fetchone() is not None
+            if not exists:
+                size = self._write_object(digest, data)
+                self._db.execute(
+                    "INSERT INTO objects (hash, size, stored_at, last_used) VALUES (?, ?, ?, ?)",
+                    (digest, size, now, now),
+                )
+            else:
+                self._db.execute("UPDATE objects SET last_used = ? WHERE hash = ?", (now, digest))
+            self._db.execute(
+                "INSERT INTO captures (hash, url, url_pattern, state, captured_at) VALUES (?, ?, ?, ?, ?)",
+                (digest, url, url_pattern(url), state, now),
+            )
+            self._db.commit()
+            if not exists:
+                self._evict()
+        return digest, not exists
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def entries(
+        self,
+        *,
+        state: Optional[str] = None,
+        pattern: Optional[str] = None,
+        distinct: bool = True,
+    ) -> Iterator[SnapshotEntry]:
+        """Iterate over indexed captures, optionally filtered by state or URL pattern."""
+
+        clauses, params = [], []
+        if state:
+            clauses.append("state = ?")
+            params.append(state)
+        if pattern:
+            clauses.append("url_pattern = ?")
+            params.append(pattern)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        group = "GROUP BY hash, state" if distinct else ""
+        sql = (
+            f"SELECT hash, url, url_pattern, state, MAX(captured_at) FROM captures {where} {group} "
+            "ORDER BY MAX(captured_at) DESC"
+            if distinct
+            else f"SELECT hash, url, url_pattern, state, captured_at FROM captures {where} ORDER BY captured_at DESC"
+        )
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        for digest, url, pattern_value, state_value, captured_at in rows:
+            yield SnapshotEntry(digest, url, pattern_value, state_value, captured_at, self._object_path(digest))
+
+    def read(self, digest: str) -> str:
+        return read_snapshot(self._object_path(digest))
+
+    def stats(self) -> dict:
+        with self._lock:
+            objects, total = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects").fetchone()
+            captures = self._db.execute("SELECT COUNT(*) FROM captures").fetchone()[0]
+        return {"objects": objects, "bytes": total, "captures": captures, "max_bytes": self.max_bytes}
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / f"{digest}{self.suffix}"
+
+    def _write_object(self, digest: str, data: bytes) -> int:
+        path = self._object_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = self._compressor.compress(data) if self._compressor is not None else gzip.compress(data, 6)
+        tmp_path = path.with_name(path.name + ".part")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+        return len(payload)
+
+    def _evict(self) -> None:
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for digest, size in self._db.execute("SELECT hash, size FROM objects ORDER BY last_used ASC"):
+            if total <= self.max_bytes:
+                break
+            victims.append(digest)
+            total -= size
+        for digest in victims:
+            self._object_path(digest).unlink(missing_ok=True)
+        self._db.executemany("DELETE FROM objects WHERE hash = ?", [(digest,) for digest in victims])
+        self._db.commit()
+        logger.info("Evicted %s snapshot(s) to respect the %s byte cap", len(victims), self.max_bytes)
+
+
+def read_snapshot(path: Path) -> str:
+    """Decode a stored snapshot (``.zst``/``.gz``) or a plain ``.html`` file."""
+
+    path = Path(path)
+    data = path.read_bytes()
+    if path.name.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError("The zstandard package is required to read .zst snapshots")
+        data = zstandard.ZstdDecompressor().decompress(data, max_output_size=256 * 1024 * 1024)
+    elif path.name.endswith(".gz"):
+        data = gzip.decompress(data)
+    return data.decode("utf-8", errors="replace")
+
+
+class SnapshotRecorder:
+    """Capture the live DOM into a :class:`SnapshotStore` whenever a state is recognised.
+
+    Only the ``outerHTML`` read happens on the driver thread; hashing,
+    compression and the index write run on a background thread. Recording
+    is a debugging aid, so a failing store (disk full, SQLite or
+    compression errors) is logged and never reaches ``recognize_state``.
+    When the queue is full the capture is dropped rather than blocking the
+    browser.
+    """
+
+    _SCRIPT = "return document.documentElement ? document.documentElement.outerHTML : '';"
+
+    def __init__(self, store: SnapshotStore, *, max_pending: int = 32) -> None:
+        self.store = store
+        self.captured = 0
+        self.stored = 0
+        self.dropped = 0
+        self.failed = 0
+        self._queue: "queue.Queue[Optional[Tuple[str, str, str]]]" = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._writer, name="weBot-snapshot-writer", daemon=True)
+        self._thread.start()
+
+    def capture(self, driver, *, url: str, state: str) -> bool:
+        """Queue the current page for storage; returns whether it was queued."""
+
+        if self._closed:
+            return False
+        try:
+            html = driver.execute_script(self._SCRIPT)
+            if not html:
+                return False
+            self._queue.put_nowait((html, url, state))
+        except queue.Full:
+            self.dropped += 1
+            logger.debug("Snapshot queue full; dropped capture of %s", url)
+            return False
+        except Exception as exc:  # pragma: no cover - depends on driver state
+            logger.debug("Snapshot capture failed for %s: %s", url, exc)
+            return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until every queued capture has been written (or ``timeout`` passes)."""
+
+        if timeout is None:
+            self._queue.join()
+            return
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self) -> None:
+        """Write what is queued and stop the background thread (the store stays open)."""
+
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _writer(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                html, url, state = item
+                try:
+                    _, stored = self.store.add(html, url=url, state=state)
+                except Exception as exc:
+                    self.failed += 1
+                    logger.warning("Storing snapshot of %s failed: %s", url, exc)
+                    continue
+                self.captured += 1
+                self.stored += int(stored)
+            finally:
+                self._queue.task_done()
+
+
+_ACTIVE_RECORDER: Optional[SnapshotRecorder] = None
+
+
+def get_snapshot_recorder() -> Optional[SnapshotRecorder]:
+    """Return the active snapshot recorder, if recording is enabled."""
+
+    return _ACTIVE_RECORDER
+
+
+def set_snapshot_recorder(recorder: Optional[SnapshotRecorder]) -> None:
+    """Enable (or with ``None`` disable) snapshot recording."""
+
+    global _ACTIVE_RECORDER
+    _ACTIVE_RECORDER = recorder
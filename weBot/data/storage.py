@@ -1,15 +1,439 @@
 """Persistence helpers for exported data."""
 from __future__ import annotations
 
+import csv
+import gzip
+import io
 import json
+import os
+import re
+import time
+import zlib
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+try:  # Optional dependency for zstd compression
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - zstd is optional
+    zstandard = None  # type: ignore
+
+
+RECORD_FORMATS = ("jsonl", "csv")
+COMPRESSIONS = {".gz": "gzip", ".zst": "zstd"}
+PART_SUFFIX = ".part"
 
 
 def save_json(name: str, data: Any, *, directory: Path | None = None) -> Path:
     directory = directory or Path.cwd()
     directory.mkdir(parents=True, exist_ok=True)
     path = directory / f"{name}.json"
-    with path.open("w", encoding="utf-8") as fh:
+    tmp_path = path.with_name(path.name + PART_SUFFIX)
+    with tmp_path.open("w", encoding="utf-8") as fh:
         json.dump(data, fh, ensure_ascii=False, indent=2)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, path)
     return path
+
+
+def is_record_path(path: Path) -> bool:
+    """Return ``True`` when ``path`` names a JSONL/CSV export (optionally compressed)."""
+
+    try:
+        _split_record_path(Path(path))
+    except ValueError:
+        return False
+    return True
+
+
+class RecordWriter:
+    """Append-only, crash-safe writer for JSONL or CSV record streams.
+
+    Records are buffered and written in batches, and every flush is followed
+    by an ``fsync`` so at most one batch is lost on a crash. The active segment is
+    written to ``<name>.part`` and atomically renamed to its final name when
+    it is rotated or the writer closes, so completed files are never
+    truncated. Existing files are never overwritten: a new segment takes the
+    next free ``<stem>.<n>.<ext>`` name, which makes repeated runs append to
+    the same export. ``.part`` segments orphaned by a crash are recovered
+    when a writer opens: their complete lines are kept under the final name
+    and a torn last line is dropped.
+
+    Parameters
+    ----------
+    path:
+        Target file. The format and compression are inferred from the suffix
+        (``.jsonl``, ``.csv``, optionally followed by ``.gz`` or ``.zst``)
+        unless given explicitly.
+    flush_every:
+        Number of buffered records that triggers a flush.
+    flush_interval:
+        Maximum seconds a record may sit in the buffer.
+    rotate_bytes / rotate_seconds:
+        Close the active segment and start a new one once it reaches this
+        size on disk or age. ``None`` disables the respective rotation.
+    fieldnames:
+        CSV column order; keys outside it are not written. By default the
+        columns are the keys seen so far, and a record with a new key starts
+        a new segment with the widened header instead of losing the column.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        fmt: Optional[str] = None,
+        compression: Optional[str] = None,
+        flush_every: int = 100,
+        flush_interval: float = 5.0,
+        fsync: bool = True,
+        rotate_bytes: Optional[int] = None,
+        rotate_seconds: Optional[float] = None,
+        fieldnames: Optional[Sequence[str]] = None,
+    ) -> None:
+        path = Path(path).expanduser()
+        stem, inferred_fmt, inferred_compression = _split_record_path(path, allow_unknown=fmt is not None)
+        self.fmt = fmt or inferred_fmt
+        if self.fmt not in RECORD_FORMATS:
+            raise ValueError(f"Unsupported record format '{self.fmt}'. Use one of: {', '.join(RECORD_FORMATS)}")
+        self.compression = compression if compression is not None else inferred_compression
+        if self.compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"Unsupported compression '{self.compression}'")
+        if self.compression == "zstd" and zstandard is None:
+            raise RuntimeError("The zstandard package is required for .zst exports")
+
+        self.directory = path.parent
+        self.stem = stem
+        self.flush_every = max(1, int(flush_every))
+        self.flush_interval = float(flush_interval)
+        self.fsync = fsync
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+        self.fieldnames: Optional[List[str]] = list(fieldnames) if fieldnames else None
+        self._infer_fieldnames = self.fieldnames is None
+        self.completed: List[Path] = []
+        self.recovered: List[Path] = recover_partial_segments(path, fmt=self.fmt, compression=self.compression)
+        self.records_written = 0
+
+        self._buffer: List[Mapping[str, Any]] = []
+        self._last_flush = time.monotonic()
+        self._segment_started = 0.0
+        self._raw: Optional[IO[bytes]] = None
+        self._stream: Optional[Any] = None
+        self._part_path: Optional[Path] = None
+        self._final_path: Optional[Path] = None
+        self._header_written = False
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Context manager helpers
+    # ------------------------------------------------------------------
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def write(self, record: Mapping[str, Any]) -> None:
+        if self._closed:
+            raise RuntimeError("RecordWriter is closed")
+        self._buffer.append(record)
+        if len(self._buffer) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def write_many(self, records: Iterable[Mapping[str, Any]]) -> None:
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        if self._buffer:
+            widened = self._widen_fieldnames(self._buffer)
+            if self._stream is None or self._should_rotate() or (widened and self._header_written):
+                self._rotate()
+            payload = self._encode(self._buffer)
+            assert self._stream is not None
+            self._stream.write(payload)
+            self.records_written += len(self._buffer)
+            self._buffer.clear()
+        self._sync()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._finish_segment()
+        self._closed = True
+
+    # ------------------------------------------------------------------
+    # Segment management
+    # ------------------------------------------------------------------
+    def _should_rotate(self) -> bool:
+        if self.rotate_seconds is not None and time.monotonic() - self._segment_started >= self.rotate_seconds:
+            return True
+        if self.rotate_bytes is not None and self._raw is not None and self._raw.tell() >= self.rotate_bytes:
+            return True
+        return False
+
+    def _rotate(self) -> None:
+        self._finish_segment()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._final_path = self._next_final_path()
+        self._part_path = self._final_path.with_name(self._final_path.name + PART_SUFFIX)
+        self._raw = self._part_path.open("wb")
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb")
+        elif self.compression == "zstd":
+            self._stream = zstandard.ZstdCompressor().stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+        self._segment_started = time.monotonic()
+        self._header_written = False
+
+    def _finish_segment(self) -> None:
+        if self._raw is None or self._part_path is None or self._final_path is None:
+            return
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.flush()
+        if self.fsync:
+            os.fsync(self._raw.fileno())
+        self._raw.close()
+        os.replace(self._part_path, self._final_path)
+        if self.fsync:
+            _fsync_directory(self.directory)
+        self.completed.append(self._final_path)
+        self._raw = None
+        self._stream = None
+        self._part_path = None
+        self._final_path = None
+
+    def _next_final_path(self) -> Path:
+        suffix = f".{self.fmt}" + {"gzip": ".gz", "zstd": ".zst", None: ""}[self.compression]
+        candidate = self.directory / f"{self.stem}{suffix}"
+        index = 0
+        while candidate.exists() or candidate.with_name(candidate.name + PART_SUFFIX).exists():
+            index += 1
+            candidate = self.directory / f"{self.stem}.{index}{suffix}"
+        return candidate
+
+    def _sync(self) -> None:
+        if self._stream is None or self._raw is None:
+            return
+        if self.compression == "gzip":
+            self._stream.flush(zlib.Z_SYNC_FLUSH)
+        elif self.compression == "zstd":
+            self._stream.flush(zstandard.FLUSH_BLOCK)
+        self._raw.flush()
+        if self.fsync:
+            os.fsync(self._raw.fileno())
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+    def _widen_fieldnames(self, records: Sequence[Mapping[str, Any]]) -> bool:
+        """Add unseen keys to the inferred CSV columns; returns whether any were added."""
+
+        if self.fmt != "csv":
+            return False
+        if self.fieldnames is None:
+            self.fieldnames = []
+        if not self._infer_fieldnames:
+            return False
+        known = set(self.fieldnames)
+        added = False
+        for record in records:
+            for key in record:
+                if key not in known:
+                    known.add(key)
+                    self.fieldnames.append(key)
+                    added = True
+        return added
+
+    def _encode(self, records: Sequence[Mapping[str, Any]]) -> bytes:
+        if self.fmt == "jsonl":
+            lines = [json.dumps(record, ensure_ascii=False, default=str) for record in records]
+            return ("\n".join(lines) + "\n").encode("utf-8")
+
+        assert self.fieldnames is not None
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.fieldnames, extrasaction="ignore")
+        if not self._header_written:
+            writer.writeheader()
+            self._header_written = True
+        for record in records:
+            writer.writerow({key: _csv_value(record.get(key)) for key in self.fieldnames})
+        return buffer.getvalue().encode("utf-8")
+
+
+def open_record_writer(path: Path, **options: Any) -> RecordWriter:
+    """Create a :class:`RecordWriter` for ``path`` (format inferred from the suffix)."""
+
+    return RecordWriter(Path(path), **options)
+
+
+def iter_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream records back from a JSONL/CSV export and its numbered segments.
+
+    Every ``<stem>.<n>`` segment is read in index order, gaps included.
+    ``.part`` segments (still being written, or left by a crash that no
+    writer has recovered yet) are read too, minus a torn last line.
+    """
+
+    path = Path(path).expanduser()
+    stem, fmt, compression = _split_record_path(path)
+    for segment, partial in _segments(path.parent, stem, path.name[len(stem):]):
+        lines = _complete_lines(segment, compression) if partial else _open_for_read(segment, compression)
+        try:
+            if fmt == "csv":
+                yield from csv.DictReader(lines)
+                continue
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+        finally:
+            close = getattr(lines, "close", None)
+            if close is not None:
+                close()
+
+
+def recover_partial_segments(
+    path: Path, *, fmt: Optional[str] = None, compression: Optional[str] = None
+) -> List[Path]:
+    """Finalise ``.part`` segments of ``path`` left behind by a crashed writer.
+
+    Complete lines are rewritten under the segment's final name (a torn
+    last line is dropped); a ``.part`` whose final name already exists, or
+    that holds no complete line, is removed. Returns the recovered files.
+    """
+
+    path = Path(path).expanduser()
+    stem, inferred_fmt, inferred_compression = _split_record_path(path, allow_unknown=fmt is not None)
+    compression = compression if compression is not None else inferred_compression
+    suffix = f".{fmt or inferred_fmt}" + {"gzip": ".gz", "zstd": ".zst", None: ""}[compression]
+    recovered: List[Path] = []
+    for segment, partial in _segments(path.parent, stem, suffix):
+        if not partial:
+            continue
+        final = segment.with_name(segment.name[: -len(PART_SUFFIX)])
+        text = "".join(_complete_lines(segment, compression))
+        if final.exists() or not text.strip():
+            segment.unlink(missing_ok=True)
+            continue
+        tmp = segment.with_name(segment.name + ".recover")
+        with _open_for_write(tmp, compression) as fh:
+            fh.write(text.encode("utf-8"))
+        os.replace(tmp, final)
+        segment.unlink(missing_ok=True)
+        recovered.append(final)
+    return recovered
+
+
+# ----------------------------------------------------------------------
+# Internals
+# ----------------------------------------------------------------------
+def _split_record_path(path: Path, *, allow_unknown: bool = False) -> tuple[str, str, Optional[str]]:
+    name = path.name
+    compression = None
+    for suffix, kind in COMPRESSIONS.items():
+        if name.endswith(suffix):
+            compression = kind
+            name = name[: -len(suffix)]
+            break
+    for fmt in RECORD_FORMATS:
+        if name.endswith(f".{fmt}"):
+            return name[: -len(fmt) - 1], fmt, compression
+    if allow_unknown:
+        return Path(name).stem, "", compression
+    raise ValueError(f"Cannot infer record format from '{path.name}'. Use a .jsonl or .csv suffix.")
+
+
+def _segments(directory: Path, stem: str, suffix: str) -> List[tuple[Path, bool]]:
+    """``(path, is_part)`` for ``<stem><suffix>`` and every ``<stem>.<n><suffix>``, in index order."""
+
+    pattern = re.compile(rf"^{re.escape(stem)}(?:\.(\d+))?{re.escape(suffix)}({re.escape(PART_SUFFIX)})?$")
+    found = []
+    try:
+        entries = list(directory.iterdir())
+    except OSError:
+        return []
+    for entry in entries:
+        match = pattern.match(entry.name)
+        if match and entry.is_file():
+            found.append((int(match.group(1) or 0), bool(match.group(2)), entry))
+    return [(entry, partial) for _, partial, entry in sorted(found)]
+
+
+def _complete_lines(path: Path, compression: Optional[str]) -> List[str]:
+    """Lines of a possibly truncated segment, up to the last newline that made it to disk.
+
+    Streaming decompressors return whatever a cut-off stream still decodes
+    to, where file readers would raise and lose the buffered block.
+    """
+
+    raw = path.read_bytes()
+    if compression == "gzip":
+        try:
+            data = zlib.decompressobj(wbits=31).decompress(raw)
+        except zlib.error:
+            return []
+    elif compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("The zstandard package is required to read .zst exports")
+        try:
+            data = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+        except zstandard.ZstdError:
+            return []
+    else:
+        data = raw
+    end = data.rfind(b"\n")
+    return data[: end + 1].decode("utf-8", errors="replace").splitlines(keepends=True)
+
+
+def _open_for_write(path: Path, compression: Optional[str]) -> IO[bytes]:
+    if compression == "gzip":
+        return gzip.open(path, "wb")
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("The zstandard package is required for .zst exports")
+        return zstandard.ZstdCompressor().stream_writer(path.open("wb"), closefd=True)
+    return path.open("wb")
+
+
+def _open_for_read(path: Path, compression: Optional[str]) -> IO[str]:
+    if compression == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("The zstandard package is required to read .zst exports")
+        raw = path.open("rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True, read_across_frames=True)
+        return io.TextIOWrapper(reader, encoding="utf-8", newline="")
+    return path.open("r", encoding="utf-8", newline="")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (list, dict, tuple)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _fsync_directory(directory: Path) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # pragma: no cover - platforms without directory handles
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover - e.g. Windows
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,351 @@
+"""SQLite-backed local store for everything the bot observes."""
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .extractors import status_id_from_link
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = Path(".webot/webot.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    status_id INTEGER PRIMARY KEY,
+    username TEXT,
+    tweet_text TEXT,
+    link TEXT,
+    stats TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    seen_count INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_posts_last_seen ON posts(last_seen);
+CREATE INDEX IF NOT EXISTS idx_posts_username ON posts(username);
+
+CREATE TABLE IF NOT EXISTS profile_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    handle TEXT NOT NULL,
+    captured_at REAL NOT NULL,
+    display_name TEXT,
+    bio TEXT,
+    followers INTEGER,
+    following INTEGER,
+    pinned_post_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profile_snapshots_handle ON profile_snapshots(handle, captured_at);
+
+CREATE TABLE IF NOT EXISTS state_transitions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    occurred_at REAL NOT NULL,
+    from_state TEXT,
+    to_state TEXT NOT NULL,
+    detail TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_state_transitions_time ON state_transitions(occurred_at);
+
+CREATE TABLE IF NOT EXISTS action_outcomes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    occurred_at REAL NOT NULL,
+    action TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    status_id INTEGER,
+    cycle INTEGER,
+    post INTEGER,
+    detail TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_action_outcomes_time ON action_outcomes(occurred_at);
+CREATE INDEX IF NOT EXISTS idx_action_outcomes_action ON action_outcomes(action, occurred_at);
+"""
+
+_UPSERT_POST = """
+INSERT INTO posts (status_id, username, tweet_text, link, stats, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(status_id) DO UPDATE SET
+    username = COALESCE(excluded.username, posts.username),
+    tweet_text = COALESCE(NULLIF(excluded.tweet_text, ''), posts.tweet_text),
+    link = COALESCE(excluded.link, posts.link),
+    stats = COALESCE(excluded.stats, posts.stats),
+    last_seen = excluded.last_seen,
+    seen_count = posts.seen_count + 1
+"""
+
+_INSERT_SNAPSHOT = """
+INSERT INTO profile_snapshots (handle, captured_at, display_name, bio, followers, following, pinned_post_id, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_TRANSITION = "INSERT INTO state_transitions (occurred_at, from_state, to_state, detail) VALUES (?, ?, ?, ?)"
+
+_INSERT_ACTION = """
+INSERT INTO action_outcomes (occurred_at, action, success, status_id, cycle, post, detail)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_POST_FIELDS = {"username", "tweet_text", "link", "status_id", "seen"}
+
+QUERIES: Dict[str, str] = {
+    "posts": "SELECT status_id, username, substr(tweet_text, 1, 80) AS text, seen_count, "
+    "datetime(last_seen, 'unixepoch') AS last_seen FROM posts {where} ORDER BY last_seen DESC LIMIT ?",
+    "profiles": "SELECT handle, datetime(captured_at, 'unixepoch') AS captured_at, display_name, followers, "
+    "following FROM profile_snapshots {where} ORDER BY captured_at DESC LIMIT ?",
+    "transitions": "SELECT datetime(occurred_at, 'unixepoch') AS occurred_at, from_state, to_state, detail "
+    "FROM state_transitions ORDER BY occurred_at DESC LIMIT ?",
+    "actions": "SELECT date(occurred_at, 'unixepoch') AS day, action, COUNT(*) AS total, SUM(success) AS ok, "
+    "ROUND(100.0 * SUM(success) / COUNT(*), 1) AS success_pct FROM action_outcomes "
+    "GROUP BY day, action ORDER BY day DESC, action LIMIT ?",
+}
+
+_HANDLE_FILTER = {"posts": "WHERE lower(username) = lower(?)", "profiles": "WHERE handle = lower(?)"}
+
+
+class LocalStore:
+    """Write-behind SQLite store (WAL mode) for posts, profiles, states and actions.
+
+    All writes are queued and applied by a single background thread, so
+    callers on the driver thread never wait on disk. Each queued batch is
+    written with ``executemany`` and several pending batches share one
+    transaction; if that transaction fails, each batch is retried on its own
+    so one bad batch does not take the others with it. Reads open their own
+    connection and can run concurrently with the writer thanks to WAL.
+
+    When the writer falls more than ``max_pending`` batches behind, new
+    batches are dropped (counted in :attr:`dropped` and logged) rather than
+    blocking the caller: the store is an observation log, and losing a few
+    rows is preferable to stalling the browser.
+    """
+
+    def __init__(self, path: Optional[Path] = None, *, max_pending: int = 1000) -> None:
+        self.path = Path(path or DEFAULT_STORE_PATH).expanduser().absolute()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: "queue.Queue[Optional[Tuple[str, List[Sequence[Any]]]]]" = queue.Queue(maxsize=max_pending)
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self.dropped = 0
+        self.failed = 0
+        self._thread = threading.Thread(target=self._writer, name="weBot-store-writer", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise RuntimeError(f"Failed to open local store at {self.path}: {self._error}") from self._error
+
+    # ------------------------------------------------------------------
+    # Context manager helpers
+    # ------------------------------------------------------------------
+    def __enter__(self) -> "LocalStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Recording API (non-blocking)
+    # ------------------------------------------------------------------
+    def upsert_posts(self, posts: Iterable[Mapping[str, Any]]) -> int:
+        """Queue a batch of harvested posts; returns how many had a status id."""
+
+        now = time.time()
+        rows: List[Sequence[Any]] = []
+        for post in posts:
+            status_id = post.get("status_id") or status_id_from_link(post.get("link"))
+            if status_id is None:
+                continue
+            stats = {key: value for key, value in post.items() if key not in _POST_FIELDS}
+            rows.append(
+                (
+                    int(status_id),
+                    post.get("username"),
+                    post.get("tweet_text") or "",
+                    post.get("link"),
+                    json.dumps(stats, ensure_ascii=False, default=str) if stats else None,
+                    now,
+                    now,
+                )
+            )
+        self._submit(_UPSERT_POST, rows)
+        return len(rows)
+
+    def record_profile(self, profile: Mapping[str, Any]) -> None:
+        handle = str(profile.get("handle") or "").lower()
+        if not handle:
+            return
+        self._submit(
+            _INSERT_SNAPSHOT,
+            [
+                (
+                    handle,
+                    time.time(),
+                    profile.get("display_name"),
+                    profile.get("bio"),
+                    profile.get("followers"),
+                    profile.get("following"),
+                    profile.get("pinned_post_id"),
+                    json.dumps(dict(profile), ensure_ascii=False, default=str),
+                )
+            ],
+        )
+
+    def record_transition(
+        self,
+        from_state: Optional[str],
+        to_state: str,
+        attributes: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        detail = json.dumps(dict(attributes), ensure_ascii=False, default=str) if attributes else None
+        self._submit(_INSERT_TRANSITION, [(time.time(), from_state, to_state, detail)])
+
+    def record_action(
+        self,
+        action: str,
+        success: bool,
+        *,
+        post: Optional[Mapping[str, Any]] = None,
+        cycle: Optional[int] = None,
+        index: Optional[int] = None,
+        detail: Optional[str] = None,
+    ) -> None:
+        status_id = status_id_from_link(post.get("link")) if post else None
+        self._submit(_INSERT_ACTION, [(time.time(), action, int(bool(success)), status_id, cycle, index, detail)])
+
+    # ------------------------------------------------------------------
+    # Query API
+    # ------------------------------------------------------------------
+    def query(self, name: str, *, limit: int = 20, handle: Optional[str] = None) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """Run one of the canned ``QUERIES`` and return ``(columns, rows)``."""
+
+        if name not in QUERIES:
+            raise ValueError(f"Unknown store query '{name}'. Choose from: {', '.join(sorted(QUERIES))}")
+        where = _HANDLE_FILTER.get(name, "") if handle else ""
+        params: List[Any] = [handle.lstrip("@")] if where and handle else []
+        params.append(int(limit))
+        sql = QUERIES[name].format(where=where)
+        connection = self._read_connection()
+        try:
+            cursor = connection.execute(sql, params)
+            columns = [description[0] for description in cursor.description]
+            return columns, cursor.fetchall()
+        finally:
+            connection.close()
+
+    def iter_posts(self, *, batch_size: int = 5000) -> Iterator[Dict[str, Any]]:
+        """Stream every stored post without loading the table into memory."""
+
+        connection = self._read_connection()
+        try:
+            cursor = connection.execute("SELECT status_id, username, tweet_text, link FROM posts ORDER BY status_id")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for status_id, username, tweet_text, link in rows:
+                    yield {"status_id": status_id, "username": username, "tweet_text": tweet_text, "link": link}
+        finally:
+            connection.close()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until every queued write has been committed."""
+
+        if timeout is None:
+            self._queue.join()
+            return
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _submit(self, sql: str, rows: List[Sequence[Any]]) -> None:
+        if not rows:
+            return
+        if self._closed:
+            raise RuntimeError("LocalStore is closed")
+        try:
+            self._queue.put_nowait((sql, rows))
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                logger.warning(
+                    "Local store writer is behind; dropped %s batch(es) so far (%s row(s) in this one)",
+                    self.dropped,
+                    len(rows),
+                )
+
+    def _read_connection(self) -> sqlite3.Connection:
+        # as_uri() percent-encodes '?', '#' and '%' in the path.
+        return sqlite3.connect(f"{self.path.as_uri()}?mode=ro", uri=True)
+
+    def _writer(self) -> None:
+        try:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+        except BaseException as exc:  # pragma: no cover - surfaced to the constructor
+            self._error = exc
+            self._ready.set()
+            return
+        self._ready.set()
+
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            # Coalesce whatever else is already pending into the same transaction.
+            while len(batch) < 64:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            items = [item for item in batch if item is not None]
+            running = len(items) == len(batch)
+            try:
+                with connection:
+                    for sql, rows in items:
+                        connection.executemany(sql, rows)
+            except sqlite3.Error as exc:
+                logger.warning("Local store transaction failed; retrying %s batch(es) one by one: %s", len(items), exc)
+                self._write_each(connection, items)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        connection.close()
+
+    def _write_each(self, connection: sqlite3.Connection, items: List[Tuple[str, List[Sequence[Any]]]]) -> None:
+        for sql, rows in items:
+            try:
+                with connection:
+                    connection.executemany(sql, rows)
+            except sqlite3.Error as exc:
+                self.failed += 1
+                logger.error("Local store write failed (%s row(s) dropped): %s", len(rows), exc)
+
+
+def format_table(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
+    """Render query results as a fixed-width text table."""
+
+    cells = [[("" if value is None else str(value)) for value in row] for row in rows]
+    widths = [len(column) for column in columns]
+    for row in cells:
+        for index, value in enumerate(row):
+            widths[index] = min(max(widths[index], len(value)), 80)
+    lines = ["  ".join(column.ljust(widths[i]) for i, column in enumerate(columns))]
+    lines.append("  ".join("-" * width for width in widths))
+    for row in cells:
+        lines.append("  ".join(value[: widths[i]].ljust(widths[i]) for i, value in enumerate(row)))
+    return "\n".join(line.rstrip() for line in lines)
@@ -0,0 +1,183 @@
+"""Latency-sensitivity benchmark: workflow wall time as a function of round-trip time."""
+from __future__ import annotations
+
+import logging
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from ..bot import BotController
+from ..core.actions import navigation, social, timeline
+from ..core.actions.utils import wait_for
+from ..core.latency import simulated_latency
+from ..core.pool import SessionPool
+from ..core.recognizers import recognize_state
+from ..core.state import PageState
+from .profile import _ensure_profile, read_profile_header
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RTTS_MS = (0, 20, 40, 80)
+
+# Followers harvested per run; enough for several scroll steps without a huge list.
+_MODAL_HANDLES = 60
+
+
+@dataclass(frozen=True)
+class LatencyWorkflow:
+    """One measured step; ``setup`` runs before every repeat, outside the simulated latency."""
+
+    name: str
+    run: Callable[[BotController], object]
+    setup: Optional[Callable[[BotController], None]] = None
+
+
+@dataclass
+class LatencySample:
+    """Median wall time and round trips of one workflow at one simulated RTT."""
+
+    workflow: str
+    rtt_ms: float
+    seconds: float
+    round_trips: int
+    repeats: int
+    error: Optional[str] = None
+
+
+def _go_home(bot: BotController) -> None:
+    navigation.navigate_to(bot.driver, bot.context, bot.context.home_url)
+    wait_for(bot.driver, EC.presence_of_element_located((By.CSS_SELECTOR, timeline.ARTICLE_SELECTOR)), 15)
+
+
+def default_workflows(handle: Optional[str] = None) -> List[LatencyWorkflow]:
+    """The built-in workflows; profile and follower-list steps need ``handle``."""
+
+    workflows = [
+        LatencyWorkflow("navigate_home", lambda bot: navigation.navigate_to(bot.driver, bot.context, bot.context.home_url)),
+        LatencyWorkflow("recognize_state", lambda bot: recognize_state(bot.driver), setup=_go_home),
+        LatencyWorkflow("fetch_post", lambda bot: timeline.fetch_post(bot.driver), setup=_go_home),
+    ]
+    if handle:
+        followers_url = f"https://twitter.com/{handle}/followers"
+        workflows.extend(
+            (
+                LatencyWorkflow(
+                    "read_profile_header",
+                    lambda bot: read_profile_header(bot.driver),
+                    setup=lambda bot: _ensure_profile(bot, handle),
+                ),
+                LatencyWorkflow(
+                    "collect_handles_from_modal",
+                    lambda bot: social.collect_handles_from_modal(
+                        bot.driver, max_count=_MODAL_HANDLES, scroll_pause=(0.3, 0.3)
+                    ),
+                    setup=lambda bot: bot.driver.get(followers_url),
+                ),
+            )
+        )
+    return workflows
+
+
+def run_latency_benchmark(
+    pool: SessionPool,
+    workflows: Sequence[LatencyWorkflow],
+    rtts_ms: Iterable[float] = DEFAULT_RTTS_MS,
+    *,
+    repeats: int = 3,
+    throttle_network: bool = False,
+) -> Iterator[LatencySample]:
+    """Run every workflow ``repeats`` times at each RTT on one pooled browser.
+
+    WebDriver commands are delayed by the RTT, so a workflow's wall time
+    grows by roughly its round-trip count times the RTT. With
+    ``throttle_network`` the page's own traffic is throttled to the same
+    latency as well, and page loads add to the measured time. Samples are
+    yielded as they complete; a workflow that raises yields a sample
+    carrying the error and is not repeated at that RTT.
+
+    The pool must use a persisted profile that is logged in: a ``ValueError``
+    is raised up front when it has no ``user_data_dir``, and a
+    ``RuntimeError`` when the leased browser does not reach the home timeline.
+    """
+
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+    if pool.config.user_data_dir is None:
+        raise ValueError("The latency benchmark needs a persisted, logged-in Chrome profile (user_data_dir)")
+    return _run_benchmark(pool, workflows, list(rtts_ms), repeats, throttle_network)
+
+
+def _run_benchmark(
+    pool: SessionPool,
+    workflows: Sequence[LatencyWorkflow],
+    rtts_ms: Sequence[float],
+    repeats: int,
+    throttle_network: bool,
+) -> Iterator[LatencySample]:
+    with pool.lease() as bot:
+        state = bot.ensure_home()
+        if state != PageState.HOME_TIMELINE:
+            raise RuntimeError(
+                f"The benchmark profile is not logged in (landed on {state.name}). Run the login command first."
+            )
+        for rtt in rtts_ms:
+            for workflow in workflows:
+                timings: List[float] = []
+                trips: List[int] = []
+                error: Optional[str] = None
+                for _ in range(repeats):
+                    try:
+                        if workflow.setup is not None:
+                            workflow.setup(bot)
+                        with simulated_latency(bot.driver, rtt, throttle_network=throttle_network) as delay:
+                            started = time.perf_counter()
+                            workflow.run(bot)
+                            timings.append(time.perf_counter() - started)
+                            trips.append(delay.round_trips)
+                    except Exception as exc:
+                        logger.warning("Latency workflow %s failed at %s ms: %s", workflow.name, rtt, exc)
+                        error = str(exc).splitlines()[0] if str(exc) else type(exc).__name__
+                        break
+                yield LatencySample(
+                    workflow=workflow.name,
+                    rtt_ms=float(rtt),
+                    seconds=statistics.median(timings) if timings else 0.0,
+                    round_trips=int(statistics.median(trips)) if trips else 0,
+                    repeats=len(timings),
+                    error=error,
+                )
+
+
+def sensitivity(samples: Iterable[LatencySample]) -> List[Tuple[str, Dict[float, float], float, int]]:
+    """``(workflow, {rtt: seconds}, ms added per ms of RTT, round trips)`` rows, most sensitive first.
+
+    The slope is a least-squares fit of wall time against RTT. When the
+    samples were taken with only the driver delayed (the default), it
+    estimates how many sequential WebDriver/DevTools round trips the
+    workflow makes and is what makes a chatty path stand out. Samples taken
+    with ``throttle_network`` also include the page's network latency, so
+    the slope then measures end-to-end sensitivity rather than round trips.
+    """
+
+    grouped: Dict[str, Dict[float, LatencySample]] = {}
+    for sample in samples:
+        if sample.repeats:
+            grouped.setdefault(sample.workflow, {})[sample.rtt_ms] = sample
+    rows = []
+    for name, by_rtt in grouped.items():
+        rtts = sorted(by_rtt)
+        times = {rtt: by_rtt[rtt].seconds for rtt in rtts}
+        slope = 0.0
+        if len(rtts) > 1:
+            mean_rtt = sum(rtts) / len(rtts)
+            mean_time = sum(times.values()) / len(rtts)
+            spread = sum((rtt - mean_rtt) ** 2 for rtt in rtts)
+            if spread:
+                slope = 1000.0 * sum((rtt - mean_rtt) * (times[rtt] - mean_time) for rtt in rtts) / spread
+        rows.append((name, times, slope, max(sample.round_trips for sample in by_rtt.values())))
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows
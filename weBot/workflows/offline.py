@@ -0,0 +1,95 @@
+"""Batch recognition and extraction over saved page snapshots."""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+from ..core.offline import HtmlPage
+from ..core.recognizers import recognize_state
+from ..core.state import PageState
+from ..data.extractors import fetch_post_data
+from ..data.snapshots import SnapshotStore, read_snapshot
+from .profile import read_profile_header
+
+SNAPSHOT_SUFFIXES = (".html", ".htm", ".html.gz", ".html.zst")
+
+# (path, url, recorded state)
+SnapshotItem = Tuple[str, str, Optional[str]]
+
+
+def iter_snapshot_items(root: Path) -> Iterator[SnapshotItem]:
+    """List the pages under ``root``.
+
+    A snapshot store (a directory with ``index.db``) contributes each distinct
+    document with its recorded URL and state; any other directory is scanned
+    for ``.html`` files, optionally compressed.
+    """
+
+    root = Path(root).expanduser()
+    if (root / "index.db").is_file():
+        store = SnapshotStore(root, max_bytes=2**62)
+        try:
+            for entry in store.entries():
+                if entry.path.is_file():
+                    yield str(entry.path), entry.url, entry.state
+        finally:
+            store.close()
+        return
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.name.lower().endswith(SNAPSHOT_SUFFIXES):
+            yield str(path), "", None
+
+
+def analyze_snapshot(item: SnapshotItem) -> Dict[str, object]:
+    """Run ``recognize_state`` and the extractors against one saved page."""
+
+    path, url, recorded_state = item
+    started = time.perf_counter()
+    row: Dict[str, object] = {"file": path, "recorded_state": recorded_state}
+    try:
+        page = HtmlPage(read_snapshot(Path(path)), url=url)
+        snapshot = recognize_state(page)
+        row["state"] = snapshot.state.name
+        posts = [fetch_post_data(article) for article in page.find_elements(By.CSS_SELECTOR, "article[data-testid='tweet']")]
+        row["posts"] = len(posts)
+        if posts:
+            row["first_post"] = posts[0]
+        if snapshot.state == PageState.PROFILE:
+            row["profile"] = asdict(read_profile_header(page))
+    except Exception as exc:  # keep going over large corpora
+        row["state"] = "ERROR"
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    row["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return row
+
+
+def analyze_corpus(items: List[SnapshotItem], *, workers: Optional[int] = None) -> Iterator[Dict[str, object]]:
+    """Analyse ``items`` across a process pool, yielding rows in input order."""
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    if workers == 1 or len(items) < 2:
+        yield from map(analyze_snapshot, items)
+        return
+    chunksize = max(1, len(items) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(analyze_snapshot, items, chunksize=chunksize)
+
+
+def summary_fields(row: Dict[str, object]) -> str:
+    """Compact description of the extracted fields for table output."""
+
+    if "error" in row:
+        return str(row["error"])
+    profile = row.get("profile")
+    if isinstance(profile, dict):
+        return f"@{profile.get('handle')} followers={profile.get('followers')} following={profile.get('following')}"
+    first_post = row.get("first_post")
+    if isinstance(first_post, dict):
+        return f"{first_post.get('username')} {first_post.get('link') or ''}".strip()
+    return ""
@@ -1,22 +1,27 @@
 """Profile data extraction routines."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
 
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from ..bot import BotController
 from ..core.actions import navigation, social
-from ..core.actions.utils import random_delay
-from ..core.state import PageState
+from ..core.actions.utils import random_delay, wait_for
+from ..core.cdp import evaluate_value
+from ..core.selectors import SelectorGroup
+from ..core.state import PageState, TransitionReason
+from ..data.cache import HEADER_SECTION, LISTS_SECTION, ProfileCache
+from ..data.counts import parse_count
 
 
 @dataclass
 class ProfileData:
+    """Profile snapshot with raw display counts and their integer values."""
+
     display_name: str
     handle: str
     bio: str
@@ -24,58 +29,249 @@ class ProfileData:
     following_count: str
     followers_list: Optional[List[str]] = None
     following_list: Optional[List[str]] = None
+    followers: Optional[int] = None
+    following: Optional[int] = None
+    pinned_post_id: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.followers is None:
+            self.followers = parse_count(self.followers_count)
+        if self.following is None:
+            self.following = parse_count(self.following_count)
+
+
+_LIST_FIELDS = ("followers_list", "following_list")
+
+
+def _header_fields(profile: ProfileData) -> Dict[str, object]:
+    data = asdict(profile)
+    for name in _LIST_FIELDS:
+        data.pop(name, None)
+    return data
+
+
+def _profile_from_header(header: Optional[Dict[str, object]]) -> Optional[ProfileData]:
+    if header is None:
+        return None
+    try:
+        return ProfileData(**header)
+    except TypeError:
+        # Entry written by an incompatible version; treat it as a miss.
+        return None
 
 
 def _ensure_profile(bot: BotController, handle: str) -> None:
     navigation.navigate_to(bot.driver, bot.context, f"https://twitter.com/{handle}")
-    WebDriverWait(bot.driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-testid='UserName']")))
-    bot.context.update_state(PageState.PROFILE, handle=handle)
+    wait_for(bot.driver, EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-testid='UserName']")), 10)
+    bot.context.update_state(PageState.PROFILE, reason=TransitionReason.NAVIGATION, handle=handle)
 
 
-def fetch_profile(bot: BotController, handle: str, *, descriptive: bool = False) -> ProfileData:
-    _ensure_profile(bot, handle)
-    driver = bot.driver
+_PROFILE_PROBE_SCRIPT = """
+const text = (el) => (el ? (el.innerText || el.textContent || '') : null);
+const userName = document.querySelector("div[data-testid='UserName']");
+const nameText = text(userName);
+const pathHandle = window.location.pathname.split('/').filter(Boolean)[0] || null;
+// Resolve every followers candidate so the selector statistics see each match.
+const followersMatches = arguments[0].map((selector) => document.querySelector(selector));
+const followers = followersMatches.find((el) => el !== null) || null;
 
-    try:
-        display_name = driver.find_element(By.CSS_SELECTOR, "div[data-testid='UserName']").text.split("\n")[0]
-    except NoSuchElementException:
-        display_name = ""
+let pinnedId = null;
+for (const article of document.querySelectorAll("article[data-testid='tweet']")) {
+    const context = article.querySelector("div[data-testid='socialContext']");
+    if (!context || !/pinned/i.test(context.innerText || '')) {
+        continue;
+    }
+    const time = article.querySelector('time');
+    const href = time && time.parentElement ? time.parentElement.getAttribute('href') || '' : '';
+    const match = href.match(/\\/status\\/(\\d+)/);
+    pinnedId = match ? match[1] : null;
+    break;
+}
 
-    handle_value = driver.current_url.rstrip("/").split("/")[-1]
+return {
+    display_name: nameText === null ? null : nameText.split('\\n')[0],
+    handle: pathHandle,
+    bio: text(document.querySelector("div[data-testid='UserDescription']")),
+    followers_count: text(followers),
+    followers_matched: followersMatches.map((el) => el !== null),
+    following_count: text(document.querySelector("a[href$='/following'] > span > span")),
+    pinned_post_id: pinnedId,
+};
+"""
 
-    try:
-        bio = driver.find_element(By.CSS_SELECTOR, "div[data-testid='UserDescription']").text
-    except NoSuchElementException:
-        bio = ""
+_PROFILE_FIELDS = ("display_name", "handle", "bio", "followers_count", "following_count")
+
+FOLLOWERS_COUNT_GROUP = SelectorGroup(
+    "profile_followers_count",
+    (
+        (By.CSS_SELECTOR, "a[href$='/verified_followers'] > span > span"),
+        (By.CSS_SELECTOR, "a[href$='/followers'] > span > span"),
+    ),
+)
 
-    try:
-        followers_count = driver.find_element(By.CSS_SELECTOR, "a[href$='/verified_followers'] > span > span").text
-    except NoSuchElementException:
-        followers_count = "0"
 
+def _probe_profile(driver) -> Dict[str, Optional[str]]:
+    """Read every profile header field in a single in-page call.
+
+    Missing fields come back as ``None`` so the caller can fall back to the
+    per-selector lookups only for what the probe could not see.
+    """
+
+    followers_selectors = FOLLOWERS_COUNT_GROUP.ordered()
     try:
-        following_count = driver.find_element(By.CSS_SELECTOR, "a[href$='/following'] > span > span").text
-    except NoSuchElementException:
-        following_count = "0"
+        result = evaluate_value(driver, _PROFILE_PROBE_SCRIPT, [value for _, value in followers_selectors])
+    except Exception:
+        result = None
+    if not isinstance(result, dict):
+        return {}
+    matched = result.get("followers_matched") or ()
+    FOLLOWERS_COUNT_GROUP.record(selector for selector, hit in zip(followers_selectors, matched) if hit)
+    return {key: result.get(key) for key in (*_PROFILE_FIELDS, "pinned_post_id")}
 
-    followers_list: Optional[List[str]] = None
-    following_list: Optional[List[str]] = None
 
-    if descriptive:
-        bot.driver.get(f"https://twitter.com/{handle_value}/followers")
-        random_delay(0.8, 1.4, label="profile_fetch")
-        followers_list, _ = social.collect_handles_from_modal(driver)
+def _fallback_field(driver, name: str) -> str:
+    if name == "display_name":
+        try:
+            return driver.find_element(By.CSS_SELECTOR, "div[data-testid='UserName']").text.split("\n")[0]
+        except NoSuchElementException:
+            return ""
+    if name == "handle":
+        return driver.current_url.rstrip("/").split("/")[-1]
+    if name == "bio":
+        try:
+            return driver.find_element(By.CSS_SELECTOR, "div[data-testid='UserDescription']").text
+        except NoSuchElementException:
+            return ""
+    if name == "followers_count":
+        element = FOLLOWERS_COUNT_GROUP.find(driver)
+        return element.text if element is not None else "0"
+    if name == "following_count":
+        try:
+            return driver.find_element(By.CSS_SELECTOR, "a[href$='/following'] > span > span").text
+        except NoSuchElementException:
+            return "0"
+    raise KeyError(name)
+
+
+def fetch_profile(
+    bot: BotController,
+    handle: str,
+    *,
+    descriptive: bool = False,
+    cache: Optional[ProfileCache] = None,
+    refresh: bool = False,
+    before_browser: Optional[Callable[[], None]] = None,
+) -> ProfileData:
+    """Scrape ``handle``'s profile, consulting ``cache`` unless ``refresh`` is set.
+
+    Header fields and follower/following lists are cached separately, so a
+    fresh header skips the profile page and a fresh list entry skips the list
+    harvest even when the other part has to be fetched again.
+    ``before_browser`` runs once before the first browser access (e.g. an
+    authentication check) and is skipped entirely on a full cache hit.
+    """
+
+    cached = lookup_cached_profile(handle, descriptive=descriptive, cache=cache, refresh=refresh)
+    return complete_profile(bot, cached, cache=cache, before_browser=before_browser)
 
-        bot.driver.get(f"https://twitter.com/{handle_value}/following")
-        random_delay(0.8, 1.4, label="profile_fetch")
-        following_list, _ = social.collect_handles_from_modal(driver)
+
+@dataclass
+class CachedProfile:
+    """What :func:`lookup_cached_profile` found; ``None`` parts must be scraped."""
+
+    handle: str
+    descriptive: bool
+    profile: Optional[ProfileData] = None
+    lists: Optional[Dict[str, Any]] = None
+
+    @property
+    def needs_browser(self) -> bool:
+        return self.profile is None or (self.descriptive and self.lists is None)
+
+
+def lookup_cached_profile(
+    handle: str,
+    *,
+    descriptive: bool = False,
+    cache: Optional[ProfileCache] = None,
+    refresh: bool = False,
+) -> CachedProfile:
+    """The cache half of :func:`fetch_profile`: reads each section once, never touches the browser."""
+
+    cached = CachedProfile(handle, descriptive)
+    if cache is not None and not refresh:
+        cached.profile = _profile_from_header(cache.get(HEADER_SECTION, handle))
+        cached.lists = cache.get(LISTS_SECTION, handle) if descriptive else None
+    return cached
+
+
+def complete_profile(
+    bot: BotController,
+    cached: CachedProfile,
+    *,
+    cache: Optional[ProfileCache] = None,
+    before_browser: Optional[Callable[[], None]] = None,
+) -> ProfileData:
+    """The browser half of :func:`fetch_profile`: scrape what ``cached`` lacks and cache it."""
+
+    handle = cached.handle
+    needs_browser = cached.needs_browser
+    if needs_browser and before_browser is not None:
+        before_browser()
+
+    profile = cached.profile
+    if profile is None:
+        profile = _scrape_header(bot, handle)
+        if cache is not None:
+            cache.put(HEADER_SECTION, handle, _header_fields(profile))
+
+    if cached.descriptive:
+        if cached.lists is not None:
+            profile.followers_list = cached.lists.get("followers_list")
+            profile.following_list = cached.lists.get("following_list")
+        else:
+            profile.followers_list, profile.following_list = _collect_lists(bot.driver, profile.handle)
+            if cache is not None:
+                cache.put(
+                    LISTS_SECTION,
+                    handle,
+                    {"followers_list": profile.followers_list, "following_list": profile.following_list},
+                )
+    if needs_browser and bot.store is not None:
+        bot.store.record_profile(asdict(profile))
+    return profile
+
+
+def _scrape_header(bot: BotController, handle: str) -> ProfileData:
+    _ensure_profile(bot, handle)
+    return read_profile_header(bot.driver)
+
+
+def read_profile_header(driver) -> ProfileData:
+    """Extract the header fields of the profile page currently loaded in ``driver``."""
+
+    probe = _probe_profile(driver)
+    fields: Dict[str, str] = {}
+    for name in _PROFILE_FIELDS:
+        value = probe.get(name)
+        fields[name] = value if value is not None else _fallback_field(driver, name)
 
     return ProfileData(
-        display_name=display_name,
-        handle=handle_value,
-        bio=bio,
-        followers_count=followers_count,
-        following_count=following_count,
-        followers_list=followers_list,
-        following_list=following_list,
+        display_name=fields["display_name"],
+        handle=fields["handle"],
+        bio=fields["bio"],
+        followers_count=fields["followers_count"],
+        following_count=fields["following_count"],
+        pinned_post_id=probe.get("pinned_post_id"),
     )
+
+
+def _collect_lists(driver, handle_value: str) -> tuple[List[str], List[str]]:
+    driver.get(f"https://twitter.com/{handle_value}/followers")
+    random_delay(0.8, 1.4, label="profile_fetch")
+    followers_list, _ = social.collect_handles_from_modal(driver)
+
+    driver.get(f"https://twitter.com/{handle_value}/following")
+    random_delay(0.8, 1.4, label="profile_fetch")
+    following_list, _ = social.collect_handles_from_modal(driver)
+    return followers_list, following_list
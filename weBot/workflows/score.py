@@ -0,0 +1,86 @@
+"""Offline scoring of harvested post corpora across a process pool."""
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+try:  # Optional dependency for vectorised features
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+from ..brains.scoring import get_scorer
+
+# Fields carried from the input record to each result row.
+_ID_FIELDS = ("status_id", "username", "link")
+
+
+def score_texts(texts: List[str]) -> Tuple[List[float], List[float], List[int]]:
+    """Return ``(scores, sentiments, lengths)`` for lower-cased post texts.
+
+    Uses the same formula and sentiment cache as ``calculate_post_score``;
+    length and score arithmetic is vectorised when NumPy is installed.
+    """
+
+    sentiments = get_scorer().compound_batch(texts)
+    if np is not None:
+        lengths_array = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        scores_array = np.asarray(sentiments, dtype=np.float64) * 120 + lengths_array / 6
+        return scores_array.tolist(), sentiments, lengths_array.tolist()
+    lengths = [len(text) for text in texts]
+    return [sentiment * 120 + length / 6 for sentiment, length in zip(sentiments, lengths)], sentiments, lengths
+
+
+def _chunks(records: Iterable[Mapping[str, Any]], size: int) -> Iterator[List[Mapping[str, Any]]]:
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _rows(chunk: List[Mapping[str, Any]], result: Tuple[List[float], List[float], List[int]]) -> List[Dict[str, Any]]:
+    scores, sentiments, lengths = result
+    rows = []
+    for record, score, sentiment, length in zip(chunk, scores, sentiments, lengths):
+        row = {key: record.get(key) for key in _ID_FIELDS if record.get(key) is not None}
+        row.update(score=score, sentiment=sentiment, length=length)
+        rows.append(row)
+    return rows
+
+
+def score_corpus(
+    records: Iterable[Mapping[str, Any]],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 2000,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Score ``records`` chunk by chunk, yielding result rows in input order.
+
+    Only the post texts are sent to the workers, and at most two chunks per
+    worker are in flight, so memory stays flat however large the input is.
+    """
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    chunk_size = max(1, int(chunk_size))
+    chunks = _chunks(records, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield _rows(chunk, score_texts([str(r.get("tweet_text") or "").lower() for r in chunk]))
+        return
+
+    pending: Deque[Tuple[List[Mapping[str, Any]], Future]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunks:
+            texts = [str(record.get("tweet_text") or "").lower() for record in chunk]
+            pending.append((chunk, executor.submit(score_texts, texts)))
+            if len(pending) >= workers * 2:
+                done_chunk, future = pending.popleft()
+                yield _rows(done_chunk, future.result())
+        while pending:
+            done_chunk, future = pending.popleft()
+            yield _rows(done_chunk, future.result())